@@ -1,20 +1,34 @@
 """The Whirlpool Sixth Sense integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
 import os
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_REGION, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_REGION,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.util.ssl import client_context
 
 from .const import DOMAIN
+from .coordinator import OvenCoordinator
 from .whirlpool.appliancesmanager import AppliancesManager
-from homeassistant.helpers import aiohttp_client
 
 from .whirlpool.backendselector import BackendSelector
 from .whirlpool.auth import Auth
+from .whirlpool.connection import ConnectionWarmer, create_session
+from .whirlpool.metrics import Metrics
+from .whirlpool.requesttrace import RequestTracer
+from .whirlpool.tracing import TRACER
 from .whirlpool.types import Brand, Region
 
 LOGGER = logging.getLogger(__name__)
@@ -35,18 +49,63 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     region = Region.EU if region_key == "EU" else Region.US
     brand = Brand.Whirlpool
 
-    session = aiohttp_client.async_get_clientsession(hass)
+    # With debug logging, socket frames, attribute updates and request
+    # phases are kept for diagnostics. Otherwise requests skip the trace hooks
+    tracer = None
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        TRACER.enable()
+        tracer = RequestTracer()
+
+    # Own connector so idle connections to the cloud stay open for commands
+    session = create_session(
+        client_context(), None if tracer is None else [tracer.trace_config()]
+    )
     backend_selector = BackendSelector(brand, region)
-    auth = Auth(backend_selector, email, password, session)
-    await auth.do_auth()
-    
-    manager = AppliancesManager(backend_selector, auth, session)
-    await manager.fetch_appliances()
-    await manager.connect()
+    metrics = Metrics()
+    auth = Auth(backend_selector, email, password, session, metrics=metrics)
+    manager = AppliancesManager(backend_selector, auth, session, metrics=metrics)
+    try:
+        if not await auth.do_auth():
+            raise ConfigEntryNotReady("Authentication failed")
+        if not await manager.fetch_appliances():
+            raise ConfigEntryNotReady("Failed to get appliances")
+        await manager.connect()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+        await manager.disconnect()
+        await session.close()
+        raise ConfigEntryNotReady(f"Cannot reach the Whirlpool cloud: {ex}") from ex
+    except BaseException:
+        await manager.disconnect()
+        await session.close()
+        raise
+
+    coordinators = {oven.said: OvenCoordinator(oven) for oven in manager.ovens}
+
+    async def async_close(event: Event | None = None) -> None:
+        """Stop the cloud connection, on unload or when Home Assistant stops."""
+        if session.closed:
+            return
+        for coordinator in coordinators.values():
+            coordinator.async_shutdown()
+        await manager.disconnect()
+        await session.close()
+
+    entry.async_on_unload(async_close)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_close)
+    )
+    # Cancelled with the entry, the first warm-up does not delay setup
+    warmer = ConnectionWarmer(session, backend_selector.base_url)
+    entry.async_create_background_task(
+        hass, warmer.run(), f"{DOMAIN} connection warmer"
+    )
 
     hass.data[DOMAIN][entry.entry_id] = {
         "manager": manager,
-        "auth": auth
+        "auth": auth,
+        "session": session,
+        "tracer": tracer,
+        "coordinators": coordinators,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -55,7 +114,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    # The connection is closed by the callbacks registered in async_on_unload
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        # The event tracer is shared, it stops with the last entry tracing requests
+        if data["tracer"] is not None and not any(
+            other["tracer"] is not None for other in hass.data[DOMAIN].values()
+        ):
+            TRACER.disable()
+            TRACER.clear()
 
     return unload_ok
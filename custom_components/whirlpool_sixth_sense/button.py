@@ -11,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 # Local import hacking
 from .whirlpool.oven import Oven, Cavity
 from .const import DOMAIN, BRAND
+from .entity import CAVITY_LABELS, CAVITY_NAMES
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,27 +24,31 @@ async def async_setup_entry(
 ) -> None:
     """Set up the button platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    manager = data["manager"]
+    coordinators = data["coordinators"]
 
     entities = []
-    for oven in manager.ovens:
-        for mins in ADJUSTMENTS:
-            entities.append(WhirlpoolTimerButton(oven, mins))
+    for coordinator in coordinators.values():
+        for cavity in coordinator.cavities:
+            for mins in ADJUSTMENTS:
+                entities.append(WhirlpoolTimerButton(coordinator.oven, mins, cavity))
     
     async_add_entities(entities)
 
 class WhirlpoolTimerButton(ButtonEntity):
     """Button to adjust timer duration relatively."""
 
-    def __init__(self, oven: Oven, minutes: int) -> None:
+    def __init__(self, oven: Oven, minutes: int, cavity: Cavity = Cavity.Upper) -> None:
         """Initialize the button."""
         self._oven = oven
         self._minutes = minutes
+        self._cavity = cavity
         sign = "+" if minutes > 0 else ""
         action = "add" if minutes > 0 else "sub"
         action_label = "Add" if minutes > 0 else "Subtract"
-        self._attr_name = f"{oven.name} Timer {abs(minutes)}m {action_label}"
-        self._attr_unique_id = f"{oven.said}_timer_{action}_{abs(minutes)}m"
+        self._attr_name = f"{oven.name} Timer {abs(minutes)}m {action_label}{CAVITY_LABELS[cavity]}"
+        # Upper cavity ids predate multi cavity support
+        cavity_id = "" if cavity == Cavity.Upper else f"_{CAVITY_NAMES[cavity]}"
+        self._attr_unique_id = f"{oven.said}{cavity_id}_timer_{action}_{abs(minutes)}m"
         self._attr_icon = "mdi:timer-plus" if minutes > 0 else "mdi:timer-minus"
 
     @property
@@ -57,6 +62,5 @@ class WhirlpoolTimerButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        current_seconds = self._oven.get_cook_time() or 0
-        new_seconds = max(0, current_seconds + (self._minutes * 60))
-        await self._oven.set_cook_duration(new_seconds)
+        # Presses are accumulated and sent as one command once they stop
+        self._oven.adjust_cook_time(self._minutes * 60, self._cavity)
@@ -1,6 +1,6 @@
 """Platform for climate integration."""
 import logging
-import asyncio
+from functools import partial
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -12,14 +12,16 @@ from homeassistant.components.climate import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, ATTR_TEMPERATURE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, async_get_current_platform
 from homeassistant.helpers import config_validation as cv
 import voluptuous as vol
 
-from .const import DOMAIN, BRAND
+from .const import DOMAIN
+from .coordinator import OvenCoordinator, OvenView
+from .entity import CAVITY_NAMES, WhirlpoolOvenEntity
 # Local import hacking
-from .whirlpool.oven import Oven, CookMode, Cavity, CookOperation, CavityState
+from .whirlpool.oven import CookMode, Cavity, CookOperation, CavityState
 
 LOGGER = logging.getLogger(__name__)
 
@@ -64,12 +66,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the climate platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    manager = data["manager"]
+    coordinators = data["coordinators"]
 
     entities = []
-    for oven in manager.ovens:
-        # Assuming single cavity for simplicity, or we could loop cavities
-        entities.append(WhirlpoolOven(oven, Cavity.Upper, "Upper"))
+    for coordinator in coordinators.values():
+        for cavity in coordinator.cavities:
+            entities.append(WhirlpoolOven(coordinator, cavity, CAVITY_NAMES[cavity]))
     
     async_add_entities(entities)
 
@@ -98,7 +100,7 @@ async def async_setup_entry(
         "async_set_frozen_bake_id",
     )
 
-class WhirlpoolOven(ClimateEntity):
+class WhirlpoolOven(WhirlpoolOvenEntity, ClimateEntity):
     """Representation of a Whirlpool Oven."""
 
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
@@ -116,46 +118,30 @@ class WhirlpoolOven(ClimateEntity):
         PRESET_NONE
     ]
 
-    def __init__(self, oven: Oven, cavity: Cavity, cavity_name: str) -> None:
+    def __init__(self, coordinator: OvenCoordinator, cavity: Cavity, cavity_name: str) -> None:
         """Initialize the oven."""
-        self._oven = oven
-        self._cavity = cavity
+        super().__init__(coordinator, cavity)
+        oven = coordinator.oven
         self._cavity_name = cavity_name
-        self._attr_name = f"{oven.name} Forno" # Renamed
+        self._attr_name = f"{oven.name} Forno{self._cavity_label}" # Renamed
         self._attr_unique_id = f"{oven.said}_{cavity_name}_climate"
         self._last_preset = PRESET_BAKE # Default to Static on first turn on
         self._current_preset_name = PRESET_NONE # Track manual/custom presets locally
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._oven.said)},
-            name=self._oven.name,
-            manufacturer=BRAND,
-            model=self._oven.appliance_info.data_model or "Sixth Sense Appliance",
-        )
-
-    def _register_callback(self):
-        def update():
-            # Try to infer preset from attributes if not tracking
-            # This is hard because multiple attributes map to modes.
-            # Ideally we check the attributes to update _current_preset_name
-            self.schedule_update_ha_state()
-        self._oven.register_attr_callback(update)
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        self._register_callback()
+    def _view_slice(self, view: OvenView):
+        # Preset inference from attributes is hard because multiple attributes
+        # map to modes, so only the state, mode and temperatures are watched
+        cavity = view.cavity(self._cavity)
+        return (cavity.state, cavity.cook_mode, cavity.temp, cavity.target_temp)
 
     @property
     def current_temperature(self) -> float | None:
-        temp = self._oven.get_temp(self._cavity)
+        temp = self.cavity_view.temp
         return temp if temp is not None else 0
 
     @property
     def target_temperature(self) -> float | None:
-        temp = self._oven.get_target_temp(self._cavity)
+        temp = self.cavity_view.target_temp
         # If temp is 0/None (Standby), return default valid temp (e.g. 180) 
         # so the UI control remains usable/visible.
         if temp is None or temp == 0:
@@ -164,8 +150,7 @@ class WhirlpoolOven(ClimateEntity):
 
     @property
     def hvac_mode(self) -> HVACMode | None:
-        state = self._oven.get_cavity_state(self._cavity)
-        if state == CavityState.Standby:
+        if self.cavity_view.state == CavityState.Standby:
              # Force OFF if we just requested it
              return HVACMode.OFF
 
@@ -180,7 +165,7 @@ class WhirlpoolOven(ClimateEntity):
             return PRESET_NONE
         
         # Check Standard Modes
-        mode = self._oven.get_cook_mode(self._cavity)
+        mode = self.cavity_view.cook_mode
         standard_preset = COOK_MODE_TO_PRESET.get(mode)
         
         if standard_preset and standard_preset != PRESET_NONE:
@@ -199,59 +184,54 @@ class WhirlpoolOven(ClimateEntity):
         elif hvac_mode == HVACMode.HEAT:
             # Turn on with last used or default preset
             await self.async_set_preset_mode(self._last_preset)
-        self.async_write_ha_state()
+        self._async_write_if_changed()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         if preset_mode == PRESET_NONE:
              await self._oven.stop_cook(self._cavity)
              self._current_preset_name = PRESET_NONE
-             self.async_write_ha_state()
+             self._async_write_if_changed()
              return
 
         # Capture current time before potential transition
         cook_time = self._oven.get_cook_time(self._cavity)
+        if cook_time == 0:
+             cook_time = None
 
-        # If switching from one running mode to another, stop first to be safe
-        state = self._oven.get_cavity_state(self._cavity)
-        transition = False
-        if state != CavityState.Standby and self.preset_mode != preset_mode:
-             transition = True
-             # Preserve timer by not resetting it in stop_cook
-             await self._oven.stop_cook(self._cavity, reset_timer=False)
-             await asyncio.sleep(0.5)
-             state = CavityState.Standby # Refresh internal state after stop
+        # Same preset while running: modify in place, no transition needed
+        same_preset = self.cavity_view.active and self.preset_mode == preset_mode
 
-        self._last_preset = preset_mode
-        self._current_preset_name = preset_mode
         current_temp = self.target_temperature or 180
-        
-        # Determine operation
-        op = CookOperation.Modify if state in [CavityState.Cooking, CavityState.Preheating] else CookOperation.Start
-
-        if cook_time == 0:
-             cook_time = None
 
         # Handle Standard Modes
         cook_mode = PRESET_TO_COOK_MODE.get(preset_mode)
         if cook_mode:
-            await self._oven.set_cook(mode=cook_mode, target_temp=current_temp, cavity=self._cavity, cook_time=cook_time, operation_type=op)
+            start = partial(self._oven.set_cook, mode=cook_mode, target_temp=current_temp, cavity=self._cavity, cook_time=cook_time)
         elif preset_mode == PRESET_FROZEN_BAKE:
-            await self._oven.set_frozen_bake(temp=current_temp, cavity=self._cavity, cook_time=cook_time)
+            start = partial(self._oven.set_frozen_bake, temp=current_temp, cavity=self._cavity, cook_time=cook_time)
         elif preset_mode == PRESET_COOK_4:
-            await self._oven.set_cook_4(temp=current_temp, cavity=self._cavity, cook_time=cook_time)
+            start = partial(self._oven.set_cook_4, temp=current_temp, cavity=self._cavity, cook_time=cook_time)
         elif preset_mode == PRESET_PIZZA:
-            await self._oven.set_culinary_cycle(cycle_id=454, temp=current_temp, cavity=self._cavity, cook_time=cook_time)
+            start = partial(self._oven.set_culinary_cycle, cycle_id=454, temp=current_temp, cavity=self._cavity, cook_time=cook_time)
         elif preset_mode == PRESET_BREAD:
-            await self._oven.set_culinary_cycle(cycle_id=459, temp=current_temp, cavity=self._cavity, cook_time=cook_time)
-        
-        # Delayed restoration if it was a transition and we had a timer
-        if transition and cook_time and cook_time > 0:
-            async def restore_timer():
-                await asyncio.sleep(2.5)
-                await self._oven.set_cook_duration(cook_time, self._cavity)
-            asyncio.create_task(restore_timer())
+            start = partial(self._oven.set_culinary_cycle, cycle_id=459, temp=current_temp, cavity=self._cavity, cook_time=cook_time)
+        else:
+            raise HomeAssistantError(f"{self.name}: unknown preset {preset_mode}")
+
+        if same_preset and cook_mode:
+            ok = await start(operation_type=CookOperation.Modify)
+        else:
+            # Stops the running cook, starts the new one and restores the timer,
+            # each step confirmed by the appliance instead of fixed delays
+            ok = await self._oven.transition_cook(start, mode=cook_mode, cavity=self._cavity, cook_time=cook_time)
+
+        if not ok:
+            raise HomeAssistantError(f"{self.name}: {preset_mode} not confirmed by the oven")
 
-        self.async_write_ha_state()
+        # Only a preset the oven confirmed is shown and reused by turning on
+        self._last_preset = preset_mode
+        self._current_preset_name = preset_mode
+        self._async_write_if_changed()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         temp = kwargs.get(ATTR_TEMPERATURE)
@@ -263,8 +243,7 @@ class WhirlpoolOven(ClimateEntity):
              preset = self._last_preset
              
         # Determine operation
-        state = self._oven.get_cavity_state(self._cavity)
-        op = CookOperation.Modify if state in [CavityState.Cooking, CavityState.Preheating] else CookOperation.Start
+        op = CookOperation.Modify if self.cavity_view.active else CookOperation.Start
         
         cook_time = self._oven.get_cook_time(self._cavity)
         if cook_time == 0:
@@ -287,24 +266,26 @@ class WhirlpoolOven(ClimateEntity):
         elif preset == PRESET_BREAD:
             await self._oven.set_culinary_cycle(cycle_id=459, temp=temp, cavity=self._cavity, cook_time=cook_time)
             
-        self.async_write_ha_state()
+        self._async_write_if_changed()
 
     async def async_set_sixth_sense_mode(self, id: int, temp: float | None = None, **kwargs: Any) -> None:
         """Set a custom 6th Sense mode by ID with optional parameters."""
-        if self.hvac_mode != HVACMode.OFF:
-             await self._oven.stop_cook(self._cavity)
-             
         target_temp = temp or self.target_temperature or 180
-        await self._oven.set_culinary_cycle(cycle_id=id, temp=target_temp, cavity=self._cavity, **kwargs)
+        if not await self._oven.transition_cook(
+            partial(self._oven.set_culinary_cycle, cycle_id=id, temp=target_temp, cavity=self._cavity, **kwargs),
+            cavity=self._cavity,
+        ):
+            raise HomeAssistantError(f"{self.name}: 6th Sense {id} not confirmed by the oven")
         self._current_preset_name = f"6th Sense {id}"
-        self.async_write_ha_state()
+        self._async_write_if_changed()
 
     async def async_set_frozen_bake_id(self, id: int, temp: float | None = None) -> None:
         """Set a custom Frozen Bake mode by ID."""
-        if self.hvac_mode != HVACMode.OFF:
-             await self._oven.stop_cook(self._cavity)
-
         target_temp = temp or self.target_temperature or 180
-        await self._oven.set_frozen_bake(temp=target_temp, food_type=id, cavity=self._cavity)
+        if not await self._oven.transition_cook(
+            partial(self._oven.set_frozen_bake, temp=target_temp, food_type=id, cavity=self._cavity),
+            cavity=self._cavity,
+        ):
+            raise HomeAssistantError(f"{self.name}: Frozen/Custom {id} not confirmed by the oven")
         self._current_preset_name = f"Frozen/Custom {id}"
-        self.async_write_ha_state()
+        self._async_write_if_changed()
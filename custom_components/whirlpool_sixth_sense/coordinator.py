@@ -0,0 +1,187 @@
+"""Push-based coordinator for Whirlpool ovens."""
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+# Local import hacking
+from .whirlpool.oven import Oven, Cavity, CavityState, CookMode, KitchenTimerState, Scope
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CavityView:
+    """Derived state of one oven cavity."""
+
+    state: CavityState | None
+    cook_mode: CookMode | None
+    temp: float | None
+    target_temp: float | None
+    cook_time: int
+    cook_time_state: int
+    light: bool | None
+    # Estimated completion as UNIX timestamps
+    cook_end: float | None
+    preheat_eta: float | None
+    meat_probe_eta: float | None
+
+    @property
+    def active(self) -> bool:
+        return self.state in (CavityState.Cooking, CavityState.Preheating)
+
+
+@dataclass(frozen=True, slots=True)
+class KitchenTimerView:
+    """Derived state of one kitchen timer."""
+
+    timer_id: int
+    state: KitchenTimerState | None
+    remaining: int | None
+    total: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class OvenView:
+    """Derived state of a whole oven, indexed by cavity."""
+
+    cavities: tuple[CavityView | None, ...]
+    kitchen_timers: tuple[KitchenTimerView, ...]
+    control_locked: bool | None
+
+    def cavity(self, cavity: Cavity) -> CavityView | None:
+        return self.cavities[cavity.value]
+
+    def kitchen_timer(self, timer_id: int) -> KitchenTimerView | None:
+        for timer in self.kitchen_timers:
+            if timer.timer_id == timer_id:
+                return timer
+        return None
+
+
+def _int_or_none(value: str | None) -> int | None:
+    return None if value is None else int(value)
+
+
+class OvenCoordinator:
+    """Compute the oven view once per update and notify the entities it concerns.
+
+    Updates are routed by the oven per cavity, kitchen timer or appliance
+    wide scope, so only that part of the view is recomputed and only the
+    listeners of that scope are considered. Each listener registers with a
+    slice function picking the part of the view it renders and is only called
+    when that slice changed.
+    """
+
+    def __init__(self, oven: Oven) -> None:
+        self.oven = oven
+        # The upper cavity is always there, the lower one only on double ovens
+        self.cavities = tuple(
+            cavity
+            for cavity in Cavity
+            if cavity == Cavity.Upper or oven.get_oven_cavity_exists(cavity)
+        )
+        self.kitchen_timers = tuple(oven.get_kitchen_timer_ids())
+        self._listeners: dict[Scope, dict[CALLBACK_TYPE, Callable[[OvenView], Any]]] = {}
+        # State writes of the entities by unique id, and those skipped as unchanged
+        self.state_writes: Counter[str] = Counter()
+        self.state_writes_avoided: Counter[str] = Counter()
+        self.view = OvenView(
+            cavities=tuple(
+                self._compute_cavity(cavity) if cavity in self.cavities else None
+                for cavity in Cavity
+            ),
+            kitchen_timers=tuple(
+                self._compute_kitchen_timer(timer_id) for timer_id in self.kitchen_timers
+            ),
+            control_locked=oven.get_control_locked(),
+        )
+
+        self._unregister_oven: list[CALLBACK_TYPE] = [
+            oven.register_scoped_callback(scope, partial(self._handle_oven_update, scope))
+            for scope in (*self.cavities, *self.kitchen_timers, None)
+        ]
+
+    def _compute_cavity(self, cavity: Cavity) -> CavityView:
+        oven = self.oven
+        return CavityView(
+            state=oven.get_cavity_state(cavity),
+            cook_mode=oven.get_cook_mode(cavity),
+            temp=oven.get_temp(cavity),
+            target_temp=oven.get_target_temp(cavity),
+            cook_time=oven.get_cook_time(cavity),
+            cook_time_state=oven.get_cook_time_state(cavity),
+            light=oven.get_light(cavity),
+            cook_end=oven.get_cook_end(cavity),
+            preheat_eta=oven.get_preheat_eta(cavity),
+            meat_probe_eta=oven.get_meat_probe_eta(cavity),
+        )
+
+    def _compute_kitchen_timer(self, timer_id: int) -> KitchenTimerView:
+        timer = self.oven.get_kitchen_timer(timer_id)
+        return KitchenTimerView(
+            timer_id=timer_id,
+            state=timer.get_state(),
+            remaining=_int_or_none(timer.get_remaining_time()),
+            total=_int_or_none(timer.get_total_time()),
+        )
+
+    def _update_view(self, view: OvenView, scope: Scope) -> OvenView:
+        if scope is None:
+            return replace(view, control_locked=self.oven.get_control_locked())
+        if isinstance(scope, Cavity):
+            cavities = list(view.cavities)
+            cavities[scope.value] = self._compute_cavity(scope)
+            return replace(view, cavities=tuple(cavities))
+        return replace(
+            view,
+            kitchen_timers=tuple(
+                self._compute_kitchen_timer(scope) if timer.timer_id == scope else timer
+                for timer in view.kitchen_timers
+            ),
+        )
+
+    @callback
+    def async_add_listener(
+        self,
+        update_callback: CALLBACK_TYPE,
+        view_slice: Callable[[OvenView], Any],
+        scope: Scope = Cavity.Upper,
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of `view_slice(view)` caused by `scope` updates.
+
+        Returns a function removing the listener.
+        """
+        listeners = self._listeners.setdefault(scope, {})
+        listeners[update_callback] = view_slice
+
+        @callback
+        def remove_listener() -> None:
+            listeners.pop(update_callback, None)
+
+        return remove_listener
+
+    @callback
+    def _handle_oven_update(self, scope: Scope) -> None:
+        old = self.view
+        new = self._update_view(old, scope)
+        if old == new:
+            return
+        self.view = new
+        for update_callback, view_slice in list(self._listeners.get(scope, {}).items()):
+            if view_slice(old) != view_slice(new):
+                update_callback()
+
+    @callback
+    def async_shutdown(self) -> None:
+        while self._unregister_oven:
+            self._unregister_oven.pop()()
+        self._listeners.clear()
+        # A timer adjustment still being sent would outlive the entry
+        self.oven.cancel_cook_time_requests()
@@ -0,0 +1,58 @@
+"""Diagnostics support for Whirlpool Sixth Sense."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .whirlpool.tracing import TRACER
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, "title", "unique_id"}
+# Frame and reply payloads may carry account data
+TRACE_TO_REDACT = {"data", "reply"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    manager = data["manager"]
+    # Only traced with debug logging enabled at setup
+    tracer = data["tracer"]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "metrics": manager.metrics.as_dict(),
+        "request_traces": None
+        if tracer is None
+        else {
+            "summary": tracer.summary(),
+            "recent": [trace.as_dict() for trace in tracer.query()[-50:]],
+        },
+        "trace_events": {
+            "enabled": TRACER.enabled,
+            "events": async_redact_data(TRACER.events(), TRACE_TO_REDACT),
+        },
+        "state_writes": {
+            said: {
+                "written": sum(coordinator.state_writes.values()),
+                "avoided": sum(coordinator.state_writes_avoided.values()),
+                "avoided_by_entity": dict(coordinator.state_writes_avoided),
+            }
+            for said, coordinator in data["coordinators"].items()
+        },
+        "appliances": [
+            {
+                "said": appliance.said,
+                "data_model": appliance.appliance_info.data_model,
+                "category": appliance.appliance_info.category,
+                "online": appliance.get_online(),
+            }
+            for appliance in manager.all_appliances.values()
+        ],
+    }
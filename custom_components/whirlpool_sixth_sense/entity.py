@@ -0,0 +1,87 @@
+"""Base entity for Whirlpool ovens."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo, Entity
+
+from .const import DOMAIN, BRAND
+from .coordinator import CavityView, OvenCoordinator, OvenView
+# Local import hacking
+from .whirlpool.oven import Cavity, Scope
+
+CAVITY_NAMES = {Cavity.Upper: "Upper", Cavity.Lower: "Lower"}
+# Appended to entity names, the upper cavity keeps the historical names
+CAVITY_LABELS = {Cavity.Upper: "", Cavity.Lower: " Inferiore"}
+
+
+class WhirlpoolOvenEntity(Entity):
+    """Entity updated by an oven coordinator when its slice of the view changes."""
+
+    _attr_should_poll = False
+    _last_written: tuple | None = None
+
+    def __init__(self, coordinator: OvenCoordinator, cavity: Cavity = Cavity.Upper) -> None:
+        """Initialize the entity."""
+        self.coordinator = coordinator
+        self._oven = coordinator.oven
+        self._cavity = cavity
+        self._cavity_label = CAVITY_LABELS[cavity]
+        # Updates of other cavities or kitchen timers never reach the entity
+        self._scope: Scope = cavity
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._oven.said)},
+            name=self._oven.name,
+            manufacturer=BRAND,
+            model=self._oven.appliance_info.data_model or "Sixth Sense Appliance",
+        )
+
+    @property
+    def cavity_view(self) -> CavityView:
+        return self.coordinator.view.cavity(self._cavity)
+
+    def _view_slice(self, view: OvenView) -> Any:
+        """Part of the view this entity renders."""
+        return view.cavity(self._cavity)
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, self._view_slice, self._scope
+            )
+        )
+
+    def _written_state(self) -> tuple:
+        """What a state write would publish."""
+        return (
+            self.available,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+            self.icon,
+        )
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write the state unless it is the one this entity last wrote.
+
+        A changed view slice can still render the same state, e.g. a light
+        going from unknown to off, so the published values are compared.
+        """
+        written = self._written_state()
+        if written == self._last_written:
+            self.coordinator.state_writes_avoided[self.unique_id] += 1
+            return
+        self._last_written = written
+        self.coordinator.state_writes[self.unique_id] += 1
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_write_if_changed()
@@ -3,12 +3,13 @@ import logging
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 # Local import hacking
-from .whirlpool.oven import Oven, Cavity, CavityState
-from .const import DOMAIN, BRAND
+from .whirlpool.oven import Cavity
+from .const import DOMAIN
+from .coordinator import OvenCoordinator, OvenView
+from .entity import CAVITY_NAMES, WhirlpoolOvenEntity
 
 LOGGER = logging.getLogger(__name__)
 
@@ -19,17 +20,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up the number platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    manager = data["manager"]
+    coordinators = data["coordinators"]
 
     entities = []
-    for oven in manager.ovens:
-        entities.append(WhirlpoolOvenTimerNumber(oven, Cavity.Upper, "Upper"))
+    for coordinator in coordinators.values():
+        for cavity in coordinator.cavities:
+            entities.append(WhirlpoolOvenTimerNumber(coordinator, cavity, CAVITY_NAMES[cavity]))
     
     async_add_entities(entities)
 
-import asyncio
-
-class WhirlpoolOvenTimerNumber(NumberEntity):
+class WhirlpoolOvenTimerNumber(WhirlpoolOvenEntity, NumberEntity):
     """Representation of an Oven Timer Number entity with duration formatting."""
     _attr_icon = "mdi:timer"
     _attr_device_class = "duration"
@@ -39,62 +39,31 @@ class WhirlpoolOvenTimerNumber(NumberEntity):
     _attr_native_step = 1
     _attr_mode = "box"
 
-    def __init__(self, oven: Oven, cavity: Cavity, cavity_name: str) -> None:
+    def __init__(self, coordinator: OvenCoordinator, cavity: Cavity, cavity_name: str) -> None:
         """Initialize the number entity."""
-        self._oven = oven
-        self._cavity = cavity
-        self._attr_name = f"{oven.name} Timer"
+        super().__init__(coordinator, cavity)
+        oven = coordinator.oven
+        self._attr_name = f"{oven.name} Timer{self._cavity_label}"
         self._attr_unique_id = f"{oven.said}_{cavity_name}_timer"
-        self._debounce_task = None
-        self._local_value = None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._oven.said)},
-            name=self._oven.name,
-            manufacturer=BRAND,
-            model=self._oven.appliance_info.data_model,
-        )
 
-    def _register_callback(self):
-        def update():
-            # If we aren't currently debouncing, update from server
-            if self._debounce_task is None:
-                self._local_value = None
-                self.schedule_update_ha_state()
-        self._oven.register_attr_callback(update)
+    def _view_slice(self, view: OvenView):
+        return view.cavity(self._cavity).cook_time
 
     async def async_added_to_hass(self) -> None:
-        self._register_callback()
+        await super().async_added_to_hass()
+        # Counts down between socket frames, the shared ticker only runs while cooking
+        self.async_on_remove(
+            self._oven.get_countdown(self._cavity).subscribe(self._async_write_if_changed)
+        )
 
     @property
     def native_value(self) -> float | None:
         """Return the current value in seconds."""
-        if self._local_value is not None:
-             return self._local_value
-             
+        # Read live, the view only changes with oven updates. Includes a
+        # pending adjustment from this or the timer buttons.
         seconds = self._oven.get_cook_time(self._cavity)
         return seconds if seconds is not None else 0
 
     async def async_set_native_value(self, value: float) -> None:
-        """Set the timer duration with debounce."""
-        self._local_value = value
-        self.async_write_ha_state()
-
-        if self._debounce_task:
-            self._debounce_task.cancel()
-
-        self._debounce_task = asyncio.create_task(self._async_debounced_set(value))
-
-    async def _async_debounced_set(self, value: float) -> None:
-        """Internal method to call the API after a delay."""
-        try:
-            await asyncio.sleep(4.0)  # Increased debounce to 4 seconds as requested
-            await self._oven.set_cook_duration(int(value))
-        except asyncio.CancelledError:
-            pass
-        finally:
-            self._debounce_task = None
-            self._local_value = None
-            self.async_write_ha_state()
+        """Set the timer duration, sent by the oven once input settles."""
+        self._oven.request_cook_time(int(value), self._cavity)
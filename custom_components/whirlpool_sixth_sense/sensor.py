@@ -1,13 +1,22 @@
 """Platform for sensor integration."""
 import logging
-from homeassistant.components.sensor import SensorEntity
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 # Local import hacking
-from .whirlpool.oven import Oven, Cavity, CavityState
+from .whirlpool.metrics import Histogram, Metrics
+from .whirlpool.oven import Oven, Cavity, CavityState, KitchenTimerState
 from .const import DOMAIN, BRAND
+from .coordinator import OvenCoordinator, OvenView
+from .entity import CAVITY_NAMES, WhirlpoolOvenEntity
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +33,36 @@ CAVITY_STATE_TO_HA = {
     CavityState.NotPresent: STATE_NOT_PRESENT
 }
 
+KITCHEN_TIMER_STATE_TO_HA = {
+    KitchenTimerState.Standby: "Attesa",
+    KitchenTimerState.Running: "In corso",
+    KitchenTimerState.Completed: "Completato",
+}
+
+def _p50_ms(histogram: Histogram) -> float | None:
+    value = histogram.quantile(0.5)
+    return None if value is None else round(value * 1000, 1)
+
+# view field, name, icon
+ETA_SENSORS = [
+    ("cook_end", "Fine cottura prevista", "mdi:timer"),
+    ("preheat_eta", "Fine preriscaldamento", "mdi:thermometer-chevron-up"),
+    ("meat_probe_eta", "Sonda pronta", "mdi:thermometer-probe"),
+]
+
+# key, name, unit, value function
+METRIC_SENSORS: list[tuple[str, str, str | None, Callable[[Metrics], float | int | None]]] = [
+    ("socket_message_rate", "Socket messages rate", "msg/s", lambda m: round(m.socket_messages.rate(), 2)),
+    ("socket_reconnects", "Socket reconnects", None, lambda m: sum(m.reconnects.values())),
+    ("command_rtt", "Command round trip", UnitOfTime.MILLISECONDS, lambda m: _p50_ms(m.command_rtt)),
+    ("fetch_latency", "Fetch latency", UnitOfTime.MILLISECONDS, lambda m: _p50_ms(m.fetch_latency)),
+    ("auth_refreshes", "Auth refreshes", None, lambda m: m.auth_refreshes),
+    ("callback_dispatch", "Callback dispatch time", UnitOfTime.MILLISECONDS, lambda m: _p50_ms(m.callback_dispatch)),
+    ("transition_latency", "Cook transition time", UnitOfTime.MILLISECONDS, lambda m: _p50_ms(m.transition_latency)),
+    ("rate_limit_queue", "Rate limiter queue", None, lambda m: m.rate_limit_queue),
+    ("rate_limit_wait", "Rate limiter wait", UnitOfTime.MILLISECONDS, lambda m: _p50_ms(m.rate_limit_wait)),
+]
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -32,105 +71,203 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     data = hass.data[DOMAIN][entry.entry_id]
     manager = data["manager"]
+    coordinators = data["coordinators"]
 
+    registry = er.async_get(hass)
     entities = []
-    for oven in manager.ovens:
-        entities.append(WhirlpoolOvenStateSensor(oven, Cavity.Upper, "Upper"))
-        # Restored the read-only timer sensor in hh:mm:ss format as requested
-        entities.append(WhirlpoolOvenTimerSensor(oven, Cavity.Upper, "Upper"))
-        entities.append(WhirlpoolOvenCookTimeStatusSensor(oven, Cavity.Upper, "Upper"))
+    for coordinator in coordinators.values():
+        for cavity in coordinator.cavities:
+            cavity_name = CAVITY_NAMES[cavity]
+            # The hh:mm:ss timer sensor was replaced by the cook end sensor
+            if entity_id := registry.async_get_entity_id(
+                "sensor", DOMAIN, f"{coordinator.oven.said}_{cavity_name}_timer_display"
+            ):
+                registry.async_remove(entity_id)
+            entities.append(WhirlpoolOvenStateSensor(coordinator, cavity, cavity_name))
+            entities.append(WhirlpoolOvenCookTimeStatusSensor(coordinator, cavity, cavity_name))
+            for field, name, icon in ETA_SENSORS:
+                entities.append(
+                    WhirlpoolOvenEtaSensor(coordinator, cavity, cavity_name, field, name, icon)
+                )
+        for timer_id in coordinator.kitchen_timers:
+            entities.append(WhirlpoolKitchenTimerSensor(coordinator, timer_id))
+        entities.append(WhirlpoolLastEventSensor(coordinator.oven, manager.metrics))
+
+    for key, name, unit, value_fn in METRIC_SENSORS:
+        entities.append(WhirlpoolMetricSensor(entry, manager.metrics, key, name, unit, value_fn))
     
     async_add_entities(entities)
 
-class WhirlpoolOvenStateSensor(SensorEntity):
+class WhirlpoolOvenStateSensor(WhirlpoolOvenEntity, SensorEntity):
     """Representation of an Oven State Sensor."""
 
-    def __init__(self, oven: Oven, cavity: Cavity, cavity_name: str) -> None:
+    def __init__(self, coordinator: OvenCoordinator, cavity: Cavity, cavity_name: str) -> None:
         """Initialize the sensor."""
-        self._oven = oven
-        self._cavity = cavity
-        self._attr_name = f"{oven.name} Forno Stato"
+        super().__init__(coordinator, cavity)
+        oven = coordinator.oven
+        self._attr_name = f"{oven.name} Forno Stato{self._cavity_label}"
         self._attr_unique_id = f"{oven.said}_{cavity_name}_state"
 
+    def _view_slice(self, view: OvenView):
+        return view.cavity(self._cavity).state
+
     @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._oven.said)},
-            name=self._oven.name,
-            manufacturer=BRAND,
-            model=self._oven.appliance_info.data_model,
-        )
+    def native_value(self):
+        state = self.cavity_view.state
+        return CAVITY_STATE_TO_HA.get(state, "Unknown")
+
+class WhirlpoolOvenCookTimeStatusSensor(WhirlpoolOvenEntity, SensorEntity):
+    """Sensor for cooking cycle completion status."""
+    _attr_icon = "mdi:progress-check"
 
-    def _register_callback(self):
-        def update():
-            self.schedule_update_ha_state()
-        self._oven.register_attr_callback(update)
+    def __init__(self, coordinator: OvenCoordinator, cavity: Cavity, cavity_name: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, cavity)
+        oven = coordinator.oven
+        self._attr_name = f"{oven.name} Fine cottura{self._cavity_label}"
+        self._attr_unique_id = f"{oven.said}_{cavity_name}_cook_time_status"
 
-    async def async_added_to_hass(self) -> None:
-        self._register_callback()
+    def _view_slice(self, view: OvenView):
+        return view.cavity(self._cavity).cook_time_state
 
     @property
     def native_value(self):
-        state = self._oven.get_cavity_state(self._cavity)
-        return CAVITY_STATE_TO_HA.get(state, "Unknown")
+        state = self.cavity_view.cook_time_state
+        if state == 3:
+            return "Completato"
+        if state == 1:
+            return "In corso"
+        return "Attesa"
+
+class WhirlpoolOvenEtaSensor(WhirlpoolOvenEntity, SensorEntity):
+    """Predicted end of the cook, of preheating or of the meat probe cook.
 
-class WhirlpoolOvenTimerSensor(SensorEntity):
-    """Representation of an Oven Timer Sensor (hh:mm:ss)."""
-    _attr_icon = "mdi:timer"
+    The frontend counts down to a timestamp itself, so the state only
+    changes when the prediction moves.
+    """
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
 
-    def __init__(self, oven: Oven, cavity: Cavity, cavity_name: str) -> None:
+    def __init__(
+        self,
+        coordinator: OvenCoordinator,
+        cavity: Cavity,
+        cavity_name: str,
+        field: str,
+        name: str,
+        icon: str,
+    ) -> None:
         """Initialize the sensor."""
-        self._oven = oven
-        self._cavity = cavity
-        self._attr_name = f"{oven.name} Forno Timer Display"
-        self._attr_unique_id = f"{oven.said}_{cavity_name}_timer_display"
+        super().__init__(coordinator, cavity)
+        oven = coordinator.oven
+        self._field = field
+        self._attr_icon = icon
+        self._attr_name = f"{oven.name} Forno {name}{self._cavity_label}"
+        self._attr_unique_id = f"{oven.said}_{cavity_name}_{field}"
+
+    def _view_slice(self, view: OvenView):
+        # Only significant moves are published, so this rarely changes
+        return getattr(view.cavity(self._cavity), self._field)
+
+    @property
+    def native_value(self):
+        timestamp = getattr(self.cavity_view, self._field)
+        if timestamp is None:
+            return None
+        return datetime.fromtimestamp(timestamp, timezone.utc)
+
+class WhirlpoolKitchenTimerSensor(WhirlpoolOvenEntity, SensorEntity):
+    """Remaining time of an oven kitchen timer."""
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator: OvenCoordinator, timer_id: int) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._timer_id = timer_id
+        self._scope = timer_id
+        oven = coordinator.oven
+        self._attr_name = f"{oven.name} Timer cucina {timer_id}"
+        self._attr_unique_id = f"{oven.said}_kitchen_timer_{timer_id}"
+
+    def _view_slice(self, view: OvenView):
+        return view.kitchen_timer(self._timer_id)
+
+    @property
+    def native_value(self):
+        timer = self.coordinator.view.kitchen_timer(self._timer_id)
+        return timer.remaining if timer else None
+
+    @property
+    def extra_state_attributes(self):
+        timer = self.coordinator.view.kitchen_timer(self._timer_id)
+        if timer is None:
+            return None
+        return {
+            "state": KITCHEN_TIMER_STATE_TO_HA.get(timer.state, "Unknown"),
+            "total_time": timer.total,
+        }
+
+class WhirlpoolMetricSensor(SensorEntity):
+    """Diagnostic sensor exposing a client library metric for the account."""
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:chart-line"
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        metrics: Metrics,
+        key: str,
+        name: str,
+        unit: str | None,
+        value_fn: Callable[[Metrics], float | int | None],
+    ) -> None:
+        """Initialize the sensor."""
+        self._entry = entry
+        self._metrics = metrics
+        self._key = key
+        self._value_fn = value_fn
+        self._attr_name = f"Whirlpool {name}"
+        self._attr_unique_id = f"{entry.entry_id}_metric_{key}"
+        self._attr_native_unit_of_measurement = unit
 
     @property
     def device_info(self) -> DeviceInfo:
         return DeviceInfo(
-            identifiers={(DOMAIN, self._oven.said)},
-            name=self._oven.name,
+            identifiers={(DOMAIN, self._entry.entry_id)},
+            name="Whirlpool Cloud",
             manufacturer=BRAND,
-            model=self._oven.appliance_info.data_model,
+            entry_type=DeviceEntryType.SERVICE,
         )
 
-    def _register_callback(self):
-        def update():
-            self.schedule_update_ha_state()
-        self._oven.register_attr_callback(update)
-
-    async def async_added_to_hass(self) -> None:
-        self._register_callback()
-
     @property
     def native_value(self):
-        # The Oven class now handles the local countdown logic inside get_cook_time
-        seconds = self._oven.get_cook_time(self._cavity)
-        if seconds is None or seconds == 0:
-            return "00:00:00"
-        
-        m, s = divmod(seconds, 60)
-        h, m = divmod(m, 60)
-        return f"{h:02d}:{m:02d}:{s:02d}"
+        return self._value_fn(self._metrics)
 
     @property
-    def should_poll(self) -> bool:
-        # Poll every second to provide smooth countdown in HA
-        state = self._oven.get_cavity_state(self._cavity)
-        if state in [CavityState.Cooking, CavityState.Preheating]:
-             return True
-        return False
-
-class WhirlpoolOvenCookTimeStatusSensor(SensorEntity):
-    """Sensor for cooking cycle completion status."""
-    _attr_icon = "mdi:progress-check"
+    def extra_state_attributes(self):
+        if self._key == "socket_reconnects":
+            return {
+                "causes": dict(self._metrics.reconnects),
+                "last_cause": self._metrics.last_reconnect_cause,
+            }
+        return None
 
-    def __init__(self, oven: Oven, cavity: Cavity, cavity_name: str) -> None:
+class WhirlpoolLastEventSensor(SensorEntity):
+    """Diagnostic sensor with the time since the last socket event."""
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(self, oven: Oven, metrics: Metrics) -> None:
         """Initialize the sensor."""
         self._oven = oven
-        self._cavity = cavity
-        self._attr_name = f"{oven.name} Fine cottura"
-        self._attr_unique_id = f"{oven.said}_{cavity_name}_cook_time_status"
+        self._metrics = metrics
+        self._attr_name = f"{oven.name} Last event"
+        self._attr_unique_id = f"{oven.said}_last_event_age"
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -141,19 +278,7 @@ class WhirlpoolOvenCookTimeStatusSensor(SensorEntity):
             model=self._oven.appliance_info.data_model,
         )
 
-    def _register_callback(self):
-        def update():
-            self.schedule_update_ha_state()
-        self._oven.register_attr_callback(update)
-
-    async def async_added_to_hass(self) -> None:
-        self._register_callback()
-
     @property
     def native_value(self):
-        state = self._oven.get_cook_time_state(self._cavity)
-        if state == 3:
-            return "Completato"
-        if state == 1:
-            return "In corso"
-        return "Attesa"
+        age = self._metrics.time_since_last_event(self._oven.said)
+        return None if age is None else round(age)
@@ -5,12 +5,13 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 # Local import hacking
-from .whirlpool.oven import Oven, Cavity
-from .const import DOMAIN, BRAND
+from .whirlpool.oven import Cavity
+from .const import DOMAIN
+from .coordinator import OvenCoordinator, OvenView
+from .entity import CAVITY_NAMES, WhirlpoolOvenEntity
 
 LOGGER = logging.getLogger(__name__)
 
@@ -21,48 +22,35 @@ async def async_setup_entry(
 ) -> None:
     """Set up the switch platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    manager = data["manager"]
+    coordinators = data["coordinators"]
 
     entities = []
-    for oven in manager.ovens:
-        entities.append(WhirlpoolOvenLight(oven, Cavity.Upper, "Upper"))
+    for coordinator in coordinators.values():
+        for cavity in coordinator.cavities:
+            entities.append(WhirlpoolOvenLight(coordinator, cavity, CAVITY_NAMES[cavity]))
         # Control Lock is usually global for the appliance
-        entities.append(WhirlpoolControlLock(oven))
+        entities.append(WhirlpoolControlLock(coordinator))
     
     async_add_entities(entities)
 
-class WhirlpoolOvenLight(SwitchEntity):
+class WhirlpoolOvenLight(WhirlpoolOvenEntity, SwitchEntity):
     """Representation of an Oven Light."""
 
-    def __init__(self, oven: Oven, cavity: Cavity, cavity_name: str) -> None:
+    def __init__(self, coordinator: OvenCoordinator, cavity: Cavity, cavity_name: str) -> None:
         """Initialize the switch."""
-        self._oven = oven
-        self._cavity = cavity
-        self._attr_name = f"{oven.name} Luce" # Renamed from "Light"
+        super().__init__(coordinator, cavity)
+        oven = coordinator.oven
+        self._attr_name = f"{oven.name} Luce{self._cavity_label}" # Renamed from "Light"
         self._attr_unique_id = f"{oven.said}_{cavity_name}_light"
         self._attr_icon = "mdi:lightbulb"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._oven.said)},
-            name=self._oven.name,
-            manufacturer=BRAND,
-            model=self._oven.appliance_info.data_model,
-        )
-
-    def _register_callback(self):
-        def update():
-            self.schedule_update_ha_state()
-        self._oven.register_attr_callback(update)
-
-    async def async_added_to_hass(self) -> None:
-        self._register_callback()
+    def _view_slice(self, view: OvenView):
+        return view.cavity(self._cavity).light
 
     @property
     def is_on(self) -> bool | None:
         # Default to False if None to avoid "lightning bolts" assumed state
-        return bool(self._oven.get_light(self._cavity))
+        return bool(self.cavity_view.light)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         await self._oven.set_light(True, self._cavity)
@@ -70,37 +58,25 @@ class WhirlpoolOvenLight(SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         await self._oven.set_light(False, self._cavity)
 
-class WhirlpoolControlLock(SwitchEntity):
+class WhirlpoolControlLock(WhirlpoolOvenEntity, SwitchEntity):
     """Representation of Control Lock."""
 
-    def __init__(self, oven: Oven) -> None:
+    def __init__(self, coordinator: OvenCoordinator) -> None:
         """Initialize the switch."""
-        self._oven = oven
+        super().__init__(coordinator)
+        self._scope = None
+        oven = coordinator.oven
         # Renamed from "Control Lock"
         self._attr_name = f"{oven.name} Blocco tasti" 
         self._attr_unique_id = f"{oven.said}_control_lock"
         self._attr_icon = "mdi:lock"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._oven.said)},
-            name=self._oven.name,
-            manufacturer=BRAND,
-            model=self._oven.appliance_info.data_model,
-        )
-
-    def _register_callback(self):
-        def update():
-            self.schedule_update_ha_state()
-        self._oven.register_attr_callback(update)
-
-    async def async_added_to_hass(self) -> None:
-        self._register_callback()
+    def _view_slice(self, view: OvenView):
+        return view.control_locked
 
     @property
     def is_on(self) -> bool | None:
-        return self._oven.get_control_locked()
+        return self.coordinator.view.control_locked
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         await self._oven.set_control_locked(True)
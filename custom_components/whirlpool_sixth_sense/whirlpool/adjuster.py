@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+import aiohttp
+
+LOGGER = logging.getLogger(__name__)
+
+# Seconds without input before the target is sent
+QUIET_MIN = 1.0
+QUIET_MAX = 4.0
+# Growth of the quiet period for every input arriving within it
+QUIET_GROWTH = 1.5
+
+
+class CookTimeAdjuster:
+    """Coalesce cook time changes of one cavity into a single command
+
+    Absolute sets and relative deltas are applied to a local target at once,
+    so a burst of inputs always builds on the latest value instead of a stale
+    read. The target is sent after a quiet period which grows while inputs
+    keep coming, up to `QUIET_MAX`, and shrinks back once sent.
+    """
+
+    def __init__(
+        self,
+        current: Callable[[], int],
+        send: Callable[[int], Awaitable[bool]],
+        on_change: Callable[[], None],
+    ):
+        self._current = current
+        self._send = send
+        self._on_change = on_change
+        self.target: int | None = None
+        self.quiet = QUIET_MIN
+        self._last_input = 0.0
+        self._handle: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task | None = None
+
+    def set(self, seconds: int):
+        self._apply(max(0, seconds))
+
+    def add(self, delta: int):
+        base = self.target if self.target is not None else self._current()
+        self._apply(max(0, base + delta))
+
+    def _apply(self, seconds: int):
+        now = time.monotonic()
+        if self.target is not None and now - self._last_input < self.quiet:
+            self.quiet = min(QUIET_MAX, self.quiet * QUIET_GROWTH)
+        self._last_input = now
+        self.target = seconds
+        self._on_change()
+
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = asyncio.get_running_loop().call_later(
+            self.quiet, self._start_flush
+        )
+
+    def _start_flush(self):
+        self._handle = None
+        self._task = asyncio.get_running_loop().create_task(self.flush())
+
+    async def flush(self) -> bool:
+        """Send the pending target now"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        seconds = self.target
+        if seconds is None:
+            return True
+        self.quiet = QUIET_MIN
+        ok = False
+        try:
+            ok = await self._send(seconds)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            LOGGER.warning("Sending cook time %s failed: %s", seconds, ex)
+        else:
+            if not ok:
+                LOGGER.warning("Sending cook time %s failed", seconds)
+        finally:
+            # Cleared even on failure, the reported cook time is shown again.
+            # Newer input arrived while sending, it has its own flush scheduled
+            if self.target == seconds:
+                self.target = None
+                self._on_change()
+        return ok
+
+    def cancel(self):
+        """Drop the pending target without sending it, or stop sending it"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        task, self._task = self._task, None
+        if (
+            task is not None
+            and not task.done()
+            and task is not asyncio.current_task()
+        ):
+            task.cancel()
+        if self.target is not None:
+            self.target = None
+            self._on_change()
@@ -1,7 +1,8 @@
 import logging
+from dataclasses import dataclass
 from enum import Enum
 
-from .appliance import Appliance
+from .appliance import ATTR_ONLINE, Appliance, ApplianceSnapshot, AttributeReader
 
 LOGGER = logging.getLogger(__name__)
 
@@ -77,6 +78,35 @@ FANSPEED_MAP = {
     FanSpeed.High: SETVAL_FAN_SPEED_HIGH,
 }
 
+FANSPEED_BY_VALUE = {v: k for k, v in FANSPEED_MAP.items()}
+
+# Reported modes, the sixth sense variants report the mode they run in
+MODE_STATUS_MAP = {
+    ATTRVAL_MODE_COOL: Mode.Cool,
+    ATTRVAL_MODE_SIXTH_SENSE_COOL: Mode.Cool,
+    ATTRVAL_MODE_HEAT: Mode.Heat,
+    ATTRVAL_MODE_SIXTH_SENSE_HEAT: Mode.Heat,
+    ATTRVAL_MODE_FAN: Mode.Fan,
+    ATTRVAL_MODE_SIXTH_SENSE_AIR: Mode.Fan,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class AirconSnapshot(ApplianceSnapshot):
+    current_temp: float | None
+    current_humidity: int | None
+    power_on: bool | None
+    temp: float | None
+    humidity: int | None
+    mode: Mode | None
+    sixthsense_mode: bool
+    fanspeed: FanSpeed | None
+    h_louver_swing: bool | None
+    turbo_mode: bool | None
+    eco_mode: bool | None
+    quiet_mode: bool | None
+    display_on: bool
+
 
 class Aircon(Appliance):
     def get_current_temp(self) -> float | None:
@@ -86,9 +116,33 @@ class Aircon(Appliance):
     def get_current_humidity(self) -> int | None:
         return self._get_int_attribute(ATTR_DISPLAY_HUMID)
 
+    def _build_snapshot(self, reader: AttributeReader) -> AirconSnapshot:
+        raw_temp = reader.as_int(ATTR_DISPLAY_TEMP)
+        set_temp = reader.as_int(SETTING_TEMP)
+        return AirconSnapshot(
+            online=reader.as_bool(ATTR_ONLINE),
+            current_temp=raw_temp / 10 if raw_temp is not None else None,
+            current_humidity=reader.as_int(ATTR_DISPLAY_HUMID),
+            power_on=reader.as_bool(SETTING_POWER),
+            temp=set_temp / 10 if set_temp is not None else None,
+            humidity=reader.as_int(SETTING_HUMIDITY),
+            mode=reader.lookup(ATTR_MODE, MODE_STATUS_MAP),
+            sixthsense_mode=reader.raw(SETTING_MODE) == SETVAL_MODE_SIXTH_SENSE,
+            fanspeed=reader.lookup(SETTING_FAN_SPEED, FANSPEED_BY_VALUE),
+            h_louver_swing=reader.as_bool(SETTING_HORZ_LOUVER_SWING),
+            turbo_mode=reader.as_bool(SETTING_TURBO_MODE),
+            eco_mode=reader.as_bool(SETTING_ECO_MODE),
+            quiet_mode=reader.as_bool(SETTING_QUIET_MODE),
+            display_on=reader.raw(SETTING_DISPLAY_BRIGHTNESS)
+            == SETVAL_DISPLAY_BRIGHTNESS_ON,
+        )
+
     def get_power_on(self) -> bool | None:
         return self.attr_value_to_bool(self._get_attribute(SETTING_POWER))
 
+    def is_active(self) -> bool:
+        return bool(self.get_power_on())
+
     async def set_power_on(self, on: bool) -> bool:
         return await self.send_attributes({SETTING_POWER: self.bool_to_attr_value(on)})
 
@@ -107,14 +161,7 @@ class Aircon(Appliance):
         return await self.send_attributes({SETTING_HUMIDITY: str(temp)})
 
     def get_mode(self) -> Mode | None:
-        mode_raw = self._get_attribute(ATTR_MODE)
-        if mode_raw in [ATTRVAL_MODE_COOL, ATTRVAL_MODE_SIXTH_SENSE_COOL]:
-            return Mode.Cool
-        if mode_raw in [ATTRVAL_MODE_HEAT, ATTRVAL_MODE_SIXTH_SENSE_HEAT]:
-            return Mode.Heat
-        if mode_raw in [ATTRVAL_MODE_FAN, ATTRVAL_MODE_SIXTH_SENSE_AIR]:
-            return Mode.Fan
-        return None
+        return MODE_STATUS_MAP.get(self._get_attribute(ATTR_MODE))
 
     def get_sixthsense_mode(self) -> bool:
         return self._get_attribute(SETTING_MODE) == SETVAL_MODE_SIXTH_SENSE
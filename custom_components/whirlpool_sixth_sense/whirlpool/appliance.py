@@ -1,6 +1,9 @@
+import asyncio
 import json
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
@@ -8,18 +11,83 @@ import async_timeout
 
 from .auth import Auth
 from .backendselector import BackendSelector
+from .callbacks import CallbackRegistry
+from .history import AttributeHistory
+from .metrics import Metrics
+from .ratelimit import Priority
+from .recorder import Recorder, RecordKind
+from .tracing import TRACER, payload
 from .types import ApplianceInfo
 
 LOGGER = logging.getLogger(__name__)
 
 REQUEST_RETRY_COUNT = 3
+# Seconds to wait for the appliance to report the values of a command
+CONFIRM_TIMEOUT = 10
 
 ATTR_ONLINE = "Online"
+# Command attributes, acted on by the appliance but never reported back
+WRITE_ONLY_ATTRIBUTE_POSTFIX = "SetOperations"
 
 SETVAL_VALUE_OFF = "0"
 SETVAL_VALUE_ON = "1"
 
 
+class _AttributeWaiter:
+    """Pending wait for a set of attribute values"""
+
+    __slots__ = ("expected", "pending", "future")
+
+    def __init__(self, expected: dict[str, tuple[str, ...]], future: asyncio.Future):
+        self.expected = expected
+        # Attributes not reporting an expected value yet
+        self.pending: set[str] = set()
+        self.future = future
+
+
+class AttributeReader:
+    """Decode attribute values from one data dictionary
+
+    Used to build snapshots in one pass, missing attributes are None and
+    nothing is logged.
+    """
+
+    __slots__ = ("_attributes",)
+
+    def __init__(self, data_dict: dict):
+        self._attributes: dict[str, dict] = data_dict.get("attributes", {})
+
+    def raw(self, attribute: str) -> str | None:
+        entry = self._attributes.get(attribute)
+        return None if entry is None else entry["value"]
+
+    def as_bool(self, attribute: str) -> bool | None:
+        value = self.raw(attribute)
+        return None if value is None else value == SETVAL_VALUE_ON
+
+    def as_int(self, attribute: str) -> int | None:
+        value = self.raw(attribute)
+        return None if value is None else int(value)
+
+    def as_tenths(self, attribute: str) -> float | None:
+        """Values reported in tenths, e.g. temperatures, 0 means not reported"""
+        value = self.raw(attribute)
+        if value is None:
+            return None
+        tenths = int(value)
+        return tenths / 10 if tenths else None
+
+    def lookup(self, attribute: str, mapping: Mapping[str, Any]) -> Any:
+        return mapping.get(self.raw(attribute))
+
+
+@dataclass(frozen=True, slots=True)
+class ApplianceSnapshot:
+    """Decoded appliance state at one point in time"""
+
+    online: bool | None
+
+
 class Appliance:
     """Whirlpool appliance class"""
 
@@ -29,12 +97,19 @@ class Appliance:
         auth: Auth,
         session: aiohttp.ClientSession,
         appliance_info: ApplianceInfo,
+        recorder: Recorder | None = None,
+        metrics: Metrics | None = None,
     ):
         self._backend_selector = backend_selector
         self._auth = auth
         self._session = session
+        self._recorder = recorder
+        self._metrics = metrics if metrics is not None else Metrics()
 
-        self._attr_changed: list[Callable] = []
+        self._attr_changed = CallbackRegistry()
+        self._attr_waiters: dict[str, list[_AttributeWaiter]] = {}
+        self._history: AttributeHistory | None = None
+        self._snapshot: ApplianceSnapshot | None = None
         self._data_dict: dict = {}
         self.appliance_info = appliance_info
 
@@ -57,78 +132,264 @@ class Appliance:
             LOGGER.error("Session not started")
             return False
         uri = self._backend_selector.get_appliance_data_url(self.said)
-        for _ in range(REQUEST_RETRY_COUNT):
+        for attempt in range(REQUEST_RETRY_COUNT):
+            if attempt:
+                self._metrics.request_retries += 1
+            await self._auth.limiter.acquire()
+            start = time.monotonic()
             async with async_timeout.timeout(30):
                 async with self._session.get(
                     uri, headers=self._auth.create_headers()
                 ) as r:
+                    if self._recorder is not None:
+                        self._recorder.record_rest(
+                            RecordKind.FetchData, self.said, r.status, await r.text()
+                        )
+                    if TRACER.enabled:
+                        TRACER.event("fetch", said=self.said, status=r.status)
                     if r.status == 200:
                         self._data_dict = json.loads(await r.text())
-                        for callback in self._attr_changed:
-                            callback()
+                        if self._history is not None:
+                            self._record_history()
+                        self._metrics.fetch_latency.observe(time.monotonic() - start)
+                        self._notify_attr_changed()
                         return True
                     elif r.status == 401:
                         LOGGER.error(
                             "Fetching data failed (%s). Doing reauth", r.status
                         )
+                        self._metrics.unauthorized += 1
                         await self._auth.do_auth()
+                    elif r.status == 429:
+                        self._auth.limiter.backoff(r.headers.get("Retry-After"))
                     else:
                         LOGGER.error("Fetching data failed (%s)", r.status)
         return False
 
-    async def send_attributes(self, attributes: dict[str, str]) -> bool:
-        """Send attributes to appliance api"""
+    async def send_attributes(
+        self,
+        attributes: dict[str, str],
+        confirm: bool | dict[str, str | tuple[str, ...]] = False,
+        confirm_timeout: float = CONFIRM_TIMEOUT,
+    ) -> bool:
+        """Send attributes to appliance api
+
+        With `confirm`, also wait until the appliance reports the sent values,
+        or the given expected ones, and record the round trip. `confirm=True`
+        waits only for the sent attributes the appliance reports, commands
+        like `OpSetOperations` are never echoed back.
+        """
+        expected = self._confirmable(attributes) if confirm is True else confirm
+        if not expected:
+            return await self._post_attributes(attributes)
+
+        # Registered before sending so an early confirmation is not missed
+        waiter = self._add_waiter(expected)
+        start = time.monotonic()
+        try:
+            if not await self._post_attributes(attributes):
+                return False
+            if not await self._await_waiter(waiter, confirm_timeout):
+                LOGGER.warning("Attributes not confirmed by the appliance")
+                return False
+        finally:
+            self._remove_waiter(waiter)
+        self._metrics.confirmation_rtt(self.said).observe(time.monotonic() - start)
+        return True
+
+    def _confirmable(self, attributes: dict[str, str]) -> dict[str, str]:
+        """Sent attributes the appliance reports once applied"""
+        return {
+            attr: value
+            for attr, value in attributes.items()
+            if not attr.endswith(WRITE_ONLY_ATTRIBUTE_POSTFIX)
+            and self.has_attribute(attr)
+        }
+
+    async def _post_attributes(self, attributes: dict[str, str]) -> bool:
         if not self._session:
             LOGGER.error("Session not started")
             return False
 
-        LOGGER.info(f"Sending attributes: {attributes}")
+        if TRACER.enabled:
+            TRACER.event("command", said=self.said, attributes=attributes)
+        LOGGER.info("Sending attributes: %s", attributes)
 
         cmd_data = {
             "body": attributes,
             "header": {"said": self.said, "command": "setAttributes"},
         }
-        for _ in range(REQUEST_RETRY_COUNT):
+        for attempt in range(REQUEST_RETRY_COUNT):
+            if attempt:
+                self._metrics.request_retries += 1
+            await self._auth.limiter.acquire(Priority.Command)
+            start = time.monotonic()
             async with async_timeout.timeout(30):
                 async with self._session.post(
                     self._backend_selector.appliance_command_url,
                     json=cmd_data,
                     headers=self._auth.create_headers(),
                 ) as r:
-                    LOGGER.debug(f"Reply: {await r.text()}")
+                    if TRACER.enabled:
+                        TRACER.event(
+                            "command_reply",
+                            said=self.said,
+                            status=r.status,
+                            reply=payload(await r.text()),
+                        )
+                    # The reply is only read to be logged
+                    if LOGGER.isEnabledFor(logging.DEBUG):
+                        LOGGER.debug("Reply: %s", await r.text())
+                    if self._recorder is not None:
+                        self._recorder.record_rest(
+                            RecordKind.SendAttributes,
+                            self.said,
+                            r.status,
+                            json.dumps(attributes),
+                        )
                     if r.status == 200:
+                        self._metrics.command_rtt.observe(time.monotonic() - start)
                         return True
                     elif r.status == 401:
+                        self._metrics.unauthorized += 1
                         await self._auth.do_auth()
                         continue
-                    LOGGER.error(f"Sending attributes failed ({r.status})")
+                    elif r.status == 429:
+                        self._auth.limiter.backoff(r.headers.get("Retry-After"))
+                        continue
+                    LOGGER.error("Sending attributes failed (%s)", r.status)
         return False
 
-    def register_attr_callback(self, update_callback: Callable):
-        """Register Callback function."""
-        self._attr_changed.append(update_callback)
+    @property
+    def history(self) -> AttributeHistory | None:
+        return self._history
+
+    def enable_history(self, history: AttributeHistory | None = None) -> AttributeHistory:
+        """Keep recent attribute values, see `AttributeHistory`"""
+        if history is None:
+            history = AttributeHistory()
+        self._history = history
+        self._record_history()
+        return history
+
+    def _record_history(self):
+        for attr, entry in self._data_dict.get("attributes", {}).items():
+            self._history.record(attr, entry.get("value"), entry.get("updateTime", 0))
+
+    def register_attr_callback(self, update_callback: Callable) -> Callable[[], None]:
+        """Register Callback function, returns a function unregistering it."""
         LOGGER.debug("Registered attr callback")
+        return self._attr_changed.add(update_callback)
 
     def unregister_attr_callback(self, update_callback: Callable):
         """Unregister callback function."""
-        try:
-            self._attr_changed.remove(update_callback)
+        if self._attr_changed.discard(update_callback):
             LOGGER.debug("Unregistered attr callback")
-        except ValueError:
+        else:
             LOGGER.error("Attr callback not found")
 
     def update_attributes(self, attrs: dict[str, Any], timestamp: int):
+        changed = []
         for attr, val in attrs.items():
             if self.has_attribute(attr):
                 self._set_attribute(attr, str(val), timestamp)
+                changed.append(attr)
+                if self._history is not None:
+                    self._history.record(attr, str(val), timestamp)
+
+        self._notify_attr_changed(changed)
+
+    def _notify_attr_changed(self, changed: list[str] | None = None):
+        """Run the attribute callbacks
 
+        `changed` lists the updated attributes, None means all of them.
+        """
+        self._snapshot = None
+        start = time.perf_counter()
+        self._dispatch_attr_changed(changed)
+        self._metrics.callback_dispatch.observe(time.perf_counter() - start)
+        if self._attr_waiters:
+            self._resolve_waiters(changed)
+
+    def _dispatch_attr_changed(self, changed: list[str] | None):
         for callback in self._attr_changed:
             callback()
 
+    async def wait_for_attributes(
+        self, expected: dict[str, str | tuple[str, ...]], timeout: float
+    ) -> bool:
+        """Wait until the appliance reports the expected attribute values
+
+        Each value is either the expected string or a tuple of accepted ones.
+        Returns False if they were not all reported within `timeout` seconds.
+        """
+        waiter = self._add_waiter(expected)
+        try:
+            return await self._await_waiter(waiter, timeout)
+        finally:
+            self._remove_waiter(waiter)
+
+    def _add_waiter(self, expected: dict[str, str | tuple[str, ...]]) -> _AttributeWaiter:
+        waiter = _AttributeWaiter(
+            {
+                attr: (value,) if isinstance(value, str) else tuple(value)
+                for attr, value in expected.items()
+            },
+            asyncio.get_running_loop().create_future(),
+        )
+        for attr, values in waiter.expected.items():
+            if self._get_attribute(attr) not in values:
+                waiter.pending.add(attr)
+            self._attr_waiters.setdefault(attr, []).append(waiter)
+        if not waiter.pending:
+            waiter.future.set_result(True)
+        return waiter
+
+    def _remove_waiter(self, waiter: _AttributeWaiter):
+        for attr in waiter.expected:
+            waiters = self._attr_waiters[attr]
+            waiters.remove(waiter)
+            if not waiters:
+                del self._attr_waiters[attr]
+
+    async def _await_waiter(self, waiter: _AttributeWaiter, timeout: float) -> bool:
+        try:
+            async with async_timeout.timeout(timeout):
+                return await waiter.future
+        except asyncio.TimeoutError:
+            return False
+
+    def _resolve_waiters(self, changed: list[str] | None):
+        # Only the waiters indexed by an updated attribute are checked
+        for attr in list(self._attr_waiters) if changed is None else changed:
+            waiters = self._attr_waiters.get(attr)
+            if not waiters:
+                continue
+            value = self._get_attribute(attr)
+            for waiter in waiters:
+                if value in waiter.expected[attr]:
+                    waiter.pending.discard(attr)
+                else:
+                    waiter.pending.add(attr)
+                if not waiter.pending and not waiter.future.done():
+                    waiter.future.set_result(True)
+
     def _set_attribute(self, attribute: str, value: str, timestamp: int):
-        LOGGER.debug(f"Updating attribute {attribute} with {value} ({timestamp})")
-        self._data_dict["attributes"][attribute]["value"] = value
-        self._data_dict["attributes"][attribute]["updateTime"] = timestamp
+        if TRACER.enabled:
+            TRACER.event(
+                "attribute",
+                said=self.said,
+                attribute=attribute,
+                value=value,
+                timestamp=timestamp,
+            )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Updating attribute %s with %s (%s)", attribute, value, timestamp
+            )
+        entry = self._data_dict["attributes"][attribute]
+        entry["value"] = value
+        entry["updateTime"] = timestamp
 
     def _get_attribute(self, attribute: str) -> str | None:
         """Get attribute from local data dictionary"""
@@ -156,6 +417,22 @@ class Appliance:
         """Convert attribute value to bool"""
         return None if val is None else val == SETVAL_VALUE_ON
 
+    def is_active(self) -> bool:
+        """Whether the appliance is running, e.g. cooking or washing"""
+        return False
+
+    def snapshot(self) -> ApplianceSnapshot | None:
+        """All known fields decoded at once, cached until attributes change
+
+        None until data has been fetched.
+        """
+        if self._snapshot is None and self._data_dict:
+            self._snapshot = self._build_snapshot(AttributeReader(self._data_dict))
+        return self._snapshot
+
+    def _build_snapshot(self, reader: AttributeReader) -> ApplianceSnapshot:
+        return ApplianceSnapshot(online=reader.as_bool(ATTR_ONLINE))
+
     def get_online(self) -> bool | None:
         """Get online state for appliance"""
         return self.attr_value_to_bool(self._get_attribute(ATTR_ONLINE))
@@ -1,36 +1,55 @@
+from __future__ import annotations
+
+import importlib
 import json
 import logging
 from functools import cached_property
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
-from whirlpool.eventsocket import EventSocket
-
-from .aircon import Aircon
 from .appliance import Appliance
 from .auth import Auth
 from .backendselector import BackendSelector
-from .dryer import Dryer
-from .oven import Oven
-from .refrigerator import Refrigerator
+from .eventsocket import EventSocket
+from .metrics import Metrics
+from .poller import FallbackPoller
+from .recorder import Recorder
 from .types import ApplianceInfo
-from .washer import Washer
+
+if TYPE_CHECKING:
+    from .aircon import Aircon
+    from .dryer import Dryer
+    from .oven import Oven
+    from .refrigerator import Refrigerator
+    from .washer import Washer
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _appliance_class(module: str, name: str) -> type[Appliance]:
+    """Import an appliance class when the inventory first contains one"""
+    return getattr(importlib.import_module(f".{module}", __package__), name)
+
+
 class AppliancesManager:
     def __init__(
         self,
         backend_selector: BackendSelector,
         auth: Auth,
         session: aiohttp.ClientSession,
+        recorder: Recorder | None = None,
+        metrics: Metrics | None = None,
     ):
         self._backend_selector = backend_selector
         self._auth = auth
         self._session: aiohttp.ClientSession = session
+        self._recorder = recorder
+        self._metrics = metrics if metrics is not None else Metrics()
         self._event_socket: EventSocket | None = None
+        self._poller = FallbackPoller(
+            lambda: self.all_appliances.values(), self._metrics
+        )
         self._aircons: dict[str, Any] = {}
         self._dryers: dict[str, Any] = {}
         self._washers: dict[str, Any] = {}
@@ -47,6 +66,10 @@ class AppliancesManager:
             **self._refrigerators,
         }
 
+    @property
+    def metrics(self) -> Metrics:
+        return self._metrics
+
     @property
     def aircons(self) -> list[Aircon]:
         return list(self._aircons.values())
@@ -91,37 +114,39 @@ class AppliancesManager:
 
         LOGGER.debug("Adding appliance %s", appliance_data)
         if "airconditioner" in data_model:
-            self._aircons[appliance_data.said] = Aircon(
-                self._backend_selector, self._auth, self._session, appliance_data
-            )
+            appliances, module, name = self._aircons, "aircon", "Aircon"
         elif "dryer" in data_model:
-            self._dryers[appliance_data.said] = Dryer(
-                self._backend_selector, self._auth, self._session, appliance_data
-            )
+            appliances, module, name = self._dryers, "dryer", "Dryer"
         elif "washer" in data_model:
-            self._washers[appliance_data.said] = Washer(
-                self._backend_selector, self._auth, self._session, appliance_data
-            )
+            appliances, module, name = self._washers, "washer", "Washer"
         elif any(model in data_model for model in oven_models):
-            self._ovens[appliance_data.said] = Oven(
-                self._backend_selector, self._auth, self._session, appliance_data
-            )
+            appliances, module, name = self._ovens, "oven", "Oven"
         elif "ddm_ted_refrigerator_v12" in data_model:
-            self._refrigerators[appliance_data.said] = Refrigerator(
-                self._backend_selector, self._auth, self._session, appliance_data
-            )
+            appliances, module, name = self._refrigerators, "refrigerator", "Refrigerator"
         else:
             LOGGER.warning("Unsupported appliance data model %s", data_model)
             return
 
+        appliances[appliance_data.said] = _appliance_class(module, name)(
+            self._backend_selector,
+            self._auth,
+            self._session,
+            appliance_data,
+            self._recorder,
+            self._metrics,
+        )
+
         # Invalidate cached property
         self.__dict__.pop("all_appliances", None)
 
     async def _get_owned_appliances(self, account_id: str) -> bool:
+        await self._auth.limiter.acquire()
         async with self._session.get(
             self._backend_selector.get_owned_appliances_url(account_id),
             headers=self._auth.create_headers(),
         ) as r:
+            if r.status == 429:
+                self._auth.limiter.backoff(r.headers.get("Retry-After"))
             if r.status != 200:
                 LOGGER.error("Failed to get appliances: %s", r.status)
                 return False
@@ -138,9 +163,12 @@ class AppliancesManager:
         headers = self._auth.create_headers()
         headers["WP-CLIENT-BRAND"] = self._backend_selector.brand.name
 
+        await self._auth.limiter.acquire()
         async with self._session.get(
             self._backend_selector.shared_appliances_url, headers=headers
         ) as r:
+            if r.status == 429:
+                self._auth.limiter.backoff(r.headers.get("Retry-After"))
             if r.status != 200:
                 LOGGER.warning(
                     "Failed to get shared appliances: %s. Not all regions/brands"
@@ -171,6 +199,14 @@ class AppliancesManager:
         for appliance in self.all_appliances.values():
             await appliance.fetch_data()
 
+    async def _on_socket_up(self):
+        # Events only cover changes from now on, poll until resynced
+        try:
+            await self.fetch_all_data()
+        finally:
+            # The socket is up, polling stops even if the resync failed
+            await self._poller.stop()
+
     async def connect(self):
         """Connect to appliance event listener"""
         await self.start_event_listener()
@@ -190,18 +226,25 @@ class AppliancesManager:
             self._auth,
             list(self.all_appliances.keys()),
             self._event_socket_callback,
-            self.fetch_all_data,
+            self._on_socket_up,
             self._session,
+            self._recorder,
+            self._metrics,
+            self._poller.start,
         )
         self._event_socket.start()
 
     async def stop_event_listener(self):
         """Stop the appliance event listener"""
+        # Also after a failed connect, which may have started polling
+        await self._poller.stop()
         if self._event_socket is None:
             LOGGER.warning("Event socket is None")
             return
         await self._event_socket.stop()
         self._event_socket = None
+        if self._recorder is not None:
+            self._recorder.flush()
 
     def _event_socket_callback(self, msg: str):
         json_msg = json.loads(msg)
@@ -210,13 +253,17 @@ class AppliancesManager:
         if app is None:
             LOGGER.warning("Received message for unknown appliance %s", said)
             return
+        self._metrics.event_received(said)
         app.update_attributes(json_msg["attributeMap"], json_msg["timestamp"])
 
     async def _getWebsocketUrl(self) -> str:
         DEFAULT_WS_URL = "wss://ws.emeaprod.aws.whrcloud.com/appliance/websocket"
+        await self._auth.limiter.acquire()
         async with self._session.get(
             self._backend_selector.websocket_url, headers=self._auth.create_headers()
         ) as r:
+            if r.status == 429:
+                self._auth.limiter.backoff(r.headers.get("Retry-After"))
             if r.status != 200:
                 LOGGER.error("Failed to get websocket url: %s", r.status)
                 return DEFAULT_WS_URL
@@ -7,6 +7,8 @@ import aiohttp
 import async_timeout
 
 from .backendselector import BackendConfig, BackendSelector
+from .metrics import Metrics
+from .ratelimit import Priority, RateLimiter
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,12 +26,17 @@ class Auth:
         username: str,
         password: str,
         session: aiohttp.ClientSession,
+        metrics: Metrics | None = None,
+        limiter: RateLimiter | None = None,
     ):
         self._backend_selector = backend_selector
         self._username = username
         self._password = password
         self._auth_dict: dict[str, Any] = {}
         self._session: aiohttp.ClientSession = session
+        self._metrics = metrics if metrics is not None else Metrics()
+        # Shared with the manager and appliances using this account
+        self.limiter = limiter if limiter is not None else RateLimiter(metrics=self._metrics)
 
         self._renew_time: datetime | None = None
 
@@ -70,6 +77,8 @@ class Auth:
 
         for client_creds in self._backend_selector.client_credentials:
             auth_data: dict[str, str] = self._get_auth_body(refresh_token, client_creds)
+            # Every other request waits on a valid token
+            await self.limiter.acquire(Priority.Command)
             async with async_timeout.timeout(30):
                 async with self._session.post(
                     auth_url, data=auth_data, headers=auth_header
@@ -79,6 +88,9 @@ class Auth:
                         return await r.json()
                     if r.status == 423:
                         raise AccountLockedError()
+                    if r.status == 429:
+                        self.limiter.backoff(r.headers.get("Retry-After"))
+                        return None
                     elif refresh_token:
                         return await self._do_auth(refresh_token=None)
 
@@ -91,6 +103,7 @@ class Auth:
 
         if not fetched_auth_data:
             self._auth_dict = {}
+            self._metrics.auth_refreshed(False)
             LOGGER.error("Authentication failed")
             return False
 
@@ -104,6 +117,7 @@ class Auth:
         }
         if store:
             self._save_auth_data()
+        self._metrics.auth_refreshed(True)
         return True
 
     async def load_auth_file(self):
@@ -142,11 +156,14 @@ class Auth:
             "Cache-Control": "no-cache",
         }
 
+        await self.limiter.acquire()
         async with self._session.get(
             self._backend_selector.user_details_url, headers=headers
         ) as r:
+            if r.status == 429:
+                self.limiter.backoff(r.headers.get("Retry-After"))
             if r.status != 200:
-                LOGGER.error(f"Failed to get account id: {r.status}")
+                LOGGER.error("Failed to get account id: %s", r.status)
                 return None
             data = await r.json()
             self._auth_dict["accountId"] = data["accountId"]
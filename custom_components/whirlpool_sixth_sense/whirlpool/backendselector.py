@@ -68,9 +68,10 @@ URLS: dict[Region, str] = {
 
 
 class BackendSelector:
-    def __init__(self, brand: Brand, region: Region):
+    def __init__(self, brand: Brand, region: Region, base_url: str | None = None):
         self._brand = brand
         self._region = region
+        self._base_url = base_url.rstrip("/") if base_url else None
 
     @property
     def brand(self) -> Brand:
@@ -82,6 +83,8 @@ class BackendSelector:
 
     @property
     def base_url(self) -> str:
+        if self._base_url:
+            return self._base_url
         return URLS[self._region]
 
     @property
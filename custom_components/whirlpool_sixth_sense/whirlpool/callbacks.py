@@ -0,0 +1,47 @@
+import itertools
+from collections.abc import Callable, Iterator
+
+
+class CallbackRegistry:
+    """Callbacks run in registration order, with O(1) add and remove
+
+    `add` returns a function removing that registration, meant to be handed
+    to the owner's cleanup, e.g. `Entity.async_on_remove`. Calling it more
+    than once is harmless.
+    """
+
+    __slots__ = ("_callbacks", "_keys")
+
+    def __init__(self):
+        self._callbacks: dict[int, Callable] = {}
+        self._keys = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    def __iter__(self) -> Iterator[Callable]:
+        # Snapshot, a callback may remove itself or others while running
+        return iter(tuple(self._callbacks.values()))
+
+    def add(self, callback: Callable) -> Callable[[], None]:
+        key = next(self._keys)
+        self._callbacks[key] = callback
+
+        def remove():
+            self._callbacks.pop(key, None)
+
+        return remove
+
+    def discard(self, callback: Callable) -> bool:
+        """Remove the oldest registration of `callback`, O(n)
+
+        Kept for callers without a handle, returns whether one was found.
+        """
+        for key, registered in self._callbacks.items():
+            if registered == callback:
+                del self._callbacks[key]
+                return True
+        return False
+
+    def clear(self):
+        self._callbacks.clear()
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+import ssl
+from socket import gaierror
+
+import aiohttp
+import async_timeout
+
+LOGGER = logging.getLogger(__name__)
+
+# Idle connections are kept this long, longer than the warm interval
+KEEPALIVE_TIMEOUT = 120
+DNS_CACHE_TTL = 300
+LIMIT_PER_HOST = 8
+# Connections reopened or kept busy every interval
+WARM_CONNECTIONS = 2
+WARM_INTERVAL = 45
+WARM_TIMEOUT = 10
+
+
+def create_session(
+    ssl_context: ssl.SSLContext | bool | None = None,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+) -> aiohttp.ClientSession:
+    """Session with a connector tuned for the few Whirlpool hosts"""
+    connector = aiohttp.TCPConnector(
+        ssl=ssl_context if ssl_context is not None else True,
+        limit_per_host=LIMIT_PER_HOST,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+
+
+class ConnectionWarmer:
+    """Keep idle connections to the API host open
+
+    Commands then reuse an established TLS connection instead of paying DNS,
+    TCP and TLS setup after an idle period. The warm requests go to the host
+    root, not the API, so they are not rate limited.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        connections: int = WARM_CONNECTIONS,
+        interval: float = WARM_INTERVAL,
+    ):
+        self._session = session
+        self._url = url
+        self._connections = connections
+        self._interval = interval
+
+    async def _ping(self):
+        try:
+            async with async_timeout.timeout(WARM_TIMEOUT):
+                async with self._session.head(self._url, allow_redirects=False) as r:
+                    await r.read()
+        except (aiohttp.ClientError, TimeoutError, gaierror) as ex:
+            LOGGER.debug("Warming connection to %s failed: %s", self._url, ex)
+
+    async def warm(self):
+        """Open or refresh the idle connections"""
+        # Concurrent requests cannot share a connection, so each opens its own
+        await asyncio.gather(*(self._ping() for _ in range(self._connections)))
+
+    async def run(self):
+        """Warm now and every interval, until the task is cancelled"""
+        while True:
+            await self.warm()
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SecondTicker:
+    """Single ticker aligned to wall-clock seconds
+
+    Only runs while at least one countdown is active, and is shared by every
+    countdown so all displays change on the same second boundary.
+    """
+
+    def __init__(self):
+        self._active: dict[int, "CookCountdown"] = {}
+        self._handle: asyncio.TimerHandle | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._handle is not None
+
+    def add(self, countdown: "CookCountdown"):
+        self._active[id(countdown)] = countdown
+        if self._handle is None:
+            self._schedule()
+
+    def remove(self, countdown: "CookCountdown"):
+        self._active.pop(id(countdown), None)
+        if not self._active and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            LOGGER.debug("No running loop, ticker not started")
+            return
+        self._handle = loop.call_later(1 - time.time() % 1, self._tick)
+
+    def _tick(self):
+        self._handle = None
+        for countdown in list(self._active.values()):
+            countdown.tick()
+        if self._active:
+            self._schedule()
+
+
+TICKER = SecondTicker()
+
+
+class CookCountdown:
+    """Remaining cook time for one cavity
+
+    Updated from appliance events only. The remaining time is derived from the
+    last server value and the moment it was received, so reading it has no
+    side effects.
+    """
+
+    def __init__(self, ticker: SecondTicker = TICKER):
+        self._ticker = ticker
+        self._listeners: list[Callable[[], None]] = []
+        self.server_seconds = 0
+        self.anchor = 0.0
+        self.running = False
+        # Value shown while the server reports no cook time
+        self.desired_seconds = 0
+        # Set when a cook is stopped without resetting the timer
+        self.preserved = False
+
+    def remaining(self, now: float | None = None) -> int:
+        if self.server_seconds == 0:
+            return self.desired_seconds
+        if not self.running:
+            return self.server_seconds
+        if now is None:
+            now = time.monotonic()
+        return max(0, self.server_seconds - int(now - self.anchor))
+
+    def end_time(self) -> float | None:
+        """UNIX timestamp the countdown reaches zero, None unless running"""
+        if not self.running or self.server_seconds == 0:
+            return None
+        # From the anchor, so repeated calls give the same time
+        return time.time() - (time.monotonic() - self.anchor) + self.server_seconds
+
+    def sync(self, server_seconds: int, cooking: bool, standby: bool):
+        """Update from the latest reported cook time and cavity state"""
+        now = time.monotonic()
+        if server_seconds == 0:
+            if self.running:
+                # Keep showing where the countdown was
+                self.desired_seconds = self.remaining(now)
+            if standby and not self.preserved:
+                self.desired_seconds = 0
+            self.server_seconds = 0
+            self._set_running(False)
+            return
+
+        if server_seconds != self.server_seconds:
+            self.server_seconds = server_seconds
+            self.anchor = now
+        self._set_running(cooking)
+
+    def set_desired(self, seconds: int):
+        """Record a locally requested cook time"""
+        self.desired_seconds = seconds
+        self.server_seconds = seconds
+        self.anchor = time.monotonic()
+
+    def reset(self, preserve: bool = False):
+        self.preserved = preserve
+        if preserve:
+            self.desired_seconds = self.remaining()
+        else:
+            self.desired_seconds = 0
+            self.server_seconds = 0
+            self._set_running(False)
+
+    def subscribe(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call `listener` every second while counting down
+
+        Returns a function that removes the listener.
+        """
+        self._listeners.append(listener)
+        self._update_ticker()
+
+        def unsubscribe():
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            self._update_ticker()
+
+        return unsubscribe
+
+    def tick(self):
+        for listener in list(self._listeners):
+            listener()
+        if self.remaining() == 0:
+            self._ticker.remove(self)
+
+    def _set_running(self, running: bool):
+        self.running = running
+        self._update_ticker()
+
+    def _update_ticker(self):
+        if self.running and self._listeners and self.remaining() > 0:
+            self._ticker.add(self)
+        else:
+            self._ticker.remove(self)
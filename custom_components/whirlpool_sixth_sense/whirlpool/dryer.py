@@ -1,6 +1,7 @@
+from dataclasses import dataclass
 from enum import Enum
 
-from .appliance import Appliance
+from .appliance import ATTR_ONLINE, Appliance, ApplianceSnapshot, AttributeReader
 
 # Machine State
 ATTR_MACHINE_STATE = "Cavity_CycleStatusMachineState"
@@ -223,13 +224,90 @@ WRINKLE_SHIELD_MAP = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class DryerSnapshot(ApplianceSnapshot):
+    machine_state: MachineState | None
+    door_open: bool | None
+    time_remaining: int | None
+    drum_light_on: bool | None
+    extra_power_changeable: bool | None
+    steam_changeable: bool | None
+    cycle_changeable: bool | None
+    dryness_changeable: bool | None
+    manual_dry_time_changeable: bool | None
+    static_guard_changeable: bool | None
+    temperature_changeable: bool | None
+    wrinkle_shield_changeable: bool | None
+    dryness: Dryness | None
+    manual_dry_time: int | None
+    cycle: Cycle | None
+    cycle_status_airflow_status: bool | None
+    cycle_status_cool_down: bool | None
+    cycle_status_damp: bool | None
+    cycle_status_drying: bool | None
+    cycle_status_limited_cycle: bool | None
+    cycle_status_sensing: bool | None
+    cycle_status_static_reduce: bool | None
+    cycle_status_steaming: bool | None
+    cycle_status_wet: bool | None
+    cycle_count: int | None
+    damp_notification_tone_volume: int | None
+    alert_tone_volume: int | None
+    temperature: Temperature | None
+    wrinkle_shield: WrinkleShield | None
+
+
 class Dryer(Appliance):
+    def _build_snapshot(self, reader: AttributeReader) -> DryerSnapshot:
+        return DryerSnapshot(
+            online=reader.as_bool(ATTR_ONLINE),
+            machine_state=reader.lookup(ATTR_MACHINE_STATE, MACHINE_STATE_MAP),
+            door_open=reader.as_bool(ATTR_DOOR_OPEN),
+            time_remaining=reader.as_int(ATTR_TIME_REMAINING),
+            drum_light_on=reader.as_bool(ATTR_DRUM_LIGHT_ON),
+            extra_power_changeable=reader.as_bool(ATTR_EXTRA_POWER_CHANGEABLE),
+            steam_changeable=reader.as_bool(ATTR_STEAM_CHANGEABLE),
+            cycle_changeable=reader.as_bool(ATTR_CYCLE_CHANGEABLE),
+            dryness_changeable=reader.as_bool(ATTR_DRYNESS_CHANGEABLE),
+            manual_dry_time_changeable=reader.as_bool(ATTR_MANUAL_DRY_TIME_CHANGEABLE),
+            static_guard_changeable=reader.as_bool(ATTR_STATIC_GUARD_CHANGEABLE),
+            temperature_changeable=reader.as_bool(ATTR_TEMPERATURE_CHANGEABLE),
+            wrinkle_shield_changeable=reader.as_bool(ATTR_WRINKLE_SHIELD_CHANGEABLE),
+            dryness=reader.lookup(ATTR_DRYNESS, DRYNESS_MAP),
+            manual_dry_time=reader.as_int(ATTR_MANUAL_DRY_TIME),
+            cycle=reader.lookup(ATTR_CYCLE, CYCLE_MAP),
+            cycle_status_airflow_status=reader.as_bool(
+                ATTR_CYCLE_STATUS_AIR_FLOW_STATUS
+            ),
+            cycle_status_cool_down=reader.as_bool(ATTR_CYCLE_STATUS_COOL_DOWN),
+            cycle_status_damp=reader.as_bool(ATTR_CYCLE_STATUS_DAMP),
+            cycle_status_drying=reader.as_bool(ATTR_CYCLE_STATUS_DRYING),
+            cycle_status_limited_cycle=reader.as_bool(ATTR_CYCLE_STATUS_LIMITED_CYCLE),
+            cycle_status_sensing=reader.as_bool(ATTR_CYCLE_STATUS_SENSING),
+            cycle_status_static_reduce=reader.as_bool(ATTR_CYCLE_STATUS_STATIC_REDUCE),
+            cycle_status_steaming=reader.as_bool(ATTR_CYCLE_STATUS_STEAMING),
+            cycle_status_wet=reader.as_bool(ATTR_CYCLE_STATUS_WET),
+            cycle_count=reader.as_int(ATTR_CYCLE_COUNT),
+            damp_notification_tone_volume=reader.as_int(
+                ATTR_DAMP_NOTIFICATION_TONE_VOLUME
+            ),
+            alert_tone_volume=reader.as_int(ATTR_ALERT_TONE_VOLUME),
+            temperature=reader.lookup(ATTR_TEMPERATURE, TEMPERATURE_MAP),
+            wrinkle_shield=reader.lookup(ATTR_WRINKLE_SHIELD, WRINKLE_SHIELD_MAP),
+        )
+
     def get_machine_state(self) -> MachineState | None:
         state_raw = self._get_attribute(ATTR_MACHINE_STATE)
         if state_raw is None:
             return None
         return MACHINE_STATE_MAP.get(state_raw, None)
 
+    def is_active(self) -> bool:
+        return self.get_machine_state() in (
+            MachineState.RunningMainCycle,
+            MachineState.RunningPostCycle,
+        )
+
     def get_door_open(self) -> bool | None:
         return self.attr_value_to_bool(self._get_attribute(ATTR_DOOR_OPEN))
 
@@ -0,0 +1,129 @@
+import time
+from array import array
+
+# Samples kept for the fit, enough to smooth out 1 degree reporting steps
+ETA_WINDOW = 32
+ETA_MIN_SAMPLES = 3
+# The published ETA moves only by more than this, in seconds or as a fraction
+# of the remaining time
+ETA_MIN_SHIFT = 60.0
+ETA_MIN_SHIFT_RATIO = 0.1
+
+
+class RollingRegression:
+    """Least squares line over the last `size` samples
+
+    Samples live in fixed-size arrays used as a ring buffer, and the sums of
+    the fit are updated as samples enter and leave, so adding one is O(1).
+    Times are stored relative to the first sample to keep the sums precise.
+    """
+
+    def __init__(self, size: int = ETA_WINDOW):
+        self._size = size
+        self._x = array("d", bytes(8 * size))
+        self._y = array("d", bytes(8 * size))
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self._next = 0
+        self._origin: float | None = None
+        self._sx = self._sy = self._sxx = self._sxy = 0.0
+
+    def add(self, t: float, value: float):
+        if self._origin is None:
+            self._origin = t
+        x = t - self._origin
+        if self.count == self._size:
+            old_x, old_y = self._x[self._next], self._y[self._next]
+            self._sx -= old_x
+            self._sy -= old_y
+            self._sxx -= old_x * old_x
+            self._sxy -= old_x * old_y
+        else:
+            self.count += 1
+        self._x[self._next] = x
+        self._y[self._next] = value
+        self._next = (self._next + 1) % self._size
+        self._sx += x
+        self._sy += value
+        self._sxx += x * x
+        self._sxy += x * value
+
+    def slope(self) -> float | None:
+        """Change of the value per second, None without enough samples"""
+        if self.count < 2:
+            return None
+        denominator = self.count * self._sxx - self._sx * self._sx
+        if denominator <= 0:
+            return None
+        return (self.count * self._sxy - self._sx * self._sy) / denominator
+
+    def time_to_reach(self, target: float) -> float | None:
+        """Time at which the fitted line reaches `target`"""
+        slope = self.slope()
+        if slope is None or slope <= 0:
+            return None
+        intercept = (self._sy - slope * self._sx) / self.count
+        return self._origin + (target - intercept) / slope
+
+
+class EtaEstimator:
+    """Time a rising temperature reaches its target
+
+    `finish` is the published wall-clock estimate. It only moves when a new
+    estimate differs by more than `ETA_MIN_SHIFT` seconds or
+    `ETA_MIN_SHIFT_RATIO` of the remaining time, so sensors do not change on
+    every sample.
+    """
+
+    def __init__(self, size: int = ETA_WINDOW):
+        self._fit = RollingRegression(size)
+        self._last: float | None = None
+        self.finish: float | None = None
+
+    def reset(self):
+        self._fit.reset()
+        self._last = None
+        self.finish = None
+
+    def add(self, value: float, now: float | None = None) -> bool:
+        """Add a reading, returns False if it repeats the last one
+
+        Full fetches, fallback polls and frames of other attributes report
+        the same reading again, as samples they would flatten the fit.
+        """
+        if value == self._last:
+            return False
+        if now is None:
+            now = time.time()
+        self._fit.add(now, value)
+        self._last = value
+        return True
+
+    def update(self, target: float | None, now: float | None = None) -> bool:
+        """Recompute the estimate, returns whether `finish` changed"""
+        if now is None:
+            now = time.time()
+        estimate = None
+        reached = False
+        if target is not None and self._last is not None:
+            if self._last >= target:
+                estimate = now
+                reached = True
+            elif self._fit.count >= ETA_MIN_SAMPLES:
+                estimate = self._fit.time_to_reach(target)
+                if estimate is not None:
+                    estimate = max(estimate, now)
+
+        if estimate is None or self.finish is None:
+            changed = estimate != self.finish
+        elif reached:
+            # Keep the moment it was reached
+            changed = self.finish > now
+        else:
+            shift = max(ETA_MIN_SHIFT, ETA_MIN_SHIFT_RATIO * (estimate - now))
+            changed = abs(estimate - self.finish) > shift
+        if changed:
+            self.finish = estimate
+        return changed
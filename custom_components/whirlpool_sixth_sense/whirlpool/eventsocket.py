@@ -8,6 +8,16 @@ from socket import gaierror
 import aiohttp
 
 from .auth import Auth
+from .metrics import (
+    RECONNECT_CLOSED,
+    RECONNECT_ERROR,
+    RECONNECT_GOING_AWAY,
+    RECONNECT_TOKEN_INVALID,
+    RECONNECT_UNAUTHORIZED,
+    Metrics,
+)
+from .recorder import Recorder, RecordKind
+from .tracing import TRACER, payload
 
 LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +46,9 @@ class EventSocket:
         msg_listener: Callable[[str], None],
         con_up_listener: Callable,
         session: aiohttp.ClientSession,
+        recorder: Recorder | None = None,
+        metrics: Metrics | None = None,
+        con_down_listener: Callable[[], None] | None = None,
     ):
         self._url = url
         self._auth = auth
@@ -45,8 +58,12 @@ class EventSocket:
         self._websocket: aiohttp.ClientWebSocketResponse | None = None
         self._run_future = None
         self._con_up_listener = con_up_listener
+        self._con_down_listener = con_down_listener
+        self._connected = False
         self._reconnect_tries = RECONNECT_COUNT
         self._session = session
+        self._recorder = recorder
+        self._metrics = metrics if metrics is not None else Metrics()
 
     def _create_connect_msg(self):
         return (
@@ -62,18 +79,39 @@ class EventSocket:
             await self._send_msg(ws, msg)
 
     async def _send_msg(self, websocket: aiohttp.ClientWebSocketResponse, msg):
-        LOGGER.debug(f"> {msg}")
+        if TRACER.enabled:
+            # Only the command, the CONNECT frame carries the access token
+            TRACER.event("socket_send", command=msg.partition("\n")[0])
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("> %s", msg)
         await websocket.send_str(msg + MSG_TERMINATION)
 
     async def _recv_msg(self, websocket: aiohttp.ClientWebSocketResponse):
         msg = await websocket.receive()
-        LOGGER.debug(f"< {msg}")
+        if TRACER.enabled:
+            # ERROR frames carry an exception, CLOSE frames an int
+            TRACER.event("socket_recv", type=msg.type.name, data=payload(msg.data))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("< %s", msg)
+        if self._recorder is not None and msg.type == aiohttp.WSMsgType.TEXT:
+            self._recorder.record(RecordKind.SocketFrame, msg.data)
         return msg
 
+    def _connection_lost(self):
+        """Report the loss once, before any reauth or reconnect delay"""
+        if not self._connected:
+            return
+        self._connected = False
+        self._metrics.socket_state(False)
+        if TRACER.enabled:
+            TRACER.event("socket_down")
+        if self._running and self._con_down_listener is not None:
+            self._con_down_listener()
+
     async def _run(self):
         while self._running:
             try:
-                LOGGER.debug(f"Connecting to {self._url}")
+                LOGGER.debug("Connecting to %s", self._url)
                 async with self._session.ws_connect(
                     self._url,
                     timeout=aiohttp.ClientWSTimeout(ws_receive=60, ws_close=60),  # type: ignore # ClientWSTimeout uses attr.s which pyright does not support
@@ -82,6 +120,10 @@ class EventSocket:
                     heartbeat=45,
                 ) as ws:
                     self._websocket = ws
+                    self._connected = True
+                    self._metrics.socket_state(True)
+                    if TRACER.enabled:
+                        TRACER.event("socket_up")
                     self._reconnect_tries = RECONNECT_COUNT
                     connected_msg_done = False
                     subscribe_msg_done = False
@@ -97,6 +139,7 @@ class EventSocket:
                             continue
                         if msg.type == aiohttp.WSMsgType.ERROR:
                             LOGGER.error("Socket message error")
+                            self._metrics.reconnect(RECONNECT_ERROR)
                             break
                         if msg.type in [
                             aiohttp.WSMsgType.CLOSE,
@@ -104,18 +147,21 @@ class EventSocket:
                             aiohttp.WSMsgType.CLOSED,
                         ]:
                             LOGGER.info(
-                                f"Stopping receiving. Message type: {str(msg.type)}"
+                                "Stopping receiving. Message type: %s", msg.type
                             )
+                            self._connection_lost()
 
                             if (
                                 not self._auth.is_access_token_valid()
                                 or msg.data == WS_STATUS_UNAUTHORIZED
                             ):
                                 LOGGER.debug("auth key expired, doing reauth now")
+                                self._metrics.reconnect(RECONNECT_UNAUTHORIZED)
                                 while not await self._auth.do_auth():
                                     await asyncio.sleep(RECONNECT_LONG_DELAY)
 
                             elif msg.data == WS_STATUS_GOING_AWAY:
+                                self._metrics.reconnect(RECONNECT_GOING_AWAY)
                                 LOGGER.info(
                                     (
                                         "Received Going Away message: Waiting for %s"
@@ -126,6 +172,9 @@ class EventSocket:
                                 # Give server some time to come back up.
                                 await asyncio.sleep(GOING_AWAY_DELAY)
 
+                            else:
+                                self._metrics.reconnect(RECONNECT_CLOSED)
+
                             break
 
                         invalid_token_match = TOKEN_INVALID_MSG_MATCHER.findall(
@@ -133,6 +182,8 @@ class EventSocket:
                         )
                         if invalid_token_match:
                             LOGGER.debug("received invalid token msg, doing reauth now")
+                            self._metrics.reconnect(RECONNECT_TOKEN_INVALID)
+                            self._connection_lost()
                             while not await self._auth.do_auth():
                                 await asyncio.sleep(RECONNECT_LONG_DELAY)
                             break
@@ -147,34 +198,35 @@ class EventSocket:
                             continue
 
                         if msg.type != aiohttp.WSMsgType.TEXT:
-                            LOGGER.error(
-                                f"Socket message type is invalid: {str(msg.type)}"
-                            )
+                            LOGGER.error("Socket message type is invalid: %s", msg.type)
                             continue
 
                         match = DATA_MSG_MATCHER.findall(msg.data)
                         if not match:
                             continue
+                        self._metrics.socket_message()
                         self._msg_listener("{" + match[0] + "}")
             except (aiohttp.ClientError, TimeoutError, gaierror) as ex:
-                LOGGER.error(f"Websocket could not connect: {ex}")
+                LOGGER.error("Websocket could not connect: %s", ex)
+                self._metrics.reconnect(RECONNECT_ERROR)
 
             self._websocket = None
+            self._connection_lost()
 
             if self._running:
                 self._reconnect_tries -= 1
                 if self._reconnect_tries < 0:
                     self._reconnect_tries = 0
                     LOGGER.info(
-                        f"Waiting to reconnect long delay {RECONNECT_LONG_DELAY}"
-                        " seconds"
+                        "Waiting to reconnect long delay %s seconds",
+                        RECONNECT_LONG_DELAY,
                     )
 
                     # Give server some time to come back up.
                     await asyncio.sleep(RECONNECT_LONG_DELAY)
 
                 LOGGER.info(
-                    f"Waiting to reconnect short delay {RECONNECT_SHORT_DELAY} seconds"
+                    "Waiting to reconnect short delay %s seconds", RECONNECT_SHORT_DELAY
                 )
                 await asyncio.sleep(RECONNECT_SHORT_DELAY)
 
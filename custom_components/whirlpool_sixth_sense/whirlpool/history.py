@@ -0,0 +1,191 @@
+from array import array
+from collections.abc import Iterable
+from enum import IntEnum
+from typing import TextIO
+
+# Memory per attribute, split evenly between the resolutions
+HISTORY_BUDGET = 24 * 1024
+# A sample is a double timestamp and a double value
+POINT_BYTES = 16
+
+
+class Resolution(IntEnum):
+    """Seconds per downsampled point, 0 for every sample"""
+
+    Raw = 0
+    TenSeconds = 10
+    Minute = 60
+
+
+class _Ring:
+    """Fixed-capacity time series in typed arrays, oldest points evicted first"""
+
+    __slots__ = ("times", "values", "capacity", "start", "count")
+
+    def __init__(self, capacity: int):
+        self.times = array("d", bytes(8 * capacity))
+        self.values = array("d", bytes(8 * capacity))
+        self.capacity = capacity
+        self.start = 0
+        self.count = 0
+
+    def append(self, t: float, value: float):
+        if self.count == self.capacity:
+            index = self.start
+            self.start = (self.start + 1) % self.capacity
+        else:
+            index = (self.start + self.count) % self.capacity
+            self.count += 1
+        self.times[index] = t
+        self.values[index] = value
+
+    def _bisect(self, t: float) -> int:
+        """First logical position with a time at or after `t`"""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.times[(self.start + mid) % self.capacity] < t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def range(self, start: float | None, end: float | None) -> tuple[array, array]:
+        first = 0 if start is None else self._bisect(start)
+        last = self.count if end is None else self._bisect(end)
+        times, values = array("d"), array("d")
+        for position in range(first, last):
+            index = (self.start + position) % self.capacity
+            times.append(self.times[index])
+            values.append(self.values[index])
+        return times, values
+
+
+class _Series:
+    __slots__ = ("tiers", "buckets", "last_time")
+
+    def __init__(self, capacity: int):
+        self.tiers = {resolution: _Ring(capacity) for resolution in Resolution}
+        # Open bucket per downsampled resolution: start, sum, count
+        self.buckets: dict[Resolution, list[float]] = {}
+        self.last_time = float("-inf")
+
+    def add(self, t: float, value: float):
+        self.last_time = t
+        self.tiers[Resolution.Raw].append(t, value)
+        for resolution in (Resolution.TenSeconds, Resolution.Minute):
+            bucket_start = t - t % resolution
+            bucket = self.buckets.get(resolution)
+            if bucket is None or bucket[0] != bucket_start:
+                if bucket is not None:
+                    self.tiers[resolution].append(bucket[0], bucket[1] / bucket[2])
+                self.buckets[resolution] = [bucket_start, value, 1]
+            else:
+                bucket[1] += value
+                bucket[2] += 1
+
+    def query(
+        self, resolution: Resolution, start: float | None, end: float | None
+    ) -> tuple[array, array]:
+        times, values = self.tiers[resolution].range(start, end)
+        # The open bucket is averaged so far, it is not in the ring yet
+        bucket = self.buckets.get(resolution)
+        if (
+            bucket is not None
+            and (start is None or bucket[0] >= start)
+            and (end is None or bucket[0] < end)
+        ):
+            times.append(bucket[0])
+            values.append(bucket[1] / bucket[2])
+        return times, values
+
+
+class AttributeHistory:
+    """Recent numeric attribute values of one appliance
+
+    Every attribute gets the same fixed memory budget, shared by the raw
+    samples and the 10 s and 1 min averages, so the coarser resolutions reach
+    further back. Values that are not numbers are not kept. Times are UNIX
+    timestamps in seconds.
+    """
+
+    def __init__(
+        self,
+        budget: int = HISTORY_BUDGET,
+        attributes: Iterable[str] | None = None,
+    ):
+        self._capacity = max(1, budget // (POINT_BYTES * len(Resolution)))
+        self._only = None if attributes is None else frozenset(attributes)
+        self._series: dict[str, _Series] = {}
+
+    @property
+    def attributes(self) -> list[str]:
+        return list(self._series)
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._series) * len(Resolution) * self._capacity * POINT_BYTES
+
+    def record(self, attribute: str, value: str, timestamp_ms: int):
+        if self._only is not None and attribute not in self._only:
+            return
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return
+        series = self._series.get(attribute)
+        if series is None:
+            series = self._series[attribute] = _Series(self._capacity)
+        t = timestamp_ms / 1000
+        # Refetched values come with their old update time, keep samples ordered
+        if t <= series.last_time:
+            return
+        series.add(t, number)
+
+    def query(
+        self,
+        attribute: str,
+        start: float | None = None,
+        end: float | None = None,
+        resolution: Resolution = Resolution.Raw,
+    ) -> tuple[array, array]:
+        """Times and values of `attribute` in [start, end)"""
+        series = self._series.get(attribute)
+        if series is None:
+            return array("d"), array("d")
+        return series.query(resolution, start, end)
+
+    def write_csv(
+        self,
+        file: TextIO,
+        attributes: Iterable[str] | None = None,
+        resolution: Resolution = Resolution.Raw,
+        start: float | None = None,
+        end: float | None = None,
+    ):
+        import csv
+
+        writer = csv.writer(file)
+        writer.writerow(("attribute", "time", "value"))
+        for attribute in self._series if attributes is None else attributes:
+            times, values = self.query(attribute, start, end, resolution)
+            writer.writerows((attribute, t, v) for t, v in zip(times, values))
+
+    def to_numpy(
+        self,
+        attribute: str,
+        start: float | None = None,
+        end: float | None = None,
+        resolution: Resolution = Resolution.Raw,
+    ):
+        """Two column array of times and values, requires numpy"""
+        import numpy
+
+        times, values = self.query(attribute, start, end, resolution)
+        # Typed arrays expose the buffer protocol, no per-point conversion
+        return numpy.column_stack(
+            (
+                numpy.frombuffer(times, dtype=numpy.float64),
+                numpy.frombuffer(values, dtype=numpy.float64),
+            )
+        )
@@ -0,0 +1,181 @@
+import bisect
+import time
+from collections import deque
+from typing import Any
+
+# Upper bounds in seconds, shared by all latency histograms
+LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+RECENT_SAMPLES = 128
+RATE_WINDOW = 60
+
+RECONNECT_ERROR = "error"
+RECONNECT_CLOSED = "closed"
+RECONNECT_GOING_AWAY = "going_away"
+RECONNECT_UNAUTHORIZED = "unauthorized"
+RECONNECT_TOKEN_INVALID = "token_invalid"
+
+
+class Histogram:
+    """Cumulative bucketed histogram plus a window of recent samples"""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.last: float | None = None
+        self._recent: deque[float] = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.last = value
+        self._recent.append(value)
+
+    def quantile(self, q: float) -> float | None:
+        """Quantile over the recent samples"""
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "last": self.last,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class RateMeter:
+    """Events per second over a sliding window of one-second slots"""
+
+    def __init__(self, window: int = RATE_WINDOW):
+        self._window = window
+        self._slots = [0] * window
+        self._slot_second = [0] * window
+        self.total = 0
+
+    def mark(self, n: int = 1):
+        second = int(time.monotonic())
+        index = second % self._window
+        if self._slot_second[index] != second:
+            self._slot_second[index] = second
+            self._slots[index] = 0
+        self._slots[index] += n
+        self.total += n
+
+    def rate(self) -> float:
+        oldest = int(time.monotonic()) - self._window
+        return (
+            sum(
+                count
+                for count, second in zip(self._slots, self._slot_second)
+                if second > oldest
+            )
+            / self._window
+        )
+
+
+class Metrics:
+    """Runtime counters and histograms for one account connection"""
+
+    def __init__(self):
+        self.socket_messages = RateMeter()
+        self.socket_connected = False
+        # REST polling while the event socket is down
+        self.fallback_polling = False
+        self.fallback_polls = 0
+        self.unauthorized = 0
+        self.request_retries = 0
+        self.rate_limited = 0
+        self.rate_limit_queue = 0
+        # Time spent waiting for a rate limiter slot
+        self.rate_limit_wait = Histogram()
+        self.reconnects: dict[str, int] = {}
+        self.last_reconnect_cause: str | None = None
+        self.auth_refreshes = 0
+        self.auth_failures = 0
+        self.command_rtt = Histogram()
+        self.fetch_latency = Histogram()
+        self.callback_dispatch = Histogram()
+        self.transition_latency = Histogram()
+        # Command sent to values reported back, per SAID
+        self.confirm_rtt: dict[str, Histogram] = {}
+        self._last_event: dict[str, float] = {}
+
+    def socket_message(self):
+        self.socket_messages.mark()
+
+    def socket_state(self, connected: bool):
+        self.socket_connected = connected
+
+    def event_received(self, said: str):
+        self._last_event[said] = time.monotonic()
+
+    def reconnect(self, cause: str):
+        self.reconnects[cause] = self.reconnects.get(cause, 0) + 1
+        self.last_reconnect_cause = cause
+
+    def auth_refreshed(self, success: bool):
+        if success:
+            self.auth_refreshes += 1
+        else:
+            self.auth_failures += 1
+
+    def confirmation_rtt(self, said: str) -> Histogram:
+        histogram = self.confirm_rtt.get(said)
+        if histogram is None:
+            histogram = self.confirm_rtt[said] = Histogram()
+        return histogram
+
+    def time_since_last_event(self, said: str) -> float | None:
+        last = self._last_event.get(said)
+        return None if last is None else time.monotonic() - last
+
+    def last_event_ages(self) -> dict[str, float]:
+        now = time.monotonic()
+        return {said: now - last for said, last in self._last_event.items()}
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "socket_connected": self.socket_connected,
+            "socket_messages_total": self.socket_messages.total,
+            "socket_messages_per_second": self.socket_messages.rate(),
+            "fallback_polling": self.fallback_polling,
+            "fallback_polls": self.fallback_polls,
+            "reconnects": dict(self.reconnects),
+            "last_reconnect_cause": self.last_reconnect_cause,
+            "auth_refreshes": self.auth_refreshes,
+            "auth_failures": self.auth_failures,
+            "unauthorized": self.unauthorized,
+            "request_retries": self.request_retries,
+            "rate_limited": self.rate_limited,
+            "rate_limit_queue": self.rate_limit_queue,
+            "rate_limit_wait": self.rate_limit_wait.as_dict(),
+            "command_rtt": self.command_rtt.as_dict(),
+            "fetch_latency": self.fetch_latency.as_dict(),
+            "callback_dispatch": self.callback_dispatch.as_dict(),
+            "transition_latency": self.transition_latency.as_dict(),
+            "confirm_rtt": {
+                said: histogram.as_dict() for said, histogram in self.confirm_rtt.items()
+            },
+            "seconds_since_last_event": self.last_event_ages(),
+        }
@@ -0,0 +1,173 @@
+import logging
+from collections.abc import Iterable
+
+from aiohttp import web
+
+from .metrics import Histogram, Metrics
+
+LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 9464
+METRICS_PATH = "/metrics"
+
+PREFIX = "whirlpool_"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _histogram_lines(
+    name: str, histogram: Histogram, labels: dict[str, str]
+) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': repr(bound)})} {cumulative}")
+    lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {histogram.count}")
+    lines.append(f"{name}_sum{_labels(labels)} {histogram.sum}")
+    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+    return lines
+
+
+def render(sources: Iterable[tuple[dict[str, str], Metrics]]) -> str:
+    """Render metrics in the OpenMetrics text format
+
+    `sources` pairs each `Metrics` with the labels identifying it, e.g. the
+    account or Home Assistant instance it belongs to.
+    """
+    families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def family(name: str, kind: str, help_text: str) -> list[str]:
+        if name not in families:
+            families[name] = (kind, help_text, [])
+        return families[name][2]
+
+    for labels, metrics in sources:
+        family("socket_connected", "gauge", "Event socket connection state").append(
+            f"{PREFIX}socket_connected{_labels(labels)} {int(metrics.socket_connected)}"
+        )
+        family("fallback_polling", "gauge", "REST polling while the socket is down").append(
+            f"{PREFIX}fallback_polling{_labels(labels)} {int(metrics.fallback_polling)}"
+        )
+        family("fallback_polls", "counter", "Appliance polls while the socket is down").append(
+            f"{PREFIX}fallback_polls_total{_labels(labels)} {metrics.fallback_polls}"
+        )
+        family("socket_messages", "counter", "Event socket data messages").append(
+            f"{PREFIX}socket_messages_total{_labels(labels)} {metrics.socket_messages.total}"
+        )
+        reconnects = family("socket_reconnects", "counter", "Event socket reconnects")
+        for cause, count in metrics.reconnects.items():
+            reconnects.append(
+                f"{PREFIX}socket_reconnects_total{_labels({**labels, 'cause': cause})} {count}"
+            )
+        family("auth_refreshes", "counter", "Successful authentications").append(
+            f"{PREFIX}auth_refreshes_total{_labels(labels)} {metrics.auth_refreshes}"
+        )
+        family("auth_failures", "counter", "Failed authentications").append(
+            f"{PREFIX}auth_failures_total{_labels(labels)} {metrics.auth_failures}"
+        )
+        family("unauthorized", "counter", "REST requests answered with 401").append(
+            f"{PREFIX}unauthorized_total{_labels(labels)} {metrics.unauthorized}"
+        )
+        family("request_retries", "counter", "Retried REST requests").append(
+            f"{PREFIX}request_retries_total{_labels(labels)} {metrics.request_retries}"
+        )
+        family("rate_limited", "counter", "REST requests answered with 429").append(
+            f"{PREFIX}rate_limited_total{_labels(labels)} {metrics.rate_limited}"
+        )
+        family("rate_limit_queue", "gauge", "Requests waiting for a rate limiter slot").append(
+            f"{PREFIX}rate_limit_queue{_labels(labels)} {metrics.rate_limit_queue}"
+        )
+        for name, histogram, help_text in (
+            ("command_latency_seconds", metrics.command_rtt, "send_attributes latency"),
+            ("fetch_latency_seconds", metrics.fetch_latency, "fetch_data latency"),
+            (
+                "callback_dispatch_seconds",
+                metrics.callback_dispatch,
+                "Attribute callback dispatch time",
+            ),
+            (
+                "transition_latency_seconds",
+                metrics.transition_latency,
+                "Confirmed cook transition time",
+            ),
+            (
+                "rate_limit_wait_seconds",
+                metrics.rate_limit_wait,
+                "Time waiting for a rate limiter slot",
+            ),
+        ):
+            family(name, "histogram", help_text).extend(
+                _histogram_lines(PREFIX + name, histogram, labels)
+            )
+        confirm = family(
+            "confirm_latency_seconds", "histogram", "Command to appliance confirmation time"
+        )
+        for said, histogram in metrics.confirm_rtt.items():
+            confirm.extend(
+                _histogram_lines(
+                    PREFIX + "confirm_latency_seconds", histogram, {**labels, "said": said}
+                )
+            )
+        staleness = family(
+            "seconds_since_last_event", "gauge", "Time since the last event per SAID"
+        )
+        for said, age in metrics.last_event_ages().items():
+            staleness.append(
+                f"{PREFIX}seconds_since_last_event{_labels({**labels, 'said': said})} {age:.3f}"
+            )
+
+    out = []
+    for name, (kind, help_text, lines) in families.items():
+        out.append(f"# TYPE {PREFIX}{name} {kind}")
+        out.append(f"# HELP {PREFIX}{name} {help_text}")
+        out.extend(lines)
+    out.append("# EOF")
+    return "\n".join(out) + "\n"
+
+
+class MetricsServer:
+    """Optional local HTTP endpoint serving metrics for scraping"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self._host = host
+        self._port = port
+        self._sources: dict[int, tuple[dict[str, str], Metrics]] = {}
+        self._runner: web.AppRunner | None = None
+
+    def register(self, metrics: Metrics, **labels: str):
+        self._sources[id(metrics)] = (labels, metrics)
+
+    def unregister(self, metrics: Metrics):
+        self._sources.pop(id(metrics), None)
+
+    def render(self) -> str:
+        return render(self._sources.values())
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.render().encode("utf-8"), headers={"Content-Type": CONTENT_TYPE}
+        )
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get(METRICS_PATH, self._handle_metrics)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+        LOGGER.info("Serving metrics on http://%s:%s%s", self._host, self._port, METRICS_PATH)
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
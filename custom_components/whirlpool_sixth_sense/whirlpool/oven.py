@@ -1,8 +1,16 @@
+import asyncio
 import logging
 import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 
-from .appliance import Appliance
+from .adjuster import CookTimeAdjuster
+from .appliance import ATTR_ONLINE, Appliance, ApplianceSnapshot, AttributeReader
+from .callbacks import CallbackRegistry
+from .countdown import CookCountdown
+from .eta import EtaEstimator
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,8 +32,16 @@ ATTR_POSTFIX_MULTI_RACK = "CycleSetMultiRackFood"
 ATTR_POSTFIX_CULINARY_ID = "CulinaryCtrSetId"
 ATTR_POSTFIX_MEAT_PROBE_STATUS = "AlertStatusMeatProbePluggedIn"
 ATTR_POSTFIX_MEAT_PROBE_TARGET_TEMP = "CycleSetMeatProbeTargetTemp"
+ATTR_POSTFIX_MEAT_PROBE_TEMP = "OpStatusMeatProbeTemp"
 ATTR_POSTFIX_SET_OPERATION = "OpSetOperations"
 
+# Seconds to wait for the appliance to confirm each step of a transition
+TRANSITION_STEP_TIMEOUT = 10
+# The cook time usually comes with the start confirmation, after this it is resent
+COOK_TIME_CONFIRM_TIMEOUT = 2
+# The published cook end only moves by more than this, in seconds
+COOK_END_MIN_SHIFT = 30
+
 ATTRVAL_CAVITY_STATE_STANDBY = "0"
 ATTRVAL_CAVITY_STATE_PREHEATING = "1"
 ATTRVAL_CAVITY_STATE_COOKING = "2"
@@ -49,6 +65,8 @@ ATTRVAL_COOK_MODE_RISING = "19"
 ATTRVAL_COOK_MODE_KEEP_WARM = "24"
 # Removed AirFry (41) as user confirmed not supported
 
+KITCHEN_TIMER_PREFIX = "KitchenTimer"
+
 ATTR_POSTFIX_KITCHEN_TIMER_TIME_REMAINING = "StatusTimeRemaining"
 ATTR_POSTFIX_KITCHEN_TIMER_STATUS = "StatusState"
 ATTR_POSTFIX_KITCHEN_TIMER_SET_TIME = "SetTimeSet"
@@ -68,6 +86,23 @@ class Cavity(Enum):
 
 
 CAVITY_PREFIX_MAP = {Cavity.Upper: "OvenUpperCavity", Cavity.Lower: "OvenLowerCavity"}
+PREFIX_CAVITY_MAP = {v: k for k, v in CAVITY_PREFIX_MAP.items()}
+
+# Part of the oven an attribute belongs to: a cavity, a kitchen timer id, or
+# None for appliance wide attributes
+Scope = Cavity | int | None
+
+
+def attribute_scope(attribute: str) -> Scope:
+    """Route an attribute to its cavity or kitchen timer by prefix"""
+    prefix = attribute.partition("_")[0]
+    cavity = PREFIX_CAVITY_MAP.get(prefix)
+    if cavity is not None:
+        return cavity
+    timer_id = prefix[len(KITCHEN_TIMER_PREFIX) :]
+    if prefix.startswith(KITCHEN_TIMER_PREFIX) and timer_id.isdigit():
+        return int(timer_id)
+    return None
 
 
 class CookMode(Enum):
@@ -127,6 +162,11 @@ CAVITY_STATE_MAP = {
     CavityState.Cooking: ATTRVAL_CAVITY_STATE_COOKING,
     CavityState.NotPresent: ATTRVAL_CAVITY_STATE_NOT_PRESENT,
 }
+CAVITY_STATE_BY_VALUE = {v: k for k, v in CAVITY_STATE_MAP.items()}
+# Modes sharing a value decode to the first one, as in get_cook_mode
+COOK_MODE_BY_VALUE: dict[str, CookMode] = {
+    v: k for k, v in reversed(COOK_MODE_MAP.items())
+}
 
 
 class KitchenTimerState(Enum):
@@ -157,7 +197,7 @@ class KitchenTimer:
     def __init__(self, appliance: Appliance, timer_id: int = 1):
         self._timer_id = timer_id
         self._appliance = appliance
-        self._attr_prefix = f"KitchenTimer{timer_id:02d}_"
+        self._attr_prefix = f"{KITCHEN_TIMER_PREFIX}{timer_id:02d}_"
 
     def get_total_time(self):
         return self._appliance._get_attribute(
@@ -207,7 +247,215 @@ class KitchenTimer:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class OvenCavitySnapshot:
+    """Decoded state of one cavity
+
+    `cook_time_set` is the cook time last reported by the oven, the running
+    countdown is `Oven.get_cook_time`.
+    """
+
+    state: CavityState | None
+    cook_mode: CookMode | None
+    temp: float | None
+    target_temp: float | None
+    cook_time_set: int | None
+    cook_time_state: int | None
+    light: bool | None
+    door_open: bool | None
+    meat_probe_plugged: bool | None
+    meat_probe_temp: float | None
+    meat_probe_target_temp: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class OvenSnapshot(ApplianceSnapshot):
+    # Indexed by `Cavity.value`, None for a cavity the oven does not have
+    cavities: tuple[OvenCavitySnapshot | None, ...]
+    control_locked: bool | None
+    sabbath_mode: bool | None
+    display_brightness: int | None
+
+    def cavity(self, cavity: Cavity = Cavity.Upper) -> OvenCavitySnapshot | None:
+        return self.cavities[cavity.value]
+
+
 class Oven(Appliance):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._countdowns = {cavity: CookCountdown() for cavity in Cavity}
+        self._cook_ends: dict[Cavity, float | None] = dict.fromkeys(Cavity)
+        self._scoped_callbacks: dict[Scope, CallbackRegistry] = {}
+        self._transition_locks = {cavity: asyncio.Lock() for cavity in Cavity}
+        self._preheat_etas = {cavity: EtaEstimator() for cavity in Cavity}
+        self._meat_probe_etas = {cavity: EtaEstimator() for cavity in Cavity}
+        self._adjusters = {
+            cavity: CookTimeAdjuster(
+                self._countdowns[cavity].remaining,
+                partial(self.set_cook_duration, cavity=cavity),
+                partial(self._notify_scope, cavity),
+            )
+            for cavity in Cavity
+        }
+
+    def register_scoped_callback(
+        self, scope: Scope, update_callback: Callable
+    ) -> Callable[[], None]:
+        """Register a callback run only when attributes of `scope` change
+
+        Returns a function unregistering it.
+        """
+        registry = self._scoped_callbacks.get(scope)
+        if registry is None:
+            registry = self._scoped_callbacks[scope] = CallbackRegistry()
+        return registry.add(update_callback)
+
+    def unregister_scoped_callback(self, scope: Scope, update_callback: Callable):
+        registry = self._scoped_callbacks.get(scope)
+        if registry is None or not registry.discard(update_callback):
+            LOGGER.error("Scoped callback not found")
+
+    def _dispatch_attr_changed(self, changed: list[str] | None):
+        if changed is None:
+            scopes = {*Cavity, *self._scoped_callbacks}
+        else:
+            scopes = {attribute_scope(attr) for attr in changed}
+
+        for cavity in Cavity:
+            if cavity in scopes:
+                self._sync_countdown(cavity)
+                self._sync_etas(cavity)
+
+        for scope in scopes:
+            self._notify_scope(scope)
+        super()._dispatch_attr_changed(changed)
+
+    def _build_snapshot(self, reader: AttributeReader) -> OvenSnapshot:
+        return OvenSnapshot(
+            online=reader.as_bool(ATTR_ONLINE),
+            cavities=tuple(
+                self._build_cavity_snapshot(reader, CAVITY_PREFIX_MAP[cavity] + "_")
+                for cavity in Cavity
+            ),
+            control_locked=reader.as_bool(ATTR_CONTROL_LOCK),
+            sabbath_mode=reader.as_bool(ATTR_SABBATH_MODE),
+            display_brightness=reader.as_int(ATTR_DISPLAY_BRIGHTNESS),
+        )
+
+    @staticmethod
+    def _build_cavity_snapshot(
+        reader: AttributeReader, prefix: str
+    ) -> OvenCavitySnapshot | None:
+        state = reader.lookup(prefix + ATTR_POSTFIX_STATUS_STATE, CAVITY_STATE_BY_VALUE)
+        if state is None or state == CavityState.NotPresent:
+            return None
+        return OvenCavitySnapshot(
+            state=state,
+            cook_mode=reader.lookup(
+                prefix + ATTR_POSTFIX_COOK_MODE, COOK_MODE_BY_VALUE
+            ),
+            # Same fallback as get_temp, the raw sensor first
+            temp=reader.as_tenths(prefix + ATTR_POSTFIX_RAW_TEMP)
+            or reader.as_tenths(prefix + ATTR_POSTFIX_TEMP),
+            target_temp=reader.as_tenths(prefix + ATTR_POSTFIX_TARGET_TEMP),
+            cook_time_set=reader.as_int(prefix + ATTR_POSTFIX_COOK_TIME),
+            cook_time_state=reader.as_int(prefix + ATTR_POSTFIX_COOK_TIME_STATE),
+            light=reader.as_bool(prefix + ATTR_POSTFIX_LIGHT_STATUS),
+            door_open=reader.as_bool(prefix + ATTR_POSTFIX_DOOR_OPEN_STATUS),
+            meat_probe_plugged=reader.as_bool(prefix + ATTR_POSTFIX_MEAT_PROBE_STATUS),
+            meat_probe_temp=reader.as_tenths(prefix + ATTR_POSTFIX_MEAT_PROBE_TEMP),
+            meat_probe_target_temp=reader.as_tenths(
+                prefix + ATTR_POSTFIX_MEAT_PROBE_TARGET_TEMP
+            ),
+        )
+
+    def _notify_scope(self, scope: Scope):
+        for callback in self._scoped_callbacks.get(scope, ()):
+            callback()
+
+    def _sync_countdown(self, cavity: Cavity):
+        time_raw = self._get_attribute(
+            CAVITY_PREFIX_MAP[cavity] + "_" + ATTR_POSTFIX_COOK_TIME
+        )
+        state_raw = self._get_attribute(
+            CAVITY_PREFIX_MAP[cavity] + "_" + ATTR_POSTFIX_STATUS_STATE
+        )
+        countdown = self._countdowns[cavity]
+        countdown.sync(
+            int(time_raw) if time_raw is not None else 0,
+            cooking=state_raw
+            in (ATTRVAL_CAVITY_STATE_COOKING, ATTRVAL_CAVITY_STATE_PREHEATING),
+            standby=state_raw == ATTRVAL_CAVITY_STATE_STANDBY,
+        )
+        # Resyncs of the server time move the end by delivery latency only
+        end = countdown.end_time()
+        published = self._cook_ends[cavity]
+        if (
+            end is None
+            or published is None
+            or abs(end - published) > COOK_END_MIN_SHIFT
+        ):
+            self._cook_ends[cavity] = end
+
+    def _sync_etas(self, cavity: Cavity):
+        prefix = CAVITY_PREFIX_MAP[cavity] + "_"
+        now = time.time()
+        for estimator, active, temp_attr, target_attr in (
+            (
+                self._preheat_etas[cavity],
+                self._get_attribute(prefix + ATTR_POSTFIX_STATUS_STATE)
+                == ATTRVAL_CAVITY_STATE_PREHEATING,
+                prefix + ATTR_POSTFIX_RAW_TEMP,
+                prefix + ATTR_POSTFIX_TARGET_TEMP,
+            ),
+            (
+                self._meat_probe_etas[cavity],
+                self.get_meat_probe_status(cavity) is True,
+                prefix + ATTR_POSTFIX_MEAT_PROBE_TEMP,
+                prefix + ATTR_POSTFIX_MEAT_PROBE_TARGET_TEMP,
+            ),
+        ):
+            if not active:
+                estimator.reset()
+                continue
+            temp = self._get_int_attribute(temp_attr)
+            if temp:
+                estimator.add(temp, now)
+            estimator.update(self._get_int_attribute(target_attr) or None, now)
+
+    def get_cook_end(self, cavity: Cavity = Cavity.Upper) -> float | None:
+        """Predicted end of the cook as a UNIX timestamp"""
+        return self._cook_ends[cavity]
+
+    def get_preheat_eta(self, cavity: Cavity = Cavity.Upper) -> float | None:
+        """Estimated end of preheating as a UNIX timestamp"""
+        return self._preheat_etas[cavity].finish
+
+    def get_meat_probe_eta(self, cavity: Cavity = Cavity.Upper) -> float | None:
+        """Estimated time the meat probe reaches its target as a UNIX timestamp"""
+        return self._meat_probe_etas[cavity].finish
+
+    def get_meat_probe_temp(self, cavity: Cavity = Cavity.Upper):
+        reported_temp = self._get_int_attribute(
+            CAVITY_PREFIX_MAP[cavity] + "_" + ATTR_POSTFIX_MEAT_PROBE_TEMP
+        )
+        if reported_temp is None or reported_temp == 0:
+            return None
+
+        # temperatures are returned in 1/10ths of a degree Celsius
+        return reported_temp / 10
+
+    def get_meat_probe_target_temp(self, cavity: Cavity = Cavity.Upper):
+        reported_temp = self._get_int_attribute(
+            CAVITY_PREFIX_MAP[cavity] + "_" + ATTR_POSTFIX_MEAT_PROBE_TARGET_TEMP
+        )
+        if reported_temp is None or reported_temp == 0:
+            return None
+        return reported_temp / 10
+
+    def get_countdown(self, cavity: Cavity = Cavity.Upper) -> CookCountdown:
+        return self._countdowns[cavity]
+
     def get_meat_probe_status(self, cavity: Cavity = Cavity.Upper):
         return self.attr_value_to_bool(
             self._get_attribute(
@@ -229,51 +477,29 @@ class Oven(Appliance):
     async def set_display_brightness_percent(self, pct: int) -> bool:
         return await self.send_attributes({ATTR_DISPLAY_BRIGHTNESS: str(pct)})
 
-    def get_cook_time(self, cavity: Cavity = Cavity.Upper):
-        if not hasattr(self, "_desired_cook_time"):
-             self._desired_cook_time = {Cavity.Upper: 0, Cavity.Lower: 0}
-        if not hasattr(self, "_timer_updated_at"):
-             self._timer_updated_at = {Cavity.Upper: 0, Cavity.Lower: 0}
-        if not hasattr(self, "_timer_val"):
-             self._timer_val = {Cavity.Upper: 0, Cavity.Lower: 0}
-        if not hasattr(self, "_timer_preserved"):
-             self._timer_preserved = {Cavity.Upper: False, Cavity.Lower: False}
+    def get_cook_time(self, cavity: Cavity = Cavity.Upper) -> int:
+        # A pending adjustment is shown until it has been sent
+        target = self._adjusters[cavity].target
+        if target is not None:
+            return target
+        return self._countdowns[cavity].remaining()
 
-        time_raw = self._get_attribute(
-            CAVITY_PREFIX_MAP[cavity] + "_" + ATTR_POSTFIX_COOK_TIME
-        )
-        server_seconds = int(time_raw) if time_raw is not None else 0
-        state = self.get_cavity_state(cavity)
-        
-        # If server says 0 and we are in standby
-        if server_seconds == 0 and state == CavityState.Standby:
-             # If we explicitly preserved it, return the preserved value
-             if self._timer_preserved[cavity]:
-                  return self._desired_cook_time[cavity]
-                  
-             # Otherwise, it's a natural/manual stop, so reset
-             self._desired_cook_time[cavity] = 0
-             self._timer_val[cavity] = 0
-             return 0
-
-        # If server says 0 but we aren't cooking, OR we just started, use our desired time
-        if server_seconds == 0:
-             return self._desired_cook_time[cavity]
-
-        # Sync local tracking with server
-        if server_seconds != self._timer_val[cavity]:
-             self._timer_val[cavity] = server_seconds
-             self._timer_updated_at[cavity] = time.time()
-        
-        # Calculate local countdown if cooking
-        if state in [CavityState.Cooking, CavityState.Preheating] and server_seconds > 0:
-             elapsed = time.time() - self._timer_updated_at[cavity]
-             remaining = max(0, server_seconds - int(elapsed))
-             # Update desired time to match current remaining for consistency
-             self._desired_cook_time[cavity] = remaining
-             return remaining
+    def request_cook_time(self, seconds: int, cavity: Cavity = Cavity.Upper):
+        """Set the cook time, sent once input settles"""
+        self._adjusters[cavity].set(seconds)
+
+    def adjust_cook_time(self, delta: int, cavity: Cavity = Cavity.Upper):
+        """Add `delta` seconds to the cook time, sent once input settles"""
+        self._adjusters[cavity].add(delta)
 
-        return server_seconds
+    async def flush_cook_time(self, cavity: Cavity = Cavity.Upper) -> bool:
+        """Send a pending cook time adjustment now"""
+        return await self._adjusters[cavity].flush()
+
+    def cancel_cook_time_requests(self):
+        """Drop pending cook time adjustments and stop those being sent"""
+        for adjuster in self._adjusters.values():
+            adjuster.cancel()
 
     def get_control_locked(self):
         return self.attr_value_to_bool(self._get_attribute(ATTR_CONTROL_LOCK))
@@ -337,7 +563,18 @@ class Oven(Appliance):
         LOGGER.error("Unknown cavity state: " + str(state_raw))
         return None
 
+    def is_active(self) -> bool:
+        return any(
+            self._get_attribute(prefix + "_" + ATTR_POSTFIX_STATUS_STATE)
+            in (ATTRVAL_CAVITY_STATE_PREHEATING, ATTRVAL_CAVITY_STATE_COOKING)
+            for prefix in CAVITY_PREFIX_MAP.values()
+        )
+
     def get_oven_cavity_exists(self, cavity: Cavity):
+        if not self.has_attribute(
+            CAVITY_PREFIX_MAP[cavity] + "_" + ATTR_POSTFIX_STATUS_STATE
+        ):
+            return False
         cavity_state = self.get_cavity_state(cavity=cavity)
         return cavity_state is not None and cavity_state != CavityState.NotPresent
 
@@ -345,6 +582,16 @@ class Oven(Appliance):
         timer = KitchenTimer(appliance=self, timer_id=timer_id)
         return timer
 
+    def get_kitchen_timer_ids(self) -> list[int]:
+        """Ids of the kitchen timers reported by the appliance"""
+        return sorted(
+            {
+                scope
+                for attr in self._data_dict.get("attributes", {})
+                if isinstance(scope := attribute_scope(attr), int)
+            }
+        )
+
     def get_cook_time_state(self, cavity: Cavity = Cavity.Upper) -> int:
         return self._get_int_attribute(
             CAVITY_PREFIX_MAP[cavity] + "_" + ATTR_POSTFIX_COOK_TIME_STATE
@@ -387,9 +634,7 @@ class Oven(Appliance):
         if cook_time is not None:
             attrs[cavity_prefix + ATTR_POSTFIX_COOK_TIME] = str(cook_time)
 
-        if not hasattr(self, "_timer_preserved"):
-             self._timer_preserved = {Cavity.Upper: False, Cavity.Lower: False}
-        self._timer_preserved[cavity] = False
+        self._countdowns[cavity].preserved = False
 
         return await self.send_attributes(attrs)
 
@@ -403,7 +648,7 @@ class Oven(Appliance):
         if cook_time is not None:
             attrs[cavity_prefix + ATTR_POSTFIX_COOK_TIME] = str(cook_time)
         
-        self._timer_preserved[cavity] = False
+        self._countdowns[cavity].preserved = False
         return await self.send_attributes(attrs)
 
     async def set_cook_4(self, temp: float, food_type: int = 2, cavity: Cavity = Cavity.Upper, cook_time: int | None = None) -> bool:
@@ -416,7 +661,7 @@ class Oven(Appliance):
         if cook_time is not None:
             attrs[cavity_prefix + ATTR_POSTFIX_COOK_TIME] = str(cook_time)
         
-        self._timer_preserved[cavity] = False
+        self._countdowns[cavity].preserved = False
         return await self.send_attributes(attrs)
 
     async def set_culinary_cycle(self, cycle_id: int, temp: float | None = None, cavity: Cavity = Cavity.Upper, cook_time: int | None = None, **kwargs) -> bool:
@@ -431,7 +676,7 @@ class Oven(Appliance):
         if cook_time is not None:
              attrs[cavity_prefix + ATTR_POSTFIX_COOK_TIME] = str(cook_time)
         
-        self._timer_preserved[cavity] = False
+        self._countdowns[cavity].preserved = False
         
         # Map common kwargs to attribute names (Case Sensitive based on APK)
         if "weight" in kwargs:
@@ -456,16 +701,7 @@ class Oven(Appliance):
         return await self.send_attributes(attrs)
 
     async def set_cook_duration(self, seconds: int, cavity: Cavity = Cavity.Upper) -> bool:
-        if not hasattr(self, "_desired_cook_time"):
-             self._desired_cook_time = {Cavity.Upper: 0, Cavity.Lower: 0}
-        if not hasattr(self, "_timer_updated_at"):
-             self._timer_updated_at = {Cavity.Upper: 0, Cavity.Lower: 0}
-        if not hasattr(self, "_timer_val"):
-             self._timer_val = {Cavity.Upper: 0, Cavity.Lower: 0}
-
-        self._desired_cook_time[cavity] = seconds
-        self._timer_val[cavity] = seconds
-        self._timer_updated_at[cavity] = time.time()
+        self._countdowns[cavity].set_desired(seconds)
 
         cavity_prefix = CAVITY_PREFIX_MAP[cavity] + "_"
         attrs = {
@@ -480,18 +716,10 @@ class Oven(Appliance):
         return await self.send_attributes(attrs)
 
     async def stop_cook(self, cavity: Cavity = Cavity.Upper, reset_timer: bool = True) -> bool:
-        if not hasattr(self, "_timer_preserved"):
-             self._timer_preserved = {Cavity.Upper: False, Cavity.Lower: False}
-        
         if reset_timer:
-            if hasattr(self, "_desired_cook_time"):
-                 self._desired_cook_time[cavity] = 0
-            if hasattr(self, "_timer_val"):
-                 self._timer_val[cavity] = 0
-            self._timer_preserved[cavity] = False
-        else:
-            self._timer_preserved[cavity] = True
-             
+            self._adjusters[cavity].cancel()
+        self._countdowns[cavity].reset(preserve=not reset_timer)
+
         return await self.send_attributes(
             {
                 CAVITY_PREFIX_MAP[cavity]
@@ -500,6 +728,67 @@ class Oven(Appliance):
             }
         )
 
+    async def transition_cook(
+        self,
+        start: Callable[[], Awaitable[bool]],
+        mode: CookMode | None = None,
+        cavity: Cavity = Cavity.Upper,
+        cook_time: int | None = None,
+        timeout: float = TRANSITION_STEP_TIMEOUT,
+    ) -> bool:
+        """Switch a cavity to a new cook, waiting for the appliance to confirm each step
+
+        Stops the running cook (keeping the timer) and waits for standby, calls
+        `start` and waits for the cavity to run in `mode`, then resends the cook
+        time only if the appliance did not apply it. Returns False as soon as a
+        command fails or a step is not confirmed within `timeout` seconds.
+        """
+        prefix = CAVITY_PREFIX_MAP[cavity] + "_"
+        state_attr = prefix + ATTR_POSTFIX_STATUS_STATE
+        async with self._transition_locks[cavity]:
+            begin = time.monotonic()
+            if self.get_cavity_state(cavity) in (
+                CavityState.Cooking,
+                CavityState.Preheating,
+            ):
+                if not await self.stop_cook(cavity, reset_timer=False):
+                    return False
+                if not await self.wait_for_attributes(
+                    {state_attr: ATTRVAL_CAVITY_STATE_STANDBY}, timeout
+                ):
+                    LOGGER.warning("Stop of %s not confirmed", cavity.name)
+                    return False
+
+            if not await start():
+                return False
+            expected: dict[str, str | tuple[str, ...]] = {
+                state_attr: (
+                    ATTRVAL_CAVITY_STATE_PREHEATING,
+                    ATTRVAL_CAVITY_STATE_COOKING,
+                )
+            }
+            if mode is not None:
+                expected[prefix + ATTR_POSTFIX_COOK_MODE] = COOK_MODE_MAP[mode]
+            if not await self.wait_for_attributes(expected, timeout):
+                LOGGER.warning("Start of %s not confirmed", cavity.name)
+                return False
+
+            if cook_time:
+                cook_time_attr = {prefix + ATTR_POSTFIX_COOK_TIME: str(cook_time)}
+                if not await self.wait_for_attributes(
+                    cook_time_attr, min(timeout, COOK_TIME_CONFIRM_TIMEOUT)
+                ):
+                    if not await self.set_cook_duration(cook_time, cavity):
+                        return False
+                    if not await self.wait_for_attributes(cook_time_attr, timeout):
+                        LOGGER.warning("Cook time of %s not confirmed", cavity.name)
+                        return False
+
+            elapsed = time.monotonic() - begin
+            self._metrics.transition_latency.observe(elapsed)
+            LOGGER.debug("Transition of %s confirmed in %.2fs", cavity.name, elapsed)
+            return True
+
     def get_sabbath_mode(self):
         return self.attr_value_to_bool(self._get_attribute(ATTR_SABBATH_MODE))
 
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from socket import gaierror
+
+import aiohttp
+
+from .appliance import Appliance
+from .metrics import Metrics
+
+LOGGER = logging.getLogger(__name__)
+
+# Seconds between polls of an appliance that is running, e.g. a cooking oven
+POLL_INTERVAL_ACTIVE = 15
+# Seconds between polls of an idle appliance
+POLL_INTERVAL_IDLE = 120
+
+
+def poll_interval(appliance: Appliance) -> float | None:
+    """Seconds between polls of `appliance`, None to not poll it"""
+    # The snapshot is None without data, where the getters would log errors
+    snapshot = appliance.snapshot()
+    if snapshot is None:
+        return POLL_INTERVAL_ACTIVE
+    if snapshot.online is False:
+        return None
+    return POLL_INTERVAL_ACTIVE if appliance.is_active() else POLL_INTERVAL_IDLE
+
+
+class FallbackPoller:
+    """Refresh appliance data over REST while the event socket is down"""
+
+    def __init__(
+        self,
+        appliances: Callable[[], Iterable[Appliance]],
+        metrics: Metrics | None = None,
+    ):
+        self._appliances = appliances
+        self._metrics = metrics if metrics is not None else Metrics()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self):
+        if self._task is not None:
+            return
+        LOGGER.info("Event socket down, polling appliance data")
+        self._metrics.fallback_polling = True
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        LOGGER.info("Event socket up, stopped polling appliance data")
+        task, self._task = self._task, None
+        self._metrics.fallback_polling = False
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self):
+        # Data is fresh for one interval after the last event or poll
+        last_poll: dict[str, float] = {}
+        while True:
+            now = time.monotonic()
+            wake = now + POLL_INTERVAL_IDLE
+            for appliance in self._appliances():
+                interval = poll_interval(appliance)
+                if interval is None:
+                    continue
+                # Recomputed every round, so an oven starting to cook is polled sooner
+                due = last_poll.setdefault(appliance.said, now) + interval
+                if due <= now:
+                    self._metrics.fallback_polls += 1
+                    try:
+                        await appliance.fetch_data()
+                    except (aiohttp.ClientError, TimeoutError, gaierror) as ex:
+                        LOGGER.error("Polling %s failed: %s", appliance.said, ex)
+                    last_poll[appliance.said] = time.monotonic()
+                    due = last_poll[appliance.said] + interval
+                wake = min(wake, due)
+            await asyncio.sleep(max(0.0, wake - time.monotonic()))
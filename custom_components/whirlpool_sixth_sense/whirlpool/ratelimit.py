@@ -0,0 +1,134 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+from .metrics import Metrics
+
+LOGGER = logging.getLogger(__name__)
+
+# Sustained requests per second and the burst allowed on top
+RATE = 2.0
+BURST = 10
+# Pause after a 429 without a usable Retry-After header
+RETRY_AFTER_DEFAULT = 5.0
+RETRY_AFTER_MAX = 300.0
+
+
+class Priority(IntEnum):
+    """Lower values are served first"""
+
+    Command = 0
+    Read = 1
+
+
+def retry_after_seconds(value: str | None) -> float:
+    """Seconds to wait from a Retry-After header, in seconds or HTTP-date form"""
+    if value is None:
+        return RETRY_AFTER_DEFAULT
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return RETRY_AFTER_DEFAULT
+        seconds = (date - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX)
+
+
+class RateLimiter:
+    """Token bucket shared by every request of one backend and account
+
+    Requests that find the bucket empty queue by priority, so user commands
+    overtake background reads. A 429 pauses the whole bucket until the server
+    allows requests again.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE,
+        burst: int = BURST,
+        metrics: Metrics | None = None,
+    ):
+        self._rate = rate
+        self._burst = burst
+        self._metrics = metrics if metrics is not None else Metrics()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._handle: asyncio.TimerHandle | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def _refill(self, now: float):
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _take(self, now: float) -> bool:
+        self._refill(now)
+        if now < self._paused_until or self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def acquire(self, priority: Priority = Priority.Read):
+        """Wait for a request slot"""
+        start = time.monotonic()
+        if not self._waiters and self._take(start):
+            self._metrics.rate_limit_wait.observe(0.0)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._metrics.rate_limit_queue = self.queue_depth
+        self._schedule()
+        try:
+            await future
+        finally:
+            if not future.done():
+                future.cancel()
+            self._metrics.rate_limit_queue = self.queue_depth
+        self._metrics.rate_limit_wait.observe(time.monotonic() - start)
+
+    def backoff(self, retry_after: str | None = None):
+        """Pause all requests after a 429 response"""
+        delay = retry_after_seconds(retry_after)
+        LOGGER.warning("Rate limited by the server, pausing requests for %.1fs", delay)
+        self._metrics.rate_limited += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._schedule()
+
+    def _schedule(self):
+        if self._handle is not None or not self._waiters:
+            return
+        now = time.monotonic()
+        self._refill(now)
+        delay = max(self._paused_until - now, (1 - self._tokens) / self._rate, 0.0)
+        self._handle = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self):
+        self._handle = None
+        now = time.monotonic()
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                # Cancelled while queued
+                heapq.heappop(self._waiters)
+                continue
+            if not self._take(now):
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        self._schedule()
@@ -0,0 +1,173 @@
+import asyncio
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+
+LOGGER = logging.getLogger(__name__)
+
+LOG_MAGIC = b"WPRL"
+LOG_VERSION = 1
+LOG_HEADER = struct.Struct("<4sB")
+# kind, monotonic timestamp (ns since the log was created), payload length
+RECORD_HEADER = struct.Struct("<BqI")
+
+
+class RecordKind(Enum):
+    SocketFrame = 1
+    FetchData = 2
+    SendAttributes = 3
+
+
+@dataclass(frozen=True, slots=True)
+class Record:
+    kind: RecordKind
+    timestamp_ns: int
+    payload: bytes
+
+    @property
+    def text(self) -> str:
+        return self.payload.decode("utf-8")
+
+
+class Recorder:
+    """Append-only binary log of socket frames and REST traffic
+
+    An existing log is continued from its last timestamp, so timestamps stay
+    monotonic across sessions and the time between sessions is not replayed.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        # Read before opening for append, which would create the file
+        offset_ns = _last_timestamp_ns(path) if size > LOG_HEADER.size else 0
+        self._file = open(path, "ab")
+        if size == 0:
+            self._file.write(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+        self._start_ns = time.monotonic_ns() - offset_ns
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def record(self, kind: RecordKind, payload: str | bytes):
+        if self._file.closed:
+            return
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        self._file.write(
+            RECORD_HEADER.pack(
+                kind.value, time.monotonic_ns() - self._start_ns, len(payload)
+            )
+        )
+        self._file.write(payload)
+
+    def record_rest(self, kind: RecordKind, said: str, status: int, body: str):
+        self.record(
+            kind, json.dumps({"said": said, "status": status, "body": body})
+        )
+
+    def flush(self):
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class LogReader:
+    """Random-access reader for a recorder log, backed by mmap"""
+
+    def __init__(self, path: str):
+        size = os.path.getsize(path)
+        if size < LOG_HEADER.size:
+            raise ValueError(f"Empty recorder log: {path}")
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = LOG_HEADER.unpack_from(self._mmap, 0)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            self.close()
+            raise ValueError(f"Not a recorder log (v{LOG_VERSION}): {path}")
+        self._offsets = self._build_index()
+        if not self._offsets:
+            self.close()
+            raise ValueError(f"Recorder log has no records: {path}")
+
+    def _build_index(self) -> list[int]:
+        offsets: list[int] = []
+        pos = LOG_HEADER.size
+        end = len(self._mmap)
+        while pos + RECORD_HEADER.size <= end:
+            _, _, length = RECORD_HEADER.unpack_from(self._mmap, pos)
+            if pos + RECORD_HEADER.size + length > end:
+                LOGGER.warning("Truncated record at offset %s", pos)
+                break
+            offsets.append(pos)
+            pos += RECORD_HEADER.size + length
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> Record:
+        pos = self._offsets[index]
+        kind, timestamp_ns, length = RECORD_HEADER.unpack_from(self._mmap, pos)
+        start = pos + RECORD_HEADER.size
+        return Record(RecordKind(kind), timestamp_ns, self._mmap[start : start + length])
+
+    def __iter__(self) -> Iterator[Record]:
+        for i in range(len(self._offsets)):
+            yield self[i]
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+
+def _last_timestamp_ns(path: str) -> int:
+    reader = LogReader(path)
+    try:
+        return reader[-1].timestamp_ns
+    finally:
+        reader.close()
+
+
+async def replay(
+    reader: LogReader,
+    msg_listener: Callable[[str], None],
+    speed: float | None = 1.0,
+) -> int:
+    """Feed recorded socket frames to `msg_listener`
+
+    `speed` scales the recorded timing (2.0 plays twice as fast). None replays
+    as fast as possible. Returns the number of messages delivered.
+    """
+    # Imported here to keep the recorder usable without the socket module
+    from .eventsocket import DATA_MSG_MATCHER
+
+    delivered = 0
+    first_ts: int | None = None
+    start = time.monotonic()
+    for record in reader:
+        if record.kind != RecordKind.SocketFrame:
+            continue
+        match = DATA_MSG_MATCHER.findall(record.text)
+        if not match:
+            continue
+        if speed is not None:
+            if first_ts is None:
+                first_ts = record.timestamp_ns
+            due = start + (record.timestamp_ns - first_ts) / 1e9 / speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        msg_listener("{" + match[0] + "}")
+        delivered += 1
+    return delivered
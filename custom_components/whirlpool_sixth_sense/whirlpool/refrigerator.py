@@ -1,6 +1,7 @@
 import logging
+from dataclasses import dataclass
 
-from .appliance import Appliance
+from .appliance import ATTR_ONLINE, Appliance, ApplianceSnapshot, AttributeReader
 
 LOGGER = logging.getLogger(__name__)
 
@@ -15,13 +16,31 @@ TEMP_MAP = {
     3: 9,
     5: 8,
 }
+OFFSET_BY_TEMP = {v: k for k, v in TEMP_MAP.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class RefrigeratorSnapshot(ApplianceSnapshot):
+    offset_temp: int | None
+    temp: int | None
+    turbo_mode: bool | None
+    display_lock: bool | None
 
 
 class Refrigerator(Appliance):
+    def _build_snapshot(self, reader: AttributeReader) -> RefrigeratorSnapshot:
+        temp = reader.as_int(SETTING_TEMP)
+        return RefrigeratorSnapshot(
+            online=reader.as_bool(ATTR_ONLINE),
+            offset_temp=OFFSET_BY_TEMP.get(temp),
+            temp=temp,
+            turbo_mode=reader.as_bool(SETTING_TURBO_MODE),
+            display_lock=reader.as_bool(SETTING_DISPLAY_LOCK),
+        )
+
     def get_offset_temp(self) -> int | None:
-        reversed_temp_map = {v: k for k, v in TEMP_MAP.items()}
         raw_temp = self._get_int_attribute(SETTING_TEMP)
-        return reversed_temp_map[raw_temp] if raw_temp is not None else None
+        return OFFSET_BY_TEMP[raw_temp] if raw_temp is not None else None
 
     async def set_offset_temp(self, temp) -> bool:
         if temp not in TEMP_MAP.keys():
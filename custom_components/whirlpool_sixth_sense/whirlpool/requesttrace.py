@@ -0,0 +1,194 @@
+import json
+import logging
+import statistics
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from types import SimpleNamespace
+
+import aiohttp
+from yarl import URL
+
+LOGGER = logging.getLogger(__name__)
+
+TRACE_WINDOW = 1000
+PHASES = ("queued", "dns", "connect", "send", "ttfb", "transfer", "total")
+
+
+def endpoint_kind(url: URL) -> str:
+    """Kind of cloud endpoint a request goes to"""
+    if url.scheme in ("ws", "wss"):
+        return "ws-connect"
+    path = url.path
+    if path.endswith("/oauth/token"):
+        return "oauth"
+    if path.endswith("/client_auth/webSocketUrl"):
+        return "ws-url"
+    if path.endswith("/appliance/command"):
+        return "command"
+    if (
+        "/appliance/all/" in path
+        or "/share-accounts/" in path
+        or path.endswith("/getUserDetails")
+    ):
+        return "inventory"
+    if "/appliance/" in path:
+        return "data"
+    return "other"
+
+
+@dataclass(slots=True)
+class RequestTrace:
+    """Phase durations of one request, in seconds
+
+    `connect` covers TCP and TLS, which aiohttp does not report separately.
+    Phases that did not happen, e.g. DNS on a cached host, stay at 0.
+    """
+
+    kind: str
+    method: str
+    started: float
+    status: int | None = None
+    error: str | None = None
+    reused: bool = False
+    queued: float = 0.0
+    dns: float = 0.0
+    connect: float = 0.0
+    send: float = 0.0
+    ttfb: float = 0.0
+    transfer: float = 0.0
+    total: float = 0.0
+    _marks: dict[str, float] = field(default_factory=dict, repr=False)
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        del data["_marks"]
+        return data
+
+
+class RequestTracer:
+    """Rolling window of request traces, fed by an aiohttp TraceConfig"""
+
+    def __init__(self, window: int = TRACE_WINDOW):
+        self.traces: deque[RequestTrace] = deque(maxlen=window)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """TraceConfig to pass to the session in `trace_configs`"""
+        config = aiohttp.TraceConfig()
+        config.on_request_start.append(self._on_request_start)
+        config.on_connection_queued_start.append(self._mark("queued"))
+        config.on_connection_queued_end.append(self._measure("queued"))
+        config.on_dns_resolvehost_start.append(self._mark("dns"))
+        config.on_dns_resolvehost_end.append(self._measure("dns"))
+        config.on_connection_create_start.append(self._mark("connect"))
+        config.on_connection_create_end.append(self._measure("connect"))
+        config.on_connection_reuseconn.append(self._on_reuseconn)
+        config.on_request_headers_sent.append(self._on_headers_sent)
+        config.on_request_end.append(self._on_request_end)
+        config.on_request_exception.append(self._on_request_exception)
+        config.on_response_chunk_received.append(self._on_chunk)
+        return config
+
+    @staticmethod
+    def _trace(ctx: SimpleNamespace) -> RequestTrace | None:
+        return getattr(ctx, "trace", None)
+
+    async def _on_request_start(self, session, ctx, params):
+        ctx.trace = RequestTrace(
+            kind=endpoint_kind(params.url), method=params.method, started=time.time()
+        )
+        ctx.trace._marks["start"] = time.perf_counter()
+
+    def _mark(self, phase: str):
+        async def mark(session, ctx, params):
+            if (trace := self._trace(ctx)) is not None:
+                trace._marks[phase] = time.perf_counter()
+
+        return mark
+
+    def _measure(self, phase: str):
+        async def measure(session, ctx, params):
+            trace = self._trace(ctx)
+            if trace is not None and phase in trace._marks:
+                setattr(trace, phase, time.perf_counter() - trace._marks[phase])
+
+        return measure
+
+    async def _on_reuseconn(self, session, ctx, params):
+        if (trace := self._trace(ctx)) is not None:
+            trace.reused = True
+
+    async def _on_headers_sent(self, session, ctx, params):
+        if (trace := self._trace(ctx)) is not None:
+            now = time.perf_counter()
+            trace._marks["sent"] = now
+            # Time from the request starting to be written, after the connection
+            trace.send = max(
+                0.0,
+                now - trace._marks["start"] - trace.queued - trace.dns - trace.connect,
+            )
+
+    async def _on_request_end(self, session, ctx, params):
+        if (trace := self._trace(ctx)) is None:
+            return
+        now = time.perf_counter()
+        trace._marks["end"] = now
+        trace.status = params.response.status
+        trace.ttfb = now - trace._marks.get("sent", trace._marks["start"])
+        trace.total = now - trace._marks["start"]
+        self.traces.append(trace)
+
+    async def _on_request_exception(self, session, ctx, params):
+        if (trace := self._trace(ctx)) is None:
+            return
+        trace.error = type(params.exception).__name__
+        trace.total = time.perf_counter() - trace._marks["start"]
+        self.traces.append(trace)
+
+    async def _on_chunk(self, session, ctx, params):
+        trace = self._trace(ctx)
+        if trace is None or "end" not in trace._marks:
+            return
+        # The trace is already in the window, the body extends it in place
+        now = time.perf_counter()
+        trace.transfer = now - trace._marks["end"]
+        trace.total = now - trace._marks["start"]
+
+    def query(
+        self, kind: str | None = None, since: float | None = None
+    ) -> list[RequestTrace]:
+        """Traces of `kind`, started after the `since` wall-clock time"""
+        return [
+            trace
+            for trace in self.traces
+            if (kind is None or trace.kind == kind)
+            and (since is None or trace.started >= since)
+        ]
+
+    def summary(self) -> dict[str, dict]:
+        """Count, errors and per-phase median and max by endpoint kind"""
+        by_kind: dict[str, list[RequestTrace]] = {}
+        for trace in self.traces:
+            by_kind.setdefault(trace.kind, []).append(trace)
+        return {
+            kind: {
+                "count": len(traces),
+                "errors": sum(1 for trace in traces if trace.error is not None),
+                "reused": sum(1 for trace in traces if trace.reused),
+                **{
+                    phase: {
+                        "p50": statistics.median(getattr(t, phase) for t in traces),
+                        "max": max(getattr(t, phase) for t in traces),
+                    }
+                    for phase in PHASES
+                },
+            }
+            for kind, traces in by_kind.items()
+        }
+
+    def dump(self, path: str):
+        """Write the window as JSON lines"""
+        with open(path, "w") as f:
+            for trace in self.traces:
+                f.write(json.dumps(trace.as_dict()) + "\n")
+        LOGGER.info("Dumped %d request traces to %s", len(self.traces), path)
@@ -0,0 +1,75 @@
+import json
+import logging
+import time
+from collections import deque
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+TRACE_CAPACITY = 1000
+# Characters kept of free-form payloads like socket frames and replies
+TRACE_PAYLOAD_MAX = 200
+
+
+def payload(value: Any) -> str:
+    """Truncated text of a frame or reply, safe to keep and serialize"""
+    return str(value)[:TRACE_PAYLOAD_MAX]
+
+
+class EventTracer:
+    """Structured debug events in a fixed-size ring buffer
+
+    Disabled by default. Call sites check `enabled` before building an event,
+    so a disabled tracer costs one attribute lookup per call site. When
+    enabled, the oldest events are dropped once the buffer is full and
+    nothing is written to the log until `dump` is called.
+    """
+
+    __slots__ = ("enabled", "_events")
+
+    def __init__(self, capacity: int = TRACE_CAPACITY):
+        self.enabled = False
+        self._events: deque[tuple[float, str, dict[str, Any]]] = deque(
+            maxlen=capacity
+        )
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def capacity(self) -> int:
+        return self._events.maxlen
+
+    def enable(self, capacity: int | None = None):
+        if capacity is not None and capacity != self._events.maxlen:
+            self._events = deque(self._events, maxlen=capacity)
+        self.enabled = True
+
+    def disable(self):
+        """Stop capturing, the events so far are kept"""
+        self.enabled = False
+
+    def clear(self):
+        self._events.clear()
+
+    def event(self, kind: str, **fields: Any):
+        self._events.append((time.time(), kind, fields))
+
+    def events(self, kind: str | None = None) -> list[dict[str, Any]]:
+        """Captured events, oldest first"""
+        return [
+            {"time": timestamp, "kind": event_kind, **fields}
+            for timestamp, event_kind, fields in self._events
+            if kind is None or event_kind == kind
+        ]
+
+    def dump(self, path: str):
+        """Write the buffer as JSON lines"""
+        with open(path, "w") as f:
+            for event in self.events():
+                f.write(json.dumps(event, default=str) + "\n")
+        LOGGER.info("Dumped %d trace events to %s", len(self._events), path)
+
+
+# Shared by the whole library, like a logger
+TRACER = EventTracer()
@@ -1,6 +1,7 @@
+from dataclasses import dataclass
 from enum import Enum
 
-from .appliance import Appliance
+from .appliance import ATTR_ONLINE, Appliance, ApplianceSnapshot, AttributeReader
 
 ATTR_CYCLE_STATUS_SENSING = "WashCavity_CycleStatusSensing"
 ATTR_CYCLE_STATUS_FILLING = "WashCavity_CycleStatusFilling"
@@ -80,13 +81,48 @@ MACHINE_STATE_MAP = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class WasherSnapshot(ApplianceSnapshot):
+    machine_state: MachineState | None
+    cycle_status_sensing: bool | None
+    cycle_status_filling: bool | None
+    cycle_status_soaking: bool | None
+    cycle_status_washing: bool | None
+    cycle_status_rinsing: bool | None
+    cycle_status_spinning: bool | None
+    dispense_1_level: int | None
+    door_open: bool | None
+    time_remaining: int | None
+
+
 class Washer(Appliance):
+    def _build_snapshot(self, reader: AttributeReader) -> WasherSnapshot:
+        return WasherSnapshot(
+            online=reader.as_bool(ATTR_ONLINE),
+            machine_state=reader.lookup(ATTR_CYCLE_STATUS_MACHINE_STATE, MACHINE_STATE_MAP),
+            cycle_status_sensing=reader.as_bool(ATTR_CYCLE_STATUS_SENSING),
+            cycle_status_filling=reader.as_bool(ATTR_CYCLE_STATUS_FILLING),
+            cycle_status_soaking=reader.as_bool(ATTR_CYCLE_STATUS_SOAKING),
+            cycle_status_washing=reader.as_bool(ATTR_CYCLE_STATUS_WASHING),
+            cycle_status_rinsing=reader.as_bool(ATTR_CYCLE_STATUS_RINSING),
+            cycle_status_spinning=reader.as_bool(ATTR_CYCLE_STATUS_SPINNING),
+            dispense_1_level=reader.as_int(ATTR_DISPENSE_1_LEVEL),
+            door_open=reader.as_bool(ATTR_DOOR_OPEN),
+            time_remaining=reader.as_int(ATTR_CYCLE_STATUS_TIME_REMAINING),
+        )
+
     def get_machine_state(self) -> MachineState | None:
         state_raw = self._get_attribute(ATTR_CYCLE_STATUS_MACHINE_STATE)
         if state_raw is None:
             return None
         return MACHINE_STATE_MAP.get(state_raw, None)
 
+    def is_active(self) -> bool:
+        return self.get_machine_state() in (
+            MachineState.RunningMainCycle,
+            MachineState.RunningPostCycle,
+        )
+
     def get_cycle_status_sensing(self) -> bool | None:
         return self.attr_value_to_bool(self._get_attribute(ATTR_CYCLE_STATUS_SENSING))
 
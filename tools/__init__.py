@@ -0,0 +1,16 @@
+"""Development tools for the Whirlpool Sixth Sense integration.
+
+The `whirlpool` client library is vendored inside the custom component, so it
+is put on `sys.path` here to let the tools run without Home Assistant.
+"""
+import os
+import sys
+
+LIB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "custom_components",
+    "whirlpool_sixth_sense",
+)
+
+if LIB_PATH not in sys.path:
+    sys.path.insert(0, LIB_PATH)
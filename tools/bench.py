@@ -0,0 +1,426 @@
+"""Micro-benchmarks for the client library hot paths.
+
+    python -m tools.bench -o before.json
+    python -m tools.bench -o after.json
+    python -m tools.bench --compare before.json after.json
+
+Results are written as JSON (nanoseconds per operation). Compare mode prints
+the ratio for every benchmark and exits non-zero when one regressed by more
+than `--threshold`.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from . import LIB_PATH
+from .fakecloud import build_event_message
+from .simulator import OVEN_CAVITY_PREFIXES, SimulatedOven
+
+BENCHMARKS: dict[str, Callable[[], Callable]] = {}
+
+DEFAULT_REPEAT = 7
+MIN_REPEAT_TIME = 0.05
+DEFAULT_THRESHOLD = 0.10
+
+
+def benchmark(name: str):
+    """Register a benchmark factory. The factory returns the callable to time."""
+
+    def decorator(factory: Callable[[], Callable]):
+        BENCHMARKS[name] = factory
+        return factory
+
+    return decorator
+
+
+class NullResponse:
+    status = 200
+
+    async def text(self) -> str:
+        return "{}"
+
+    async def json(self) -> dict:
+        return {}
+
+    async def __aenter__(self) -> NullResponse:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+class NullSession:
+    """Session whose requests complete immediately with an empty 200 reply"""
+
+    def get(self, *args, **kwargs) -> NullResponse:
+        return NullResponse()
+
+    def post(self, *args, **kwargs) -> NullResponse:
+        return NullResponse()
+
+
+def oven_data(cooking: bool = True) -> dict[str, Any]:
+    import random
+
+    sim = SimulatedOven("BENCHOVEN", "Bench Oven", random.Random(0))
+    if cooking:
+        sim.start_cook(OVEN_CAVITY_PREFIXES[0], "6", 1800, 3600)
+        sim.step(120)
+    return json.loads(json.dumps(sim.get_data()))
+
+
+def make_auth(selector, session=None):
+    """Auth with an unlimited rate limiter, so benchmarks are never throttled"""
+    from whirlpool.auth import Auth
+    from whirlpool.ratelimit import RateLimiter
+
+    limiter = RateLimiter(rate=1e9, burst=10**9)
+    return Auth(selector, "", "", session, limiter=limiter)
+
+
+def make_oven(module=None, cooking: bool = True):
+    """Build an Oven with realistic data from the given oven module"""
+    if module is None:
+        from whirlpool import oven as module
+    from whirlpool.backendselector import BackendSelector
+    from whirlpool.types import ApplianceInfo, Brand, Region
+
+    selector = BackendSelector(Brand.Whirlpool, Region.EU)
+    info = ApplianceInfo(
+        "BENCHOVEN", "Bench Oven", "cooking_vsi", "Cooking", "BENCH", "BENCH"
+    )
+    oven = module.Oven(selector, make_auth(selector), NullSession(), info)
+    oven._data_dict = oven_data(cooking)
+    return oven
+
+
+@benchmark("appliance_get_attribute")
+def bench_get_attribute():
+    oven = make_oven()
+    return lambda: oven._get_attribute("OvenUpperCavity_OpStatusState")
+
+
+@benchmark("appliance_get_int_attribute")
+def bench_get_int_attribute():
+    oven = make_oven()
+    return lambda: oven._get_int_attribute("OvenUpperCavity_OpStatusRawTemp")
+
+
+@benchmark("appliance_set_attribute")
+def bench_set_attribute():
+    oven = make_oven()
+    return lambda: oven._set_attribute(
+        "OvenUpperCavity_OpStatusRawTemp", "1810", 1700000000000
+    )
+
+
+@benchmark("oven_get_cook_time")
+def bench_get_cook_time():
+    oven = make_oven()
+    return oven.get_cook_time
+
+
+@benchmark("oven_get_cavity_state")
+def bench_get_cavity_state():
+    oven = make_oven()
+    return oven.get_cavity_state
+
+
+@benchmark("oven_get_cook_mode")
+def bench_get_cook_mode():
+    oven = make_oven()
+    return oven.get_cook_mode
+
+
+@benchmark("oven_snapshot_build")
+def bench_snapshot_build():
+    oven = make_oven()
+
+    def run():
+        # Rebuilt every time, as after an attribute change
+        oven._snapshot = None
+        return oven.snapshot()
+
+    return run
+
+
+@benchmark("update_attributes_fanout_10")
+def bench_update_attributes():
+    oven = make_oven()
+    state = {"calls": 0}
+
+    def callback():
+        state["calls"] += 1
+
+    for _ in range(10):
+        oven.register_attr_callback(callback)
+    attrs = {"OvenUpperCavity_OpStatusRawTemp": "1810"}
+    return lambda: oven.update_attributes(attrs, 1700000000000)
+
+
+@benchmark("event_socket_callback_100")
+def bench_event_socket_callback():
+    from whirlpool.appliancesmanager import AppliancesManager
+    from whirlpool.backendselector import BackendSelector
+    from whirlpool.types import Brand, Region
+
+    selector = BackendSelector(Brand.Whirlpool, Region.EU)
+    session = NullSession()
+    manager = AppliancesManager(selector, make_auth(selector, session), session)
+    data = oven_data()
+    for i in range(100):
+        manager._add_appliance(
+            {
+                "SAID": f"BENCHOVEN{i:03d}",
+                "APPLIANCE_NAME": f"Oven {i}",
+                "DATA_MODEL_KEY": "cooking_vsi",
+                "CATEGORY_NAME": "Cooking",
+            }
+        )
+    for appliance in manager.all_appliances.values():
+        appliance._data_dict = json.loads(json.dumps(data))
+    msg = build_event_message(
+        "BENCHOVEN050",
+        {"OvenUpperCavity_OpStatusRawTemp": "1810", "OvenUpperCavity_OpStatusState": "2"},
+        1700000000000,
+    )
+    return lambda: manager._event_socket_callback(msg)
+
+
+@benchmark("send_attributes_set_cook")
+def bench_send_attributes():
+    from whirlpool.oven import CookMode
+
+    oven = make_oven()
+
+    async def run():
+        await oven.set_cook(180, CookMode.ConvectBake, cook_time=3600)
+
+    return run
+
+
+@benchmark("eta_estimator_sample")
+def bench_eta_estimator():
+    from whirlpool.eta import EtaEstimator
+
+    estimator = EtaEstimator()
+    state = {"t": 0.0}
+
+    def run():
+        state["t"] += 5
+        estimator.add(250 + state["t"], state["t"])
+        estimator.update(2000, state["t"])
+
+    return run
+
+
+def cold_import(*modules: str) -> Callable:
+    """Import `modules` afresh, dependencies outside the library stay loaded"""
+    import importlib
+
+    def run():
+        for name in [m for m in sys.modules if m == "whirlpool" or m.startswith("whirlpool.")]:
+            del sys.modules[name]
+        for module in modules:
+            importlib.import_module(module)
+
+    return run
+
+
+@benchmark("import_appliancesmanager")
+def bench_import_manager():
+    return cold_import("whirlpool.appliancesmanager")
+
+
+@benchmark("import_appliancesmanager_oven")
+def bench_import_manager_oven():
+    # What an oven-only install loads at startup
+    return cold_import("whirlpool.appliancesmanager", "whirlpool.oven")
+
+
+def entity_benchmarks() -> None:
+    """Register entity benchmarks when Home Assistant is importable"""
+    try:
+        from custom_components.whirlpool_sixth_sense import climate, coordinator, sensor
+        from custom_components.whirlpool_sixth_sense.whirlpool import oven as oven_module
+    except ImportError:
+        return
+
+    def make_coordinator():
+        oven = make_oven(oven_module)
+        oven._notify_attr_changed()
+        return coordinator.OvenCoordinator(oven)
+
+    def make_climate():
+        return climate.WhirlpoolOven(
+            make_coordinator(), oven_module.Cavity.Upper, "Upper"
+        )
+
+    @benchmark("entity_climate_preset_mode")
+    def bench_preset_mode():
+        entity = make_climate()
+        entity._current_preset_name = climate.PRESET_CONVECT_BAKE
+        return lambda: entity.preset_mode
+
+    @benchmark("entity_climate_hvac_mode")
+    def bench_hvac_mode():
+        entity = make_climate()
+        entity._current_preset_name = climate.PRESET_CONVECT_BAKE
+        return lambda: entity.hvac_mode
+
+    @benchmark("entity_cook_end_sensor_native_value")
+    def bench_cook_end_sensor():
+        entity = sensor.WhirlpoolOvenEtaSensor(
+            make_coordinator(),
+            oven_module.Cavity.Upper,
+            "Upper",
+            *sensor.ETA_SENSORS[0],
+        )
+        return lambda: entity.native_value
+
+    @benchmark("coordinator_update_no_change")
+    def bench_coordinator_update():
+        oven_coordinator = make_coordinator()
+        return oven_coordinator._handle_oven_update
+
+
+def time_callable(fn: Callable, repeat: int) -> dict[str, Any]:
+    if inspect.iscoroutinefunction(fn):
+        loop = asyncio.new_event_loop()
+
+        async def run_async(n: int):
+            for _ in range(n):
+                await fn()
+
+        def run(n: int):
+            loop.run_until_complete(run_async(n))
+
+    else:
+        loop = None
+
+        def run(n: int):
+            for _ in range(n):
+                fn()
+
+    try:
+        loops = 1
+        while True:
+            start = time.perf_counter()
+            run(loops)
+            if time.perf_counter() - start >= MIN_REPEAT_TIME:
+                break
+            loops *= 2
+
+        samples = []
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter_ns()
+                run(loops)
+                samples.append((time.perf_counter_ns() - start) / loops)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    finally:
+        if loop is not None:
+            loop.close()
+
+    return {
+        "ns_per_op": min(samples),
+        "median_ns": statistics.median(samples),
+        "stdev_ns": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=LIB_PATH,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(selected: list[str] | None, repeat: int) -> dict[str, Any]:
+    entity_benchmarks()
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        if selected and not any(s in name for s in selected):
+            continue
+        results[name] = time_callable(factory(), repeat)
+        print(f"{name:40s} {results[name]['ns_per_op']:12.1f} ns/op")
+    return {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "revision": git_revision(),
+        },
+        "results": results,
+    }
+
+
+def compare(old_path: str, new_path: str, threshold: float) -> int:
+    with open(old_path) as f:
+        old = json.load(f)["results"]
+    with open(new_path) as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    print(f"{'benchmark':40s} {'old ns':>12s} {'new ns':>12s} {'ratio':>8s}")
+    for name in sorted(old.keys() | new.keys()):
+        if name not in old or name not in new:
+            print(f"{name:40s} {'(only in ' + ('new' if name in new else 'old') + ')':>34s}")
+            continue
+        old_ns = old[name]["ns_per_op"]
+        new_ns = new[name]["ns_per_op"]
+        ratio = new_ns / old_ns if old_ns else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = "  improved"
+        print(f"{name:40s} {old_ns:12.1f} {new_ns:12.1f} {ratio:8.2f}{flag}")
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("-k", action="append", help="only run matching benchmarks")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(*args.compare, args.threshold))
+
+    report = run_benchmarks(args.k, args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
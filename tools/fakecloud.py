@@ -0,0 +1,406 @@
+"""Local stand-in for the Whirlpool cloud.
+
+Implements the REST endpoints used by `Auth`, `AppliancesManager` and
+`Appliance`, plus the STOMP-over-websocket flow used by `EventSocket`, so the
+whole client stack can run offline against `BackendSelector(..., base_url=...)`.
+
+Run standalone with `python -m tools.fakecloud --port 8080 --ovens 2`.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import time
+import uuid
+from typing import Any
+
+from aiohttp import WSCloseCode, WSMsgType, web
+
+LOGGER = logging.getLogger(__name__)
+
+STOMP_TERMINATOR = "\x00"
+WS_PATH = "/appliance/websocket"
+
+DEFAULT_ACCOUNT_ID = "1000"
+DEFAULT_TOKEN_LIFETIME = 3600
+
+OVEN_DATA_MODEL = "DDM_COOKING_BIO_SELF_CLEAN_TOURMALINE_V2"
+OVEN_ATTRIBUTES = {
+    "Online": "1",
+    "Sys_OperationSetControlLock": "0",
+    "OvenUpperCavity_OpStatusState": "0",
+    "OvenUpperCavity_CycleSetCommonMode": "0",
+    "OvenUpperCavity_CycleSetTargetTemp": "0",
+    "OvenUpperCavity_OpStatusRawTemp": "220",
+    "OvenUpperCavity_DisplStatusDisplayTemp": "0",
+    "OvenUpperCavity_TimeSetCookTimeSet": "0",
+    "OvenUpperCavity_OpStatusCookTimeState": "0",
+    "OvenUpperCavity_DisplaySetLightOn": "0",
+    "OvenUpperCavity_OpStatusDoorOpen": "0",
+    "OvenUpperCavity_OpSetOperations": "0",
+    "OvenLowerCavity_OpStatusState": "4",
+}
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def parse_stomp_frame(data: str) -> tuple[str, dict[str, str]]:
+    """Split a STOMP frame into its command and headers"""
+    lines = data.rstrip("\n" + STOMP_TERMINATOR).split("\n")
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        if not line:
+            break
+        key, _, value = line.partition(":")
+        headers[key] = value
+    return lines[0], headers
+
+
+def build_stomp_frame(command: str, headers: dict[str, str], body: str = "") -> str:
+    header_lines = "".join(f"{k}:{v}\n" for k, v in headers.items())
+    return f"{command}\n{header_lines}\n{body}{STOMP_TERMINATOR}"
+
+
+def build_event_message(said: str, attrs: dict[str, str], timestamp: int) -> str:
+    """Event body in the format delivered to `AppliancesManager`"""
+    return json.dumps({"said": said, "attributeMap": attrs, "timestamp": timestamp})
+
+
+class FakeAppliance:
+    """Appliance state held by the stand-in cloud"""
+
+    def __init__(
+        self,
+        said: str,
+        name: str,
+        data_model: str,
+        category: str = "Cooking",
+        attributes: dict[str, str] | None = None,
+    ):
+        self.said = said
+        self.name = name
+        self.data_model = data_model
+        self.category = category
+        # Anything with a `publish(said, attrs, timestamp)` method
+        self.cloud: Any = None
+        self._attributes: dict[str, dict[str, Any]] = {}
+        for key, value in (attributes or {}).items():
+            self._attributes[key] = {"value": value, "updateTime": now_ms()}
+
+    @property
+    def inventory_entry(self) -> dict[str, str]:
+        return {
+            "SAID": self.said,
+            "APPLIANCE_NAME": self.name,
+            "DATA_MODEL_KEY": self.data_model,
+            "CATEGORY_NAME": self.category,
+            "MODEL_NO": "FAKE-" + self.said,
+            "SERIAL": self.said,
+        }
+
+    def get_data(self) -> dict[str, Any]:
+        return {"said": self.said, "attributes": self._attributes}
+
+    def get(self, attribute: str) -> str | None:
+        entry = self._attributes.get(attribute)
+        return None if entry is None else entry["value"]
+
+    def update(self, attrs: dict[str, str]) -> dict[str, str]:
+        """Store attributes and publish the ones that changed"""
+        ts = now_ms()
+        changed: dict[str, str] = {}
+        for key, value in attrs.items():
+            entry = self._attributes.get(key)
+            if entry is not None and entry["value"] == value:
+                continue
+            self._attributes[key] = {"value": value, "updateTime": ts}
+            changed[key] = value
+        if changed and self.cloud is not None:
+            self.cloud.publish(self.said, changed, ts)
+        return changed
+
+    def handle_command(self, attrs: dict[str, str]) -> None:
+        """React to a setAttributes command. Echoes the values by default."""
+        self.update(attrs)
+
+
+class FakeCloud:
+    """In-process aiohttp server standing in for the Whirlpool cloud"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        account_id: str = DEFAULT_ACCOUNT_ID,
+    ):
+        self._host = host
+        self._port = port
+        self.latency = latency
+        self.account_id = account_id
+        # When set, the oauth endpoint answers with this status (e.g. 401, 423)
+        self.auth_status: int | None = None
+        # Number of upcoming authenticated requests to reject with 401
+        self.unauthorized_count = 0
+        self.token_lifetime = DEFAULT_TOKEN_LIFETIME
+
+        self.appliances: dict[str, FakeAppliance] = {}
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "auth": 0,
+            "unauthorized": 0,
+            "commands": 0,
+            "ws_connections": 0,
+            "messages_sent": 0,
+        }
+        self._tokens: set[str] = set()
+        self._subscribers: dict[str, dict[web.WebSocketResponse, str]] = {}
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._message_ids = itertools.count(1)
+        self._runner: web.AppRunner | None = None
+        self._base_url: str | None = None
+
+    async def __aenter__(self) -> FakeCloud:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    @property
+    def base_url(self) -> str:
+        if self._base_url is None:
+            raise RuntimeError("Server not started")
+        return self._base_url
+
+    @property
+    def ws_url(self) -> str:
+        return self.base_url.replace("http", "ws", 1) + WS_PATH
+
+    def add_appliance(self, appliance: FakeAppliance) -> None:
+        appliance.cloud = self
+        self.appliances[appliance.said] = appliance
+
+    def expire_tokens(self) -> None:
+        """Invalidate every issued access token"""
+        self._tokens.clear()
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._latency_middleware])
+        app.router.add_post("/oauth/token", self._handle_oauth)
+        app.router.add_get("/api/v1/getUserDetails", self._handle_user_details)
+        app.router.add_get(
+            "/api/v2/appliance/all/account/{account_id}", self._handle_owned
+        )
+        app.router.add_get("/api/v1/share-accounts/appliances", self._handle_shared)
+        app.router.add_get("/api/v1/client_auth/webSocketUrl", self._handle_ws_url)
+        app.router.add_post("/api/v1/appliance/command", self._handle_command)
+        app.router.add_get("/api/v1/appliance/{said}", self._handle_data)
+        app.router.add_get(WS_PATH, self._handle_websocket)
+        return app
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(self.build_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self._base_url = f"http://{host}:{port}"
+        LOGGER.info("Fake cloud listening on %s", self._base_url)
+
+    async def stop(self) -> None:
+        for ws in list(self._sockets):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def going_away(self) -> None:
+        """Close every event socket with the GOING_AWAY status"""
+        for ws in list(self._sockets):
+            await ws.close(code=WSCloseCode.GOING_AWAY, message=b"Going away")
+
+    def publish(
+        self, said: str, attrs: dict[str, str], timestamp: int | None = None
+    ) -> None:
+        """Push an attributeMap frame to every subscriber of `said`"""
+        subscribers = self._subscribers.get(said)
+        if not subscribers:
+            return
+        body = build_event_message(
+            said, attrs, timestamp if timestamp is not None else now_ms()
+        )
+        for ws, sub_id in list(subscribers.items()):
+            frame = build_stomp_frame(
+                "MESSAGE",
+                {
+                    "destination": f"/topic/{said}",
+                    "subscription": sub_id,
+                    "message-id": str(next(self._message_ids)),
+                    "content-type": "application/json",
+                },
+                body,
+            )
+            asyncio.ensure_future(self._send_frame(ws, frame))
+
+    async def _send_frame(self, ws: web.WebSocketResponse, frame: str) -> None:
+        if ws.closed:
+            return
+        try:
+            await ws.send_str(frame)
+            self.stats["messages_sent"] += 1
+        except ConnectionResetError:
+            LOGGER.debug("Subscriber went away while sending")
+
+    @web.middleware
+    async def _latency_middleware(self, request: web.Request, handler):
+        self.stats["requests"] += 1
+        if self.latency > 0 and request.path != WS_PATH:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    def _is_authorized(self, token: str | None) -> bool:
+        if self.unauthorized_count > 0:
+            self.unauthorized_count -= 1
+            self.stats["unauthorized"] += 1
+            return False
+        if token not in self._tokens:
+            self.stats["unauthorized"] += 1
+            return False
+        return True
+
+    def _check_auth(self, request: web.Request) -> None:
+        header = request.headers.get("Authorization", "")
+        token = header[len("Bearer ") :] if header.startswith("Bearer ") else None
+        if not self._is_authorized(token):
+            raise web.HTTPUnauthorized()
+
+    async def _handle_oauth(self, request: web.Request) -> web.Response:
+        self.stats["auth"] += 1
+        if self.auth_status is not None:
+            return web.Response(status=self.auth_status)
+        form = await request.post()
+        if form.get("grant_type") not in ("password", "refresh_token"):
+            return web.Response(status=400)
+        token = uuid.uuid4().hex
+        self._tokens.add(token)
+        return web.json_response(
+            {
+                "access_token": token,
+                "refresh_token": uuid.uuid4().hex,
+                "expires_in": self.token_lifetime,
+                "accountId": self.account_id,
+                "SAID": list(self.appliances),
+            }
+        )
+
+    async def _handle_user_details(self, request: web.Request) -> web.Response:
+        self._check_auth(request)
+        return web.json_response({"accountId": self.account_id})
+
+    async def _handle_owned(self, request: web.Request) -> web.Response:
+        self._check_auth(request)
+        if request.match_info["account_id"] != str(self.account_id):
+            return web.Response(status=404)
+        entries = [a.inventory_entry for a in self.appliances.values()]
+        return web.json_response({str(self.account_id): {"location": entries}})
+
+    async def _handle_shared(self, request: web.Request) -> web.Response:
+        self._check_auth(request)
+        return web.json_response({"sharedAppliances": []})
+
+    async def _handle_ws_url(self, request: web.Request) -> web.Response:
+        self._check_auth(request)
+        return web.json_response({"url": self.ws_url})
+
+    async def _handle_data(self, request: web.Request) -> web.Response:
+        self._check_auth(request)
+        appliance = self.appliances.get(request.match_info["said"])
+        if appliance is None:
+            return web.Response(status=404)
+        return web.json_response(appliance.get_data())
+
+    async def _handle_command(self, request: web.Request) -> web.Response:
+        self._check_auth(request)
+        cmd = await request.json()
+        header = cmd.get("header", {})
+        appliance = self.appliances.get(header.get("said"))
+        if appliance is None or header.get("command") != "setAttributes":
+            return web.Response(status=400)
+        self.stats["commands"] += 1
+        appliance.handle_command(
+            {k: str(v) for k, v in cmd.get("body", {}).items()}
+        )
+        return web.json_response({"status": "ok"})
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(autoping=True)
+        await ws.prepare(request)
+        self.stats["ws_connections"] += 1
+        self._sockets.add(ws)
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                command, headers = parse_stomp_frame(msg.data)
+                if command == "CONNECT":
+                    if not self._is_authorized(headers.get("wcloudtoken")):
+                        await ws.send_str(
+                            build_stomp_frame("ERROR", {"message": "Token Invalid"})
+                        )
+                        continue
+                    await ws.send_str(
+                        build_stomp_frame(
+                            "CONNECTED", {"version": "1.2", "heart-beat": "0,0"}
+                        )
+                    )
+                elif command == "SUBSCRIBE":
+                    said = headers.get("destination", "").rpartition("/")[2]
+                    sub_id = headers.get("id", "")
+                    self._subscribers.setdefault(said, {})[ws] = sub_id
+                    await ws.send_str(build_stomp_frame("RECEIPT", {"receipt-id": sub_id}))
+                elif command == "DISCONNECT":
+                    await ws.close()
+        finally:
+            self._sockets.discard(ws)
+            for subscribers in self._subscribers.values():
+                subscribers.pop(ws, None)
+        return ws
+
+
+def make_oven(index: int) -> FakeAppliance:
+    said = f"FAKEOVEN{index:05d}"
+    return FakeAppliance(
+        said, f"Oven {index}", OVEN_DATA_MODEL, attributes=OVEN_ATTRIBUTES
+    )
+
+
+async def serve(args: argparse.Namespace) -> None:
+    cloud = FakeCloud(args.host, args.port, latency=args.latency)
+    for i in range(args.ovens):
+        cloud.add_appliance(make_oven(i))
+    async with cloud:
+        print(f"Fake Whirlpool cloud on {cloud.base_url}")
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--ovens", type=int, default=1)
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Fleet-scale end-to-end load test for `AppliancesManager`.
+
+Drives the real `Auth`, `AppliancesManager` and `EventSocket` against the
+in-process stand-in cloud and simulator, for each requested fleet size:
+
+    python -m tools.loadtest --sizes 10 100 1000 --duration 30 -o load.json
+
+Reports startup time (auth, inventory, initial fetch, socket up and resync),
+sustained events per second, p50/p99 end-to-end update latency (publish on
+the server to attribute callbacks done on the client), peak RSS and
+event-loop lag. Each size runs in its own process so peak RSS is per size.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections import deque
+from typing import Any
+
+import aiohttp
+
+from .fakecloud import FakeCloud
+from .simulator import Simulator
+
+LAG_INTERVAL = 0.05
+
+
+def percentile(samples: list[float], pct: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a periodic sleeper"""
+
+    def __init__(self, interval: float = LAG_INTERVAL):
+        self._interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            self.samples.append(time.perf_counter() - start - self._interval)
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+async def run_fleet(size: int, duration: float, time_scale: float) -> dict[str, Any]:
+    from whirlpool.appliancesmanager import AppliancesManager
+    from whirlpool.auth import Auth
+    from whirlpool.backendselector import BackendSelector
+    from whirlpool.ratelimit import RateLimiter
+    from whirlpool.types import Brand, Region
+
+    cloud = FakeCloud()
+    simulator = Simulator(cloud, seed=size, time_scale=time_scale)
+    ovens = max(1, size * 8 // 10)
+    simulator.add_ovens(ovens)
+    simulator.add_washers((size - ovens) // 2)
+    simulator.add_dryers(size - ovens - (size - ovens) // 2)
+    simulator.start_random_cooks(0.6)
+
+    # Publish time per SAID, consumed in order as the client sees the events
+    in_flight: dict[str, deque[float]] = {}
+    latencies: list[float] = []
+    cloud_publish = cloud.publish
+
+    def publish(said: str, attrs: dict[str, str], timestamp: int | None = None):
+        if said in cloud._subscribers:
+            in_flight.setdefault(said, deque()).append(time.perf_counter())
+        cloud_publish(said, attrs, timestamp)
+
+    cloud.publish = publish  # type: ignore[method-assign]
+
+    lag = LoopLagMonitor()
+    result: dict[str, Any] = {"size": size}
+    async with cloud, aiohttp.ClientSession() as session:
+        lag.start()
+        selector = BackendSelector(Brand.Whirlpool, Region.EU, base_url=cloud.base_url)
+        # The stand-in cloud has no rate limit, measure the client alone
+        unlimited = RateLimiter(rate=1e9, burst=10**9)
+        auth = Auth(selector, "load@test", "password", session, limiter=unlimited)
+        manager = AppliancesManager(selector, auth, session)
+
+        events = 0
+        manager_callback = manager._event_socket_callback
+
+        def event_callback(msg: str):
+            nonlocal events
+            manager_callback(msg)
+            events += 1
+            pending = in_flight.get(json.loads(msg)["said"])
+            if pending:
+                latencies.append(time.perf_counter() - pending.popleft())
+
+        manager._event_socket_callback = event_callback  # type: ignore[method-assign]
+
+        resynced = asyncio.Event()
+        fetch_all_data = manager.fetch_all_data
+        fetch_calls = 0
+
+        async def counting_fetch_all_data():
+            nonlocal fetch_calls
+            await fetch_all_data()
+            fetch_calls += 1
+            if fetch_calls == 2:
+                resynced.set()
+
+        manager.fetch_all_data = counting_fetch_all_data  # type: ignore[method-assign]
+
+        start = time.perf_counter()
+        await auth.do_auth()
+        t_auth = time.perf_counter()
+        await manager.fetch_appliances()
+        t_inventory = time.perf_counter()
+        await manager.connect()
+        t_connect = time.perf_counter()
+        await resynced.wait()
+        t_resync = time.perf_counter()
+
+        rebuild_start = time.perf_counter()
+        manager.__dict__.pop("all_appliances", None)
+        _ = manager.all_appliances
+        rebuild = time.perf_counter() - rebuild_start
+
+        result["appliances"] = len(manager.all_appliances)
+        result["startup"] = {
+            "auth_s": t_auth - start,
+            "inventory_s": t_inventory - t_auth,
+            "initial_fetch_s": t_connect - t_inventory,
+            "socket_up_and_resync_s": t_resync - t_connect,
+            "total_s": t_resync - start,
+            "all_appliances_rebuild_us": rebuild * 1e6,
+        }
+
+        lag.samples.clear()
+        in_flight.clear()
+        events = 0
+        simulator.start()
+        await asyncio.sleep(duration)
+        await simulator.stop()
+        # Let in-flight frames drain before reading the counters
+        await asyncio.sleep(0.5)
+        result["events"] = events
+        result["events_per_s"] = events / duration
+        result["latency_ms"] = {
+            "p50": (statistics.median(latencies) * 1000) if latencies else None,
+            "p99": (percentile(latencies, 99) or 0) * 1000 if latencies else None,
+            "max": max(latencies) * 1000 if latencies else None,
+        }
+        result["loop_lag_ms"] = {
+            "p50": (statistics.median(lag.samples) * 1000) if lag.samples else None,
+            "p99": (percentile(lag.samples, 99) or 0) * 1000 if lag.samples else None,
+            "max": max(lag.samples) * 1000 if lag.samples else None,
+        }
+
+        await manager.disconnect()
+        await lag.stop()
+
+    # ru_maxrss is in KiB on Linux
+    result["peak_rss_mib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return result
+
+
+def run_isolated(size: int, args: argparse.Namespace) -> dict[str, Any]:
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tools.loadtest",
+            "--single",
+            str(size),
+            "--duration",
+            str(args.duration),
+            "--time-scale",
+            str(args.time_scale),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def print_report(results: list[dict[str, Any]]) -> None:
+    def fmt(value: float | None, spec: str = ".2f") -> str:
+        return "-" if value is None else format(value, spec)
+
+    print(
+        f"{'size':>6s} {'startup s':>10s} {'events/s':>10s} {'p50 ms':>8s}"
+        f" {'p99 ms':>8s} {'lag p99 ms':>11s} {'lag max ms':>11s} {'RSS MiB':>8s}"
+    )
+    for r in results:
+        print(
+            f"{r['size']:6d} {r['startup']['total_s']:10.3f}"
+            f" {r['events_per_s']:10.1f} {fmt(r['latency_ms']['p50'])!s:>8s}"
+            f" {fmt(r['latency_ms']['p99'])!s:>8s}"
+            f" {fmt(r['loop_lag_ms']['p99'])!s:>11s}"
+            f" {fmt(r['loop_lag_ms']['max'])!s:>11s} {r['peak_rss_mib']:8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=10.0,
+        help="simulated seconds per real second, raises the event rate",
+    )
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    if args.single is not None:
+        result = asyncio.run(run_fleet(args.single, args.duration, args.time_scale))
+        print(json.dumps(result))
+        return
+
+    results = [run_isolated(size, args) for size in args.sizes]
+    print_report(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Check that callback registrations do not accumulate across reloads.
+
+    python -m tools.reloadcheck --cycles 200
+
+Each cycle registers what an integration setup registers on an oven:
+attribute and scoped callbacks through their handles, plus attribute waiters
+that time out or resolve. It then removes them as an unload does. When Home
+Assistant is importable, the same is done by creating and shutting down an
+`OvenCoordinator`. After all cycles, every callback registry and the waiter
+index must be empty again and traced memory must not have grown by more than
+`--max-growth` bytes. Exits non-zero otherwise.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+
+from .bench import make_oven
+
+DEFAULT_CYCLES = 200
+DEFAULT_MAX_GROWTH = 64 * 1024
+TEMP_ATTR = "OvenUpperCavity_OpStatusRawTemp"
+
+
+def registrations(oven) -> dict[str, int]:
+    return {
+        "attr_callbacks": len(oven._attr_changed),
+        "scoped_callbacks": sum(len(r) for r in oven._scoped_callbacks.values()),
+        "attr_waiters": sum(len(w) for w in oven._attr_waiters.values()),
+    }
+
+
+async def library_cycle(oven):
+    from whirlpool.oven import Cavity
+
+    handles = [oven.register_attr_callback(lambda: None) for _ in range(5)]
+    handles += [
+        oven.register_scoped_callback(scope, lambda: None)
+        for scope in (Cavity.Upper, Cavity.Lower, None)
+    ]
+    # One waiter times out, the other is resolved by an update
+    await oven.wait_for_attributes({TEMP_ATTR: "-1"}, 0)
+    waiter = asyncio.ensure_future(oven.wait_for_attributes({TEMP_ATTR: "1234"}, 1))
+    await asyncio.sleep(0)
+    oven.update_attributes({TEMP_ATTR: "1234"}, 1900000000000)
+    assert await waiter
+    for remove in handles:
+        remove()
+
+
+def coordinator_cycle_factory() -> Callable | None:
+    """Coordinator reload cycle, None without Home Assistant"""
+    try:
+        from custom_components.whirlpool_sixth_sense import coordinator
+        from custom_components.whirlpool_sixth_sense.whirlpool import oven as module
+    except ImportError:
+        return None
+    oven = make_oven(module)
+
+    async def cycle():
+        coordinator.OvenCoordinator(oven).async_shutdown()
+
+    cycle.oven = oven
+    return cycle
+
+
+async def run_cycles(name: str, oven, cycle, cycles: int, max_growth: int) -> bool:
+    # Warm up caches and lazily created registries before measuring
+    for _ in range(5):
+        await cycle()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(cycles):
+        await cycle()
+    gc.collect()
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    counts = registrations(oven)
+    ok = not any(counts.values()) and growth <= max_growth
+    print(
+        f"{name:<12} {cycles} cycles  growth {growth} B  "
+        + "  ".join(f"{key} {value}" for key, value in counts.items())
+        + ("" if ok else "  FAILED")
+    )
+    return ok
+
+
+async def run(cycles: int, max_growth: int) -> bool:
+    oven = make_oven()
+    ok = await run_cycles(
+        "library", oven, lambda: library_cycle(oven), cycles, max_growth
+    )
+    coordinator_cycle = coordinator_cycle_factory()
+    if coordinator_cycle is None:
+        print("coordinator  skipped, Home Assistant is not importable")
+    else:
+        ok &= await run_cycles(
+            "coordinator",
+            coordinator_cycle.oven,
+            coordinator_cycle,
+            cycles,
+            max_growth,
+        )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES)
+    parser.add_argument("--max-growth", type=int, default=DEFAULT_MAX_GROWTH)
+    args = parser.parse_args()
+    if not asyncio.run(run(args.cycles, args.max_growth)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
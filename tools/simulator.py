@@ -0,0 +1,514 @@
+"""Appliance behaviour simulator.
+
+Models ovens, washers and dryers closely enough to produce realistic
+`attributeMap` event streams: oven cavities go standby -> preheating ->
+cooking while the raw temperature ramps towards `CycleSetTargetTemp`, the cook
+time counts down, doors open and meat probes get plugged in; washers and
+dryers step through their `Cavity_CycleStatusMachineState` phases.
+
+All appliances are driven by a single `Simulator.step`, so thousands of SAIDs
+fit in one process. Run with a stand-in cloud via
+`python -m tools.simulator --ovens 100 --washers 10 --dryers 10`.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from .fakecloud import FakeAppliance, FakeCloud, build_event_message
+
+LOGGER = logging.getLogger(__name__)
+
+AMBIENT_TEMP = 220  # tenths of a degree Celsius
+
+OVEN_DATA_MODEL = "DDM_COOKING_BIO_SELF_CLEAN_TOURMALINE_V2"
+WASHER_DATA_MODEL = "DDM_LAUNDRY_WASHER_V1"
+DRYER_DATA_MODEL = "DDM_LAUNDRY_DRYER_V1"
+
+OVEN_CAVITY_PREFIXES = ("OvenUpperCavity_", "OvenLowerCavity_")
+
+OVEN_STATE_STANDBY = "0"
+OVEN_STATE_PREHEATING = "1"
+OVEN_STATE_COOKING = "2"
+OVEN_STATE_NOT_PRESENT = "4"
+
+OVEN_OPERATION_CANCEL = "1"
+OVEN_OPERATION_START = "2"
+OVEN_OPERATION_MODIFY = "4"
+
+COOK_TIME_STATE_IDLE = "0"
+COOK_TIME_STATE_RUNNING = "1"
+COOK_TIME_STATE_COMPLETED = "3"
+
+MACHINE_STATE_STANDBY = "0"
+MACHINE_STATE_RUNNING_MAIN_CYCLE = "7"
+MACHINE_STATE_RUNNING_POST_CYCLE = "8"
+MACHINE_STATE_COMPLETE = "10"
+
+ATTR_MACHINE_STATE = "Cavity_CycleStatusMachineState"
+ATTR_TIME_REMAINING = "Cavity_TimeStatusEstTimeRemaining"
+ATTR_DOOR_OPEN = "Cavity_OpStatusDoorOpen"
+
+# Phases as (status flag attribute, duration in seconds, machine state)
+WASHER_PHASES = [
+    ("WashCavity_CycleStatusSensing", 60, MACHINE_STATE_RUNNING_MAIN_CYCLE),
+    ("WashCavity_CycleStatusFilling", 180, MACHINE_STATE_RUNNING_MAIN_CYCLE),
+    ("WashCavity_CycleStatusSoaking", 300, MACHINE_STATE_RUNNING_MAIN_CYCLE),
+    ("WashCavity_CycleStatusWashing", 1200, MACHINE_STATE_RUNNING_MAIN_CYCLE),
+    ("WashCavity_CycleStatusRinsing", 600, MACHINE_STATE_RUNNING_MAIN_CYCLE),
+    ("WashCavity_CycleStatusSpinning", 420, MACHINE_STATE_RUNNING_POST_CYCLE),
+]
+DRYER_PHASES = [
+    ("DryCavity_CycleStatusSensing", 120, MACHINE_STATE_RUNNING_MAIN_CYCLE),
+    ("DryCavity_CycleStatusWet", 900, MACHINE_STATE_RUNNING_MAIN_CYCLE),
+    ("DryCavity_CycleStatusDrying", 1800, MACHINE_STATE_RUNNING_MAIN_CYCLE),
+    ("DryCavity_CycleStatusDamp", 600, MACHINE_STATE_RUNNING_MAIN_CYCLE),
+    ("DryCavity_CycleStatusCoolDown", 300, MACHINE_STATE_RUNNING_POST_CYCLE),
+]
+
+# Remaining-time attributes are only re-reported at this granularity
+TIME_REPORT_INTERVAL = 60
+COMPLETE_HOLD_TIME = 120
+
+
+class SimulatedAppliance(FakeAppliance, ABC):
+    """Fake appliance whose attributes evolve over simulated time"""
+
+    def __init__(self, *args, rng: random.Random, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rng = rng
+
+    @abstractmethod
+    def step(self, dt: float) -> None:
+        """Advance the model by `dt` simulated seconds"""
+
+
+class OvenCavityModel:
+    def __init__(self, prefix: str, present: bool = True):
+        self.prefix = prefix
+        self.present = present
+        self.state = OVEN_STATE_STANDBY if present else OVEN_STATE_NOT_PRESENT
+        self.mode = "0"
+        self.temp = float(AMBIENT_TEMP)
+        self.target = 0
+        self.cook_time = 0.0
+        self.cook_time_state = COOK_TIME_STATE_IDLE
+        self.reported_cook_time = 0
+        self.reported_temp = AMBIENT_TEMP
+        self.light = "0"
+        self.door_open_for = 0.0
+        self.probe_plugged = False
+        self.probe_temp = float(AMBIENT_TEMP)
+        self.reported_probe_temp = AMBIENT_TEMP
+        self.probe_target = 0
+
+    def attributes(self) -> dict[str, str]:
+        p = self.prefix
+        if not self.present:
+            return {p + "OpStatusState": OVEN_STATE_NOT_PRESENT}
+        return {
+            p + "OpStatusState": self.state,
+            p + "CycleSetCommonMode": self.mode,
+            p + "CycleSetTargetTemp": str(self.target),
+            p + "OpStatusRawTemp": str(self.reported_temp),
+            p + "DisplStatusDisplayTemp": str(self.target),
+            p + "TimeSetCookTimeSet": str(self.reported_cook_time),
+            p + "OpStatusCookTimeState": self.cook_time_state,
+            p + "DisplaySetLightOn": self.light,
+            p + "OpStatusDoorOpen": "1" if self.door_open_for > 0 else "0",
+            p + "AlertStatusMeatProbePluggedIn": "1" if self.probe_plugged else "0",
+            p + "CycleSetMeatProbeTargetTemp": str(self.probe_target),
+            p + "OpStatusMeatProbeTemp": str(self.reported_probe_temp),
+            p + "OpSetOperations": "0",
+        }
+
+
+class SimulatedOven(SimulatedAppliance):
+    """Oven with upper (and optionally lower) cavity state machines"""
+
+    def __init__(
+        self,
+        said: str,
+        name: str,
+        rng: random.Random,
+        lower_cavity: bool = False,
+        heat_rate: float = 4.0,
+        cool_rate: float = 1.0,
+        door_probability: float = 0.0005,
+    ):
+        self.cavities = {
+            OVEN_CAVITY_PREFIXES[0]: OvenCavityModel(OVEN_CAVITY_PREFIXES[0]),
+            OVEN_CAVITY_PREFIXES[1]: OvenCavityModel(
+                OVEN_CAVITY_PREFIXES[1], lower_cavity
+            ),
+        }
+        attributes = {"Online": "1", "Sys_OperationSetControlLock": "0"}
+        for cavity in self.cavities.values():
+            attributes.update(cavity.attributes())
+        super().__init__(said, name, OVEN_DATA_MODEL, attributes=attributes, rng=rng)
+        # Rates in tenths of a degree per second
+        self.heat_rate = heat_rate
+        self.cool_rate = cool_rate
+        self.door_probability = door_probability
+
+    def start_cook(self, prefix: str, mode: str, target: int, cook_time: int = 0):
+        self.handle_command(
+            {
+                prefix + "CycleSetCommonMode": mode,
+                prefix + "CycleSetTargetTemp": str(target),
+                prefix + "TimeSetCookTimeSet": str(cook_time),
+                prefix + "OpSetOperations": OVEN_OPERATION_START,
+            }
+        )
+
+    def handle_command(self, attrs: dict[str, str]) -> None:
+        echo: dict[str, str] = {}
+        for prefix, cavity in self.cavities.items():
+            cavity_attrs = {
+                k[len(prefix) :]: v for k, v in attrs.items() if k.startswith(prefix)
+            }
+            if not cavity_attrs or not cavity.present:
+                continue
+            self._apply_cavity_command(cavity, cavity_attrs, echo)
+        for key, value in attrs.items():
+            if not key.startswith(OVEN_CAVITY_PREFIXES):
+                echo[key] = value
+        self.update(echo)
+
+    def _apply_cavity_command(
+        self, cavity: OvenCavityModel, attrs: dict[str, str], echo: dict[str, str]
+    ) -> None:
+        operation = attrs.get("OpSetOperations")
+        if "DisplaySetLightOn" in attrs:
+            cavity.light = attrs["DisplaySetLightOn"]
+        if "CycleSetMeatProbeTargetTemp" in attrs:
+            cavity.probe_target = int(attrs["CycleSetMeatProbeTargetTemp"])
+
+        if operation == OVEN_OPERATION_CANCEL:
+            cavity.state = OVEN_STATE_STANDBY
+            cavity.mode = "0"
+            cavity.target = 0
+            cavity.cook_time = 0
+            cavity.cook_time_state = COOK_TIME_STATE_IDLE
+        elif operation in (OVEN_OPERATION_START, OVEN_OPERATION_MODIFY):
+            if "CycleSetCommonMode" in attrs:
+                cavity.mode = attrs["CycleSetCommonMode"]
+            elif "CulinaryCtrSetId" in attrs or "CycleSetFrozenBakeFood" in attrs:
+                cavity.mode = "2"
+            if "CycleSetTargetTemp" in attrs:
+                cavity.target = int(attrs["CycleSetTargetTemp"])
+            if operation == OVEN_OPERATION_START or cavity.state == OVEN_STATE_STANDBY:
+                cavity.state = (
+                    OVEN_STATE_PREHEATING
+                    if cavity.temp < cavity.target
+                    else OVEN_STATE_COOKING
+                )
+            if "TimeSetCookTimeSet" in attrs:
+                cavity.cook_time = int(attrs["TimeSetCookTimeSet"])
+                cavity.cook_time_state = (
+                    COOK_TIME_STATE_RUNNING
+                    if cavity.cook_time > 0
+                    else COOK_TIME_STATE_IDLE
+                )
+        elif "TimeSetCookTimeSet" in attrs:
+            cavity.cook_time = int(attrs["TimeSetCookTimeSet"])
+
+        cavity.reported_cook_time = int(cavity.cook_time)
+        echo.update(cavity.attributes())
+
+    def step(self, dt: float) -> None:
+        changes: dict[str, str] = {}
+        for cavity in self.cavities.values():
+            if cavity.present:
+                self._step_cavity(cavity, dt)
+                changes.update(cavity.attributes())
+        self.update(changes)
+
+    def _step_cavity(self, cavity: OvenCavityModel, dt: float) -> None:
+        cooking = cavity.state in (OVEN_STATE_PREHEATING, OVEN_STATE_COOKING)
+        goal = cavity.target if cooking else AMBIENT_TEMP
+        if cavity.temp < goal:
+            rate = self.heat_rate if cooking else self.cool_rate
+            cavity.temp = min(goal, cavity.temp + rate * dt)
+        elif cavity.temp > goal:
+            cavity.temp = max(goal, cavity.temp - self.cool_rate * dt)
+        # Thermostat drift around the target once reached
+        if cooking and cavity.temp >= cavity.target - 20:
+            cavity.temp += self._rng.uniform(-3, 3) * dt
+            cavity.temp = min(cavity.target + 30, max(cavity.target - 30, cavity.temp))
+        # Temperatures are reported in whole degrees
+        if abs(cavity.temp - cavity.reported_temp) >= 10:
+            cavity.reported_temp = int(cavity.temp) // 10 * 10
+
+        if cavity.state == OVEN_STATE_PREHEATING and cavity.temp >= cavity.target - 20:
+            cavity.state = OVEN_STATE_COOKING
+
+        if cavity.state == OVEN_STATE_COOKING and cavity.cook_time > 0:
+            cavity.cook_time = max(0.0, cavity.cook_time - dt)
+            if cavity.cook_time == 0:
+                cavity.state = OVEN_STATE_STANDBY
+                cavity.mode = "0"
+                cavity.target = 0
+                cavity.cook_time_state = COOK_TIME_STATE_COMPLETED
+                cavity.reported_cook_time = 0
+            elif cavity.reported_cook_time - cavity.cook_time >= TIME_REPORT_INTERVAL:
+                cavity.reported_cook_time = int(cavity.cook_time)
+
+        if cavity.door_open_for > 0:
+            cavity.door_open_for = max(0.0, cavity.door_open_for - dt)
+        elif cooking and self._rng.random() < self.door_probability * dt:
+            cavity.door_open_for = self._rng.uniform(3, 20)
+            cavity.temp -= 150
+
+        if cooking and not cavity.probe_plugged and self._rng.random() < 0.001 * dt:
+            cavity.probe_plugged = True
+            cavity.probe_target = cavity.probe_target or 650
+        if cavity.probe_plugged:
+            # The probe follows the cavity temperature with a large time constant
+            cavity.probe_temp += (cavity.temp - cavity.probe_temp) * min(1.0, dt / 1800)
+            if abs(cavity.probe_temp - cavity.reported_probe_temp) >= 10:
+                cavity.reported_probe_temp = int(cavity.probe_temp) // 10 * 10
+            if not cooking and cavity.probe_temp <= AMBIENT_TEMP + 50:
+                cavity.probe_plugged = False
+
+
+class SimulatedLaundry(SimulatedAppliance):
+    """Washer or dryer stepping through its cycle phases"""
+
+    phases: list[tuple[str, int, str]] = []
+
+    def __init__(
+        self,
+        said: str,
+        name: str,
+        data_model: str,
+        rng: random.Random,
+        start_probability: float = 0.0002,
+    ):
+        attributes = {
+            "Online": "1",
+            ATTR_MACHINE_STATE: MACHINE_STATE_STANDBY,
+            ATTR_TIME_REMAINING: "0",
+            ATTR_DOOR_OPEN: "0",
+        }
+        for flag, _, _ in self.phases:
+            attributes[flag] = "0"
+        super().__init__(
+            said, name, data_model, category="Laundry", attributes=attributes, rng=rng
+        )
+        self.start_probability = start_probability
+        self._phase = -1
+        self._phase_left = 0.0
+        self._complete_left = 0.0
+        self._reported_remaining = 0
+
+    @property
+    def running(self) -> bool:
+        return self._phase >= 0
+
+    def start_cycle(self) -> None:
+        self._phase = 0
+        self._phase_left = float(self.phases[0][1])
+        self._reported_remaining = self._remaining()
+        self.update(self._attributes_for_phase())
+
+    def _remaining(self) -> int:
+        later = sum(duration for _, duration, _ in self.phases[self._phase + 1 :])
+        return int(self._phase_left) + later
+
+    def _attributes_for_phase(self) -> dict[str, str]:
+        attrs = {flag: "0" for flag, _, _ in self.phases}
+        flag, _, state = self.phases[self._phase]
+        attrs[flag] = "1"
+        attrs[ATTR_MACHINE_STATE] = state
+        attrs[ATTR_TIME_REMAINING] = str(self._reported_remaining)
+        return attrs
+
+    def handle_command(self, attrs: dict[str, str]) -> None:
+        if attrs.get("Cavity_OpSetOperations") == "2" and not self.running:
+            self.start_cycle()
+            return
+        self.update(attrs)
+
+    def step(self, dt: float) -> None:
+        if self._complete_left > 0:
+            self._complete_left -= dt
+            if self._complete_left <= 0:
+                self.update({ATTR_MACHINE_STATE: MACHINE_STATE_STANDBY})
+            return
+        if not self.running:
+            if self._rng.random() < self.start_probability * dt:
+                self.start_cycle()
+            return
+
+        self._phase_left -= dt
+        while self._phase_left <= 0:
+            self._phase += 1
+            if self._phase >= len(self.phases):
+                self._phase = -1
+                self._complete_left = COMPLETE_HOLD_TIME
+                attrs = {flag: "0" for flag, _, _ in self.phases}
+                attrs[ATTR_MACHINE_STATE] = MACHINE_STATE_COMPLETE
+                attrs[ATTR_TIME_REMAINING] = "0"
+                self.update(attrs)
+                return
+            self._phase_left += self.phases[self._phase][1]
+
+        if self._reported_remaining - self._remaining() >= TIME_REPORT_INTERVAL:
+            self._reported_remaining = self._remaining()
+        self.update(self._attributes_for_phase())
+
+
+class SimulatedWasher(SimulatedLaundry):
+    phases = WASHER_PHASES
+
+    def __init__(self, said: str, name: str, rng: random.Random, **kwargs):
+        super().__init__(said, name, WASHER_DATA_MODEL, rng, **kwargs)
+
+
+class SimulatedDryer(SimulatedLaundry):
+    phases = DRYER_PHASES
+
+    def __init__(self, said: str, name: str, rng: random.Random, **kwargs):
+        super().__init__(said, name, DRYER_DATA_MODEL, rng, **kwargs)
+
+
+class EventSink:
+    """Publisher that hands event bodies straight to a message listener
+
+    Lets the simulator feed e.g. `AppliancesManager._event_socket_callback`
+    without a server in between.
+    """
+
+    def __init__(self, msg_listener: Callable[[str], None]):
+        self._msg_listener = msg_listener
+        self.published = 0
+
+    def publish(self, said: str, attrs: dict[str, str], timestamp: int) -> None:
+        self.published += 1
+        self._msg_listener(build_event_message(said, attrs, timestamp))
+
+
+class Simulator:
+    """Drives every simulated appliance from a single ticker"""
+
+    def __init__(
+        self,
+        publisher=None,
+        seed: int = 0,
+        time_scale: float = 1.0,
+        tick: float = 1.0,
+    ):
+        self._publisher = publisher
+        self._rng = random.Random(seed)
+        self.time_scale = time_scale
+        self.tick = tick
+        self.appliances: dict[str, SimulatedAppliance] = {}
+        self._task: asyncio.Task | None = None
+
+    def add(self, appliance: SimulatedAppliance) -> SimulatedAppliance:
+        if isinstance(self._publisher, FakeCloud):
+            self._publisher.add_appliance(appliance)
+        else:
+            appliance.cloud = self._publisher
+        self.appliances[appliance.said] = appliance
+        return appliance
+
+    def add_ovens(self, count: int, lower_cavity: bool = False) -> None:
+        base = len(self.appliances)
+        for i in range(base, base + count):
+            self.add(
+                SimulatedOven(
+                    f"SIMOVEN{i:06d}", f"Oven {i}", self._rng, lower_cavity=lower_cavity
+                )
+            )
+
+    def add_washers(self, count: int) -> None:
+        base = len(self.appliances)
+        for i in range(base, base + count):
+            self.add(SimulatedWasher(f"SIMWASH{i:06d}", f"Washer {i}", self._rng))
+
+    def add_dryers(self, count: int) -> None:
+        base = len(self.appliances)
+        for i in range(base, base + count):
+            self.add(SimulatedDryer(f"SIMDRY{i:06d}", f"Dryer {i}", self._rng))
+
+    def start_random_cooks(self, fraction: float = 0.5) -> None:
+        """Put a share of the simulated ovens into a cook with a timer"""
+        for appliance in self.appliances.values():
+            if isinstance(appliance, SimulatedOven) and self._rng.random() < fraction:
+                appliance.start_cook(
+                    OVEN_CAVITY_PREFIXES[0],
+                    self._rng.choice(["2", "6", "8", "14", "16"]),
+                    self._rng.randrange(1500, 2500, 50),
+                    self._rng.randrange(600, 7200, 60),
+                )
+
+    def step(self, dt: float | None = None) -> None:
+        dt = self.tick * self.time_scale if dt is None else dt
+        for appliance in self.appliances.values():
+            appliance.step(dt)
+
+    async def _run(self) -> None:
+        next_tick = time.monotonic()
+        while True:
+            next_tick += self.tick
+            self.step()
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+async def serve(args: argparse.Namespace) -> None:
+    cloud = FakeCloud(args.host, args.port, latency=args.latency)
+    simulator = Simulator(cloud, seed=args.seed, time_scale=args.time_scale)
+    simulator.add_ovens(args.ovens, lower_cavity=args.lower_cavity)
+    simulator.add_washers(args.washers)
+    simulator.add_dryers(args.dryers)
+    simulator.start_random_cooks(args.cooking)
+    async with cloud:
+        simulator.start()
+        print(f"Simulating {len(simulator.appliances)} appliances on {cloud.base_url}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await simulator.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--ovens", type=int, default=1)
+    parser.add_argument("--washers", type=int, default=0)
+    parser.add_argument("--dryers", type=int, default=0)
+    parser.add_argument("--lower-cavity", action="store_true")
+    parser.add_argument("--cooking", type=float, default=0.5)
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()